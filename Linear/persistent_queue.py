@@ -0,0 +1,204 @@
+from Linear.persistent_stack import PersistentStack
+
+
+class _Stream:
+    """
+    A lazy, memoized list cell used by PersistentQueue.
+
+    A stream is either already evaluated (cell is None for the empty stream, or a
+    (value, rest_stream) pair) or holds a thunk that computes that cell the first
+    time force() is called. Memoization is what keeps the queue's O(1) bounds
+    valid even when old versions are reused.
+    """
+
+    __slots__ = ("thunk", "cell")
+
+    def __init__(self, cell=None, thunk=None):
+        self.cell = cell
+        self.thunk = thunk
+
+    def force(self):
+        """Evaluates the stream cell once and returns it."""
+        if self.thunk is not None:
+            self.cell = self.thunk()
+            self.thunk = None
+        return self.cell
+
+
+_EMPTY_STREAM = _Stream()
+
+
+def _rotate(front: _Stream, rear: PersistentStack, acc: _Stream) -> _Stream:
+    """
+    Lazily computes front ++ reverse(rear) ++ acc, one cell per force().
+
+    Called only when len(rear) == len(front) + 1.
+    """
+    def thunk():
+        cell = front.force()
+        if cell is None:
+            return (rear.peek(), acc)
+        value, rest = cell
+        return (value, _rotate(rest, rear.pop(), _Stream((rear.peek(), acc))))
+    return _Stream(thunk=thunk)
+
+
+class PersistentQueue:
+    """
+    An immutable (persistent) FIFO queue: Okasaki's real-time queue.
+
+    The queue is a lazy front stream, a rear PersistentStack and a "schedule"
+    pointing into the front stream. Whenever the rear grows longer than the
+    front, the two are combined by a lazy rotation, and every operation forces
+    exactly one more cell of the schedule. The rotation is therefore paid for
+    incrementally, giving O(1) worst-case enqueue, dequeue and peek on every
+    version, including old snapshots.
+
+    Method names match Linear/queue.py, but enqueue and dequeue return the new
+    queue instead of mutating in place; read the front with peek() first.
+    """
+
+    __slots__ = ("front", "rear", "schedule", "size")
+
+    def __init__(self, front: _Stream = _EMPTY_STREAM, rear: PersistentStack = None,
+                 schedule: _Stream = _EMPTY_STREAM, size: int = 0):
+        """
+        Initializes a queue version. Call with no arguments for an empty queue.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self.front = front
+        self.rear = rear if rear is not None else PersistentStack()
+        self.schedule = schedule
+        self.size = size
+
+
+    @staticmethod
+    def _make(front: _Stream, rear: PersistentStack, schedule: _Stream, size: int) -> "PersistentQueue":
+        """
+        Advances the schedule by one cell, rotating once the schedule is exhausted.
+        Invariant: len(schedule) == len(front) - len(rear).
+        """
+        cell = schedule.force()
+        if cell is not None:
+            return PersistentQueue(front, rear, cell[1], size)
+        front = _rotate(front, rear, _EMPTY_STREAM)
+        return PersistentQueue(front, PersistentStack(), front, size)
+
+
+    def enqueue(self, value) -> "PersistentQueue":
+        """
+        Returns a new queue with value at the rear. The original queue is unchanged.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Parameters:
+            value (any): The value to be added to the queue.
+        """
+        return self._make(self.front, self.rear.push(value), self.schedule, self.size + 1)
+
+
+    def dequeue(self) -> "PersistentQueue":
+      """
+        Returns a new queue without the front element. The original queue is unchanged.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Returns:
+            PersistentQueue: The queue after removing the front element.
+
+        Raises:
+            IndexError: If the queue is empty
+      """
+      cell = self.front.force()
+      if cell is None:
+          raise IndexError("Dequeue from empty queue")
+
+      return self._make(cell[1], self.rear, self.schedule, self.size - 1)
+
+
+    def peek(self):
+      """
+        Returns the front element of the queue.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Returns:
+            The value at the front of the queue
+
+        Raises:
+            IndexError: If the queue is empty
+      """
+      cell = self.front.force()
+      if cell is None:
+          raise IndexError("Peek from empty queue")
+
+      return cell[0]
+
+
+    def is_empty(self) -> bool:
+      """
+        Checks whether the queue is empty.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Returns:
+            bool: True if the queue is empty, False otherwise
+      """
+      return self.size == 0
+
+
+    def __len__(self) -> int:
+      """
+        Returns the number of elements in the queue.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+      """
+      return self.size
+
+
+    def __iter__(self):
+      """
+        Yields the elements from front to rear.
+
+        Time Complexity: O(n)
+        Space Complexity: O(len(rear)) for the reversed rear
+      """
+      cell = self.front.force()
+      while cell is not None:
+          yield cell[0]
+          cell = cell[1].force()
+      rear = list(self.rear)
+      rear.reverse()
+      yield from rear
+
+
+    def __str__(self) -> str:
+      """
+        Returns a user-friendly string representation of the queue.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+
+        Example Output:
+            Front → [1, 2, 3] ← Rear
+      """
+      return f"Front → {list(self)} ← Rear"
+
+
+if __name__ == "__main__":
+    q0 = PersistentQueue()
+    q1 = q0.enqueue(1).enqueue(2).enqueue(3)
+    q2 = q1.dequeue()
+    q3 = q2.enqueue(4)
+
+    print(q1)          # Front → [1, 2, 3] ← Rear
+    print(q2)          # Front → [2, 3] ← Rear
+    print(q3)          # Front → [2, 3, 4] ← Rear
+    print(q1.peek())   # 1, old versions stay valid
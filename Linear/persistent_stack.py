@@ -0,0 +1,146 @@
+class Node:
+    __slots__ = ("value", "next")
+
+    def __init__(self, value, next_node=None):
+        """
+        An immutable cons cell shared between PersistentStack versions.
+
+        Parameters:
+            value (any): Data stored in this node.
+            next_node (Node): The rest of the list (older elements).
+        """
+        self.value = value
+        self.next = next_node
+
+
+class PersistentStack:
+    """
+    An immutable (persistent) stack implemented as a singly linked cons list.
+
+    push and pop never modify a stack: they return a new version that shares
+    every untouched node with the old one. Keeping an old version around is
+    therefore an O(1) snapshot instead of an O(n) copy, which makes it a good
+    fit for undo histories.
+
+    Method names match Linear/stack.py, but push and pop return the new stack
+    instead of mutating in place; read the top with peek() before popping.
+    """
+
+    __slots__ = ("head", "size")
+
+    def __init__(self, head: Node = None, size: int = 0):
+        """
+        Initializes a stack version. Call with no arguments for an empty stack.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self.head = head
+        self.size = size
+
+    def push(self, value) -> "PersistentStack":
+        """
+        Returns a new stack with value on top. The original stack is unchanged.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Parameters:
+            value (any): The value to be added to the stack.
+        """
+        return PersistentStack(Node(value, self.head), self.size + 1)
+
+    def pop(self) -> "PersistentStack":
+      """
+        Returns a new stack without the top element. The original stack is unchanged.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Returns:
+            PersistentStack: The stack below the current top.
+
+        Raises:
+            IndexError: If the stack is empty
+      """
+      if self.head is None:
+          raise IndexError("Pop from empty stack")
+
+      return PersistentStack(self.head.next, self.size - 1)
+
+    def peek(self):
+      """
+        Returns the top element of the stack.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Returns:
+            The last pushed element (top of the stack)
+
+        Raises:
+            IndexError: If the stack is empty
+      """
+      if self.head is None:
+          raise IndexError("Peek from empty stack")
+
+      return self.head.value
+
+    def is_empty(self) -> bool:
+      """
+        Checks whether the stack is empty.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Returns:
+            bool: True if stack is empty, False otherwise
+      """
+      return self.head is None
+
+    def __len__(self) -> int:
+      """
+        Returns the number of elements in the stack.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+      """
+      return self.size
+
+    def __iter__(self):
+      """
+        Yields the elements from top to bottom.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+      """
+      current = self.head
+      while current is not None:
+          yield current.value
+          current = current.next
+
+    def __str__(self) -> str:
+      """
+        Returns a user-friendly string representation of the stack.
+
+        Example Output:
+            Bottom → [1, 2, 3] ← Top
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+      """
+      values = list(self)
+      values.reverse()
+      return f"Bottom → {values} ← Top"
+
+
+if __name__ == "__main__":
+    empty = PersistentStack()
+    s1 = empty.push(1).push(2)
+    s2 = s1.push(3)
+    s3 = s2.pop().pop()
+
+    print(s1)   # Bottom → [1, 2] ← Top
+    print(s2)   # Bottom → [1, 2, 3] ← Top
+    print(s3)   # Bottom → [1] ← Top
+    print(s3.head is s1.head.next)  # True, the node is shared
@@ -0,0 +1,515 @@
+import operator
+from array import array
+from typing import Any, Callable, Iterable
+
+from Linear.arrays import MyArray
+
+
+def _as_array(values: Iterable[Any], typecode: str) -> array:
+    """
+    Copies values into a typed array. A MyArray is read straight from its
+    backing list instead of element by element through get().
+    """
+    if isinstance(values, MyArray):
+        values = values.data[:values.count]
+    return array(typecode, values)
+
+
+def _check_index(index: int, n: int) -> None:
+    if not 0 <= index < n:
+        raise IndexError("Index out of bounds")
+
+
+def _check_range(lo: int, hi: int, n: int) -> None:
+    if not 0 <= lo <= hi <= n:
+        raise IndexError("Range out of bounds")
+
+
+class FenwickTree:
+    """
+    Fenwick tree (binary indexed tree) over a typed array: prefix and range
+    sums with point updates and range adds, each in O(log n).
+
+    Cell i (1-based) stores the sum of the i & -i values ending at i, so a
+    prefix sum adds up at most log2(n) cells and a point update touches at
+    most log2(n) cells. Range adds use two more such arrays (allocated on the
+    first range_add()), holding d and d * index, from which
+    prefix_sum(end) = base(end) + end * d(end) - (d * index)(end).
+
+    Ranges are half open, [lo, hi), like Python slices. With an integer
+    typecode a sum that no longer fits raises OverflowError.
+    """
+
+    def __init__(self, values: Iterable[int] = (), typecode: str = "q"):
+        """
+        Builds the tree from the initial values.
+
+        Time Complexity: O(n), each cell is added once into its parent
+        Space Complexity: O(n)
+
+        Parameters:
+            values (iterable | MyArray): Initial values.
+            typecode (str): array typecode, e.g. 'q' (int64) or 'd' (float).
+        """
+        self.typecode = typecode
+        data = _as_array(values, typecode)
+        n = len(data)
+        self.n = n
+        self.tree = array(typecode, [0]) + data  # 1-based
+        tree = self.tree
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._delta = None        # Range adds: d
+        self._delta_index = None  # Range adds: d * index
+
+
+    def __len__(self) -> int:
+        return self.n
+
+
+    @staticmethod
+    def _add(tree: array, n: int, i: int, delta) -> None:
+        """Adds delta at 1-based position i of a Fenwick array."""
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+
+    @staticmethod
+    def _prefix(tree: array, i: int):
+        """Sum of the first i positions of a Fenwick array."""
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+
+    def add(self, index: int, delta) -> None:
+        """
+        Adds delta to the value at index.
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If index is out of bounds.
+        """
+        _check_index(index, self.n)
+        self._add(self.tree, self.n, index + 1, delta)
+
+
+    def range_add(self, lo: int, hi: int, delta) -> None:
+        """
+        Adds delta to every value in [lo, hi).
+
+        Time Complexity: O(log n)
+        Space Complexity: O(n) once, for the range-add arrays
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        _check_range(lo, hi, self.n)
+        if lo == hi:
+            return
+        if self._delta is None:
+            self._delta = array(self.typecode, [0]) * (self.n + 1)
+            self._delta_index = array(self.typecode, [0]) * (self.n + 1)
+        n = self.n
+        self._add(self._delta, n, lo + 1, delta)
+        self._add(self._delta, n, hi + 1, -delta)
+        self._add(self._delta_index, n, lo + 1, delta * lo)
+        self._add(self._delta_index, n, hi + 1, -delta * hi)
+
+
+    def prefix_sum(self, end: int):
+        """
+        Returns the sum of the values in [0, end).
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If end is out of bounds.
+        """
+        _check_range(0, end, self.n)
+        total = self._prefix(self.tree, end)
+        if self._delta is not None:
+            total += end * self._prefix(self._delta, end) - self._prefix(self._delta_index, end)
+        return total
+
+
+    def range_sum(self, lo: int, hi: int):
+        """
+        Returns the sum of the values in [lo, hi).
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        _check_range(lo, hi, self.n)
+        return self.prefix_sum(hi) - self.prefix_sum(lo)
+
+
+    def get(self, index: int):
+        """
+        Returns the value at index.
+
+        Time Complexity: O(log n)
+        """
+        _check_index(index, self.n)
+        return self.range_sum(index, index + 1)
+
+
+    def set(self, index: int, value) -> None:
+        """
+        Replaces the value at index.
+
+        Time Complexity: O(log n)
+        """
+        self.add(index, value - self.get(index))
+
+
+class SegmentTree:
+    """
+    Iterative bottom-up segment tree for any associative operator
+    (sum, min, max, gcd, ...), stored in one typed array of 2n cells.
+
+    Leaves live at n..2n-1 and cell i combines cells 2i and 2i+1, so there is
+    no recursion and no padding to a power of two. A query walks both ends of
+    the range up the tree, combining the left and right parts separately, so
+    the operator does not need to be commutative.
+
+    Ranges are half open, [lo, hi), like Python slices.
+    """
+
+    def __init__(self, values: Iterable[Any], op: Callable[[Any, Any], Any] = operator.add,
+                 identity: Any = 0, typecode: str = "q"):
+        """
+        Builds the tree from the initial values.
+
+        Time Complexity: O(n) calls to op
+        Space Complexity: O(n)
+
+        Parameters:
+            values (iterable | MyArray): Initial values.
+            op (callable): Associative binary operator, op(left, right).
+            identity: Value with op(identity, x) == op(x, identity) == x
+                (0 for sum, float('inf') for min, ...). Returned for empty ranges
+                and never stored, so it does not need to fit the typecode.
+            typecode (str): array typecode, e.g. 'q' (int64) or 'd' (float).
+        """
+        data = _as_array(values, typecode)
+        n = len(data)
+        self.n = n
+        self.op = op
+        self.identity = identity
+        self.tree = array(typecode, [0]) * n + data
+        tree = self.tree
+        for i in range(n - 1, 0, -1):
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+
+
+    def __len__(self) -> int:
+        return self.n
+
+
+    def get(self, index: int):
+        """
+        Returns the value at index.
+
+        Time Complexity: O(1)
+        """
+        _check_index(index, self.n)
+        return self.tree[index + self.n]
+
+
+    def set(self, index: int, value) -> None:
+        """
+        Replaces the value at index and recomputes its ancestors.
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If index is out of bounds.
+        """
+        _check_index(index, self.n)
+        tree, op = self.tree, self.op
+        i = index + self.n
+        tree[i] = value
+        i >>= 1
+        while i:
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+
+    def query(self, lo: int, hi: int):
+        """
+        Returns op over the values in [lo, hi), or identity if the range is empty.
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        _check_range(lo, hi, self.n)
+        tree, op = self.tree, self.op
+        left = right = self.identity
+        lo += self.n
+        hi += self.n
+        while lo < hi:
+            if lo & 1:
+                left = op(left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = op(tree[hi], right)
+            lo >>= 1
+            hi >>= 1
+        return op(left, right)
+
+
+class LazySegmentTree:
+    """
+    Segment tree with lazy propagation: range add and range assign updates
+    and range sum / min / max queries, each in O(log n).
+
+    The tree is padded to a power of two and kept in typed arrays: node
+    aggregates, plus per internal node a pending assignment (flag and value)
+    and a pending addition. An update tags the O(log n) nodes that exactly
+    cover the range; tags are pushed down to the children only when a later
+    operation needs to go below a tagged node. A pending assignment absorbs
+    later additions, so each node holds at most one of each.
+
+    Ranges are half open, [lo, hi), like Python slices.
+    """
+
+    def __init__(self, values: Iterable[Any], mode: str = "sum", typecode: str = "q"):
+        """
+        Builds the tree from the initial values.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+
+        Parameters:
+            values (iterable | MyArray): Initial values.
+            mode (str): Aggregate answered by query(): "sum", "min" or "max".
+            typecode (str): array typecode, e.g. 'q' (int64) or 'd' (float).
+
+        Raises:
+            ValueError: If mode is not "sum", "min" or "max".
+        """
+        if mode not in ("sum", "min", "max"):
+            raise ValueError("Mode must be 'sum', 'min' or 'max'")
+        self.mode = mode
+        data = _as_array(values, typecode)
+        n = len(data)
+        self.n = n
+        self.log = (n - 1).bit_length() if n > 1 else 0
+        self.size = 1 << self.log
+
+        if mode == "sum":
+            self.op, self.identity, pad = operator.add, 0, 0
+        else:
+            self.op = min if mode == "min" else max
+            self.identity = float("inf") if mode == "min" else float("-inf")
+            pad = self._extreme(typecode, mode == "min")
+
+        size = self.size
+        self.tree = array(typecode, [0]) * size + data + array(typecode, [pad]) * (size - n)
+        self.pending_add = array(typecode, [0]) * size
+        self.pending_value = array(typecode, [0]) * size
+        self.pending_assign = bytearray(size)
+        tree, op = self.tree, self.op
+        for i in range(size - 1, 0, -1):
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+
+
+    @staticmethod
+    def _extreme(typecode: str, largest: bool):
+        """Padding for unused leaves: the typecode's largest (min) or smallest (max) value."""
+        if typecode in "fd":
+            return float("inf") if largest else float("-inf")
+        bits = 8 * array(typecode).itemsize
+        if typecode.isupper():  # Unsigned
+            return (1 << bits) - 1 if largest else 0
+        return (1 << (bits - 1)) - 1 if largest else -(1 << (bits - 1))
+
+
+    def __len__(self) -> int:
+        return self.n
+
+
+    def _length(self, node: int) -> int:
+        """Number of leaves under node."""
+        return self.size >> (node.bit_length() - 1)
+
+
+    def _apply_assign(self, node: int, value) -> None:
+        self.tree[node] = value * self._length(node) if self.mode == "sum" else value
+        if node < self.size:
+            self.pending_assign[node] = 1
+            self.pending_value[node] = value
+            self.pending_add[node] = 0
+
+
+    def _apply_add(self, node: int, delta) -> None:
+        self.tree[node] += delta * self._length(node) if self.mode == "sum" else delta
+        if node < self.size:
+            if self.pending_assign[node]:
+                self.pending_value[node] += delta
+            else:
+                self.pending_add[node] += delta
+
+
+    def _push(self, node: int) -> None:
+        """Moves node's pending tags down to its two children."""
+        if self.pending_assign[node]:
+            value = self.pending_value[node]
+            self._apply_assign(2 * node, value)
+            self._apply_assign(2 * node + 1, value)
+            self.pending_assign[node] = 0
+        elif self.pending_add[node]:
+            delta = self.pending_add[node]
+            self._apply_add(2 * node, delta)
+            self._apply_add(2 * node + 1, delta)
+            self.pending_add[node] = 0
+
+
+    def _push_path(self, lo: int, hi: int) -> None:
+        """Pushes tags on the paths from the root down to the leaves lo and hi - 1."""
+        for shift in range(self.log, 0, -1):
+            if ((lo >> shift) << shift) != lo:
+                self._push(lo >> shift)
+            if ((hi >> shift) << shift) != hi:
+                self._push((hi - 1) >> shift)
+
+
+    def _range_update(self, lo: int, hi: int, apply: Callable[[int, Any], None], arg) -> None:
+        _check_range(lo, hi, self.n)
+        if lo == hi:
+            return
+        lo += self.size
+        hi += self.size
+        self._push_path(lo, hi)
+        left, right = lo, hi
+        while left < right:
+            if left & 1:
+                apply(left, arg)
+                left += 1
+            if right & 1:
+                right -= 1
+                apply(right, arg)
+            left >>= 1
+            right >>= 1
+        # Recompute the ancestors of the covering nodes
+        tree, op = self.tree, self.op
+        for shift in range(1, self.log + 1):
+            if ((lo >> shift) << shift) != lo:
+                i = lo >> shift
+                tree[i] = op(tree[2 * i], tree[2 * i + 1])
+            if ((hi >> shift) << shift) != hi:
+                i = (hi - 1) >> shift
+                tree[i] = op(tree[2 * i], tree[2 * i + 1])
+
+
+    def range_add(self, lo: int, hi: int, delta) -> None:
+        """
+        Adds delta to every value in [lo, hi).
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        self._range_update(lo, hi, self._apply_add, delta)
+
+
+    def range_assign(self, lo: int, hi: int, value) -> None:
+        """
+        Sets every value in [lo, hi) to value.
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        self._range_update(lo, hi, self._apply_assign, value)
+
+
+    def query(self, lo: int, hi: int):
+        """
+        Returns the sum / min / max of the values in [lo, hi). An empty range
+        gives 0, inf or -inf respectively.
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        _check_range(lo, hi, self.n)
+        if lo == hi:
+            return self.identity
+        lo += self.size
+        hi += self.size
+        self._push_path(lo, hi)
+        tree, op = self.tree, self.op
+        left = right = self.identity
+        while lo < hi:
+            if lo & 1:
+                left = op(left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = op(tree[hi], right)
+            lo >>= 1
+            hi >>= 1
+        return op(left, right)
+
+
+    def get(self, index: int):
+        """
+        Returns the value at index.
+
+        Time Complexity: O(log n)
+        """
+        _check_index(index, self.n)
+        return self.query(index, index + 1)
+
+
+    def set(self, index: int, value) -> None:
+        """
+        Replaces the value at index.
+
+        Time Complexity: O(log n)
+        """
+        _check_index(index, self.n)
+        self.range_assign(index, index + 1, value)
+
+
+if __name__ == "__main__":
+    readings = MyArray()
+    for value in [5, 3, 8, 6, 1, 4, 7, 2]:
+        readings.append(value)
+
+    fenwick = FenwickTree(readings)
+    fenwick.range_add(2, 5, 10)
+    print(fenwick.range_sum(0, 4), fenwick.get(3))  # 42 16
+
+    minimum = SegmentTree(readings, min, float("inf"))
+    minimum.set(4, 9)
+    print(minimum.query(2, 6), minimum.query(0, 8))  # 4 2
+
+    lazy = LazySegmentTree(readings, mode="max")
+    lazy.range_assign(0, 4, 1)
+    lazy.range_add(3, 6, 5)
+    print(lazy.query(0, 8), lazy.get(3))  # 9 6
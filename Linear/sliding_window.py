@@ -0,0 +1,303 @@
+from typing import Any, Callable, List
+
+from Linear.deque import Deque
+from Linear.stack import Stack
+
+
+class MonotonicWindow:
+    """
+    Sliding-window minimum or maximum backed by a monotonic Deque.
+
+    The deque holds (index, value) pairs whose values are kept strictly
+    increasing (mode="min") or strictly decreasing (mode="max") from front
+    to rear, so the answer for the current window is always at the front.
+    Every value is appended and popped at most once, which makes each push
+    O(1) amortized instead of the O(w) rescan of the whole window.
+    """
+
+    def __init__(self, window_size: int, mode: str = "min"):
+        """
+        Initializes an empty window.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Parameters:
+            window_size (int): Number of most recent values kept in the window.
+            mode (str): "min" or "max".
+
+        Raises:
+            ValueError: If window_size < 1 or mode is not "min"/"max".
+        """
+        if window_size < 1:
+            raise ValueError("Window size must be at least 1")
+        if mode not in ("min", "max"):
+            raise ValueError("Mode must be 'min' or 'max'")
+        self.window_size = window_size
+        self.mode = mode
+        self.deque = Deque()
+        self.count = 0  # Total number of values pushed so far
+
+
+    def _dominates(self, new_value, old_value) -> bool:
+        """
+        Returns True if new_value makes old_value useless for every future window.
+        """
+        if self.mode == "min":
+            return new_value <= old_value
+        return new_value >= old_value
+
+
+    def push(self, value) -> Any:
+        """
+        Adds a value to the window (evicting the oldest one once the window is
+        full) and returns the current window min/max.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(w) for the deque
+
+        Parameters:
+            value (any): A comparable value.
+
+        Returns:
+            The minimum or maximum of the values currently in the window.
+        """
+        index = self.count
+        self.count += 1
+
+        # Drop values from the rear that can never be the answer again
+        while not self.deque.is_empty() and self._dominates(value, self.deque.peek_right()[1]):
+            self.deque.pop_right()
+        self.deque.append_right((index, value))
+
+        # Drop the front once it slides out of the window
+        if self.deque.peek_left()[0] <= index - self.window_size:
+            self.deque.pop_left()
+
+        return self.deque.peek_left()[1]
+
+
+    def query(self) -> Any:
+        """
+        Returns the current window min/max without modifying the window.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If nothing has been pushed yet.
+        """
+        if self.deque.is_empty():
+            raise IndexError("Query on empty window")
+        return self.deque.peek_left()[1]
+
+
+    def is_full(self) -> bool:
+        """
+        Returns True once window_size values have been pushed.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self.count >= self.window_size
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values currently covered by the window.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return min(self.count, self.window_size)
+
+
+class SlidingWindowAggregator:
+    """
+    Sliding-window aggregation for any associative operator using a two-stack queue.
+
+    New values are pushed on the back stack together with the running aggregate
+    of that stack. When the oldest value must be evicted and the front stack is
+    empty, the back stack is flipped onto the front stack, storing suffix
+    aggregates on the way. The window aggregate is then
+    op(front aggregate, back aggregate), so each push is O(1) amortized calls
+    to op. The operator only needs to be associative (sum, min, gcd, matrix
+    product, ...); it does not need to be commutative or invertible.
+    """
+
+    def __init__(self, window_size: int, op: Callable[[Any, Any], Any]):
+        """
+        Initializes an empty window.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Parameters:
+            window_size (int): Number of most recent values kept in the window.
+            op (callable): Associative binary operator, op(older, newer).
+
+        Raises:
+            ValueError: If window_size < 1.
+        """
+        if window_size < 1:
+            raise ValueError("Window size must be at least 1")
+        self.window_size = window_size
+        self.op = op
+        self.front = Stack()  # (value, aggregate of this value and everything above it in the window order)
+        self.back = Stack()   # (value, aggregate of the back stack up to this value)
+        self.size = 0
+
+
+    def _flip(self) -> None:
+        """
+        Moves every element of the back stack onto the front stack,
+        computing suffix aggregates so the oldest element ends up on top.
+
+        Time Complexity: O(k) for k moved elements, O(1) amortized per push
+        """
+        op = self.op
+        value, _ = self.back.pop()
+        self.front.push((value, value))
+        while not self.back.is_empty():
+            value, _ = self.back.pop()
+            self.front.push((value, op(value, self.front.peek()[1])))
+
+
+    def _evict(self) -> None:
+        """
+        Removes the oldest value from the window.
+        """
+        if self.front.is_empty():
+            self._flip()
+        self.front.pop()
+        self.size -= 1
+
+
+    def push(self, value) -> Any:
+        """
+        Adds a value to the window (evicting the oldest one once the window is
+        full) and returns the aggregate of the window.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(w)
+
+        Parameters:
+            value (any): Operand for the aggregation operator.
+
+        Returns:
+            op folded over the values in the window, oldest to newest.
+        """
+        if self.back.is_empty():
+            self.back.push((value, value))
+        else:
+            self.back.push((value, self.op(self.back.peek()[1], value)))
+        self.size += 1
+
+        if self.size > self.window_size:
+            self._evict()
+
+        return self.query()
+
+
+    def query(self) -> Any:
+        """
+        Returns the aggregate of the current window.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Raises:
+            IndexError: If the window is empty.
+        """
+        if self.size == 0:
+            raise IndexError("Query on empty window")
+        if self.front.is_empty():
+            return self.back.peek()[1]
+        if self.back.is_empty():
+            return self.front.peek()[1]
+        return self.op(self.front.peek()[1], self.back.peek()[1])
+
+
+    def is_full(self) -> bool:
+        """
+        Returns True once the window holds window_size values.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self.size == self.window_size
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values currently in the window.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self.size
+
+
+def _run_batch(window, values, window_size: int) -> List[Any]:
+    """
+    Feeds values through a streaming window and keeps the answers of full windows only.
+    """
+    result = []
+    for i, value in enumerate(values):
+        aggregate = window.push(value)
+        if i >= window_size - 1:
+            result.append(aggregate)
+    return result
+
+
+def sliding_window_min(values, window_size: int) -> List[Any]:
+    """
+    Returns the minimum of every full window of window_size consecutive values.
+
+    Time Complexity: O(n)
+    Space Complexity: O(w) working space, O(n - w + 1) for the result
+
+    Example:
+        sliding_window_min([4, 2, 12, 3, 8], 3) -> [2, 2, 3]
+    """
+    return _run_batch(MonotonicWindow(window_size, "min"), values, window_size)
+
+
+def sliding_window_max(values, window_size: int) -> List[Any]:
+    """
+    Returns the maximum of every full window of window_size consecutive values.
+
+    Time Complexity: O(n)
+    Space Complexity: O(w) working space, O(n - w + 1) for the result
+
+    Example:
+        sliding_window_max([4, 2, 12, 3, 8], 3) -> [12, 12, 12]
+    """
+    return _run_batch(MonotonicWindow(window_size, "max"), values, window_size)
+
+
+def sliding_window_aggregate(values, window_size: int, op: Callable[[Any, Any], Any]) -> List[Any]:
+    """
+    Returns op folded over every full window of window_size consecutive values.
+
+    Time Complexity: O(n) calls to op (amortized)
+    Space Complexity: O(w) working space, O(n - w + 1) for the result
+
+    Example:
+        sliding_window_aggregate([1, 2, 3, 4], 2, lambda a, b: a + b) -> [3, 5, 7]
+    """
+    return _run_batch(SlidingWindowAggregator(window_size, op), values, window_size)
+
+
+if __name__ == "__main__":
+    from math import gcd
+
+    data = [4, 2, 12, 3, 8, 6, 1, 9]
+    print(sliding_window_min(data, 3))                         # [2, 2, 3, 3, 1, 1]
+    print(sliding_window_max(data, 3))                         # [12, 12, 12, 8, 8, 9]
+    print(sliding_window_aggregate(data, 3, lambda a, b: a + b))  # [18, 17, 23, 17, 15, 16]
+    print(sliding_window_aggregate(data, 2, gcd))              # [2, 2, 3, 1, 2, 1, 1]
+
+    window = MonotonicWindow(2, "max")
+    for v in [5, 1, 3]:
+        print(window.push(v))   # 5, 5, 3
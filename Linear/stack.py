@@ -1,24 +1,79 @@
+from array import array
+
+
 class Stack:
-    def __init__(self):
+    __slots__ = ("data", "size", "capacity", "typecode")
+
+    def __init__(self, typecode=None, capacity: int = 0):
         """
-        Initializes an empty stack using a dynamic array (Python list).
+        Initializes an empty stack using a dynamic array.
 
-        Time Complexity: O(1)
-        Space Complexity: O(1)
+        By default the stack stores arbitrary Python objects in a list. Passing an
+        array typecode (e.g. "l" for vertex IDs) stores the values unboxed in a
+        typed array.array instead. A capacity hint preallocates that many slots so
+        the first `capacity` pushes only write into the buffer and never grow it.
+
+        Time Complexity: O(capacity)
+        Space Complexity: O(capacity)
+
+        Parameters:
+            typecode (str, optional): array module typecode, or None for any object.
+            capacity (int): Number of slots to preallocate.
+
+        Raises:
+            ValueError: If capacity is negative or typecode is not a valid array typecode.
         """
-        self.data = []
+        if capacity < 0:
+            raise ValueError("Capacity must be non-negative")
+        self.typecode = typecode
+        self.capacity = capacity
+        self.size = 0
+        # Invariant: len(self.data) == max(self.size, self.capacity)
+        if typecode is None:
+            self.data = [None] * capacity
+        else:
+            self.data = array(typecode, [0]) * capacity
 
     def push(self, value):
         """
         Pushes a new value onto the top of the stack.
 
-        Time Complexity: O(1)
+        Time Complexity: O(1) amortized
         Space Complexity: O(1)
 
         Parameters:
             value (any): The value to be added to the stack.
         """
-        self.data.append(value)
+        if self.size < self.capacity:
+            self.data[self.size] = value
+        else:
+            self.data.append(value)
+        self.size += 1
+
+    def push_many(self, values):
+        """
+        Pushes every value of an iterable, in order, so the last one ends on top.
+
+        Time Complexity: O(k) for k values
+        Space Complexity: O(1) extra
+
+        Parameters:
+            values (iterable): Values to push.
+
+        Raises:
+            TypeError: If a value does not fit the typed array; the values
+                before it remain pushed, as with repeated push() calls.
+        """
+        if self.size >= self.capacity:
+            # Past the preallocated region, so one bulk extend does all the work.
+            # If it fails partway, the values appended so far stay pushed.
+            try:
+                self.data.extend(values)
+            finally:
+                self.size = len(self.data)
+            return
+        for value in values:
+            self.push(value)
 
     def pop(self):
       """
@@ -33,29 +88,71 @@ class Stack:
         Raises:
             IndexError: If the stack is empty
       """
-      if not self.data:
+      if self.size == 0:
           raise IndexError("Pop from empty stack")
 
-      return self.data.pop()
-    
-    def peek(self):
+      self.size -= 1
+      if self.size >= self.capacity:
+          return self.data.pop()
+
+      value = self.data[self.size]
+      if self.typecode is None:
+          self.data[self.size] = None  # Release the reference held by the preallocated slot
+      return value
+
+    def pop_many(self, k: int) -> list:
       """
-        Returns the top element of the stack without removing it.
+        Removes the top k elements and returns them in pop order (top first).
+
+        Time Complexity: O(k)
+        Space Complexity: O(k) for the returned list
+
+        Parameters:
+            k (int): Number of elements to pop.
+
+        Returns:
+            list: The popped values, the former top element first.
+
+        Raises:
+            ValueError: If k is negative.
+            IndexError: If the stack holds fewer than k elements.
+      """
+      if k < 0:
+          raise ValueError("Cannot pop a negative number of elements")
+      if k > self.size:
+          raise IndexError("Pop from empty stack")
+
+      start = self.size - k
+      if start >= self.capacity:
+          # The whole block lives outside the preallocated region: slice it off at once
+          result = list(self.data[start:])
+          del self.data[start:]
+          self.size = start
+          result.reverse()
+          return result
+      return [self.pop() for _ in range(k)]
+
+    def peek(self, k: int = 0):
+      """
+        Returns an element of the stack without removing it.
 
         Time Complexity: O(1)
         Space Complexity: O(1)
 
+        Parameters:
+            k (int): Distance from the top; 0 (the default) is the top element.
+
         Returns:
-            The last pushed element (top of the stack)
+            The element k positions below the top of the stack
 
         Raises:
-            IndexError: If the stack is empty
+            IndexError: If the stack holds fewer than k + 1 elements
       """
-      if not self.data:
+      if not 0 <= k < self.size:
           raise IndexError("Peek from empty stack")
 
-      return self.data[-1]
-    
+      return self.data[self.size - 1 - k]
+
 
     def is_empty(self) -> bool:
       """
@@ -67,7 +164,7 @@ class Stack:
         Returns:
             bool: True if stack is empty, False otherwise
       """
-      return len(self.data) == 0
+      return self.size == 0
 
     def __len__(self) -> int:
       """
@@ -79,7 +176,7 @@ class Stack:
         Returns:
             int: The number of elements in the stack
       """
-      return len(self.data)
+      return self.size
 
     def __str__(self) -> str:
       """
@@ -91,8 +188,4 @@ class Stack:
         Time Complexity: O(n)
         Space Complexity: O(n)
       """
-      return f"Bottom → {self.data} ← Top"
-
-
-
-
+      return f"Bottom → {list(self.data[:self.size])} ← Top"
@@ -1,4 +1,5 @@
 from Linear.arrays import MyArray as Array
+from Linear.stack import Stack
 from directed_weighted_graph_base import DirectedWeightedGraph
 
 INF = float('inf')
@@ -51,40 +52,56 @@ def topological_sort(graph: DirectedWeightedGraph) -> Array:
     """
     Perform topological sorting on a DAG.
 
+    Uses an iterative DFS on a typed vertex Stack, with a per-vertex cursor into
+    the adjacency list, so cycle detection and ordering happen in a single pass
+    and deep DAGs do not hit the recursion limit.
+
     Args:
         graph (DirectedWeightedGraph): The graph instance.
 
     Returns:
         Array: Vertices in topologically sorted order.
 
+    Raises:
+        ValueError: If the graph contains a cycle.
+
     Time Complexity: O(V + E)
     """
-    if has_cycle(graph):
-        raise ValueError("Topological sort not possible: Graph contains a cycle.")
-
     V = graph.vertex_count()
-    visited = Array()
-    for _ in range(V):
-        visited.append(False)
-
-    result = Array()
-
-    def dfs(u: int):
-        visited.set(u, True)
-        for i in range(len(graph.adj[u])):
-            v, _ = graph.adj[u].get(i)
-            if not visited.get(v):
-                dfs(v)
-        result.append(u)  # Append after exploring all neighbors
-
-    for i in range(V):
-        if not visited.get(i):
-            dfs(i)
-
-    # Reverse the result
+    state = [0] * V  # 0 = unvisited, 1 = on the DFS path, 2 = finished
+    cursor = [None] * V  # Next adjacency-list node to explore for each vertex
+    finished = Stack("l", V)
+    stack = Stack("l", V)
+
+    for s in range(V):
+        if state[s] != 0:
+            continue
+        state[s] = 1
+        cursor[s] = graph.adj[s].head
+        stack.push(s)
+
+        while not stack.is_empty():
+            u = stack.peek()
+            node = cursor[u]
+            if node is None:
+                stack.pop()
+                state[u] = 2
+                finished.push(u)  # Append after exploring all neighbors
+                continue
+
+            cursor[u] = node.next
+            v, _ = node.value
+            if state[v] == 1:
+                raise ValueError("Topological sort not possible: Graph contains a cycle.")
+            if state[v] == 0:
+                state[v] = 1
+                cursor[v] = graph.adj[v].head
+                stack.push(v)
+
+    # Reverse postorder is the finishing stack popped top-first
     sorted_order = Array()
-    for i in range(len(result) - 1, -1, -1):
-        sorted_order.append(result.get(i))
+    for u in finished.pop_many(len(finished)):
+        sorted_order.append(u)
 
     return sorted_order
 
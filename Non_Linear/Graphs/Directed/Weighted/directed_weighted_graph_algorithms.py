@@ -1,4 +1,5 @@
 from Linear.arrays import MyArray as Array
+from Linear.stack import Stack
 from directed_weighted_graph_base import DirectedWeightedGraph
 
 INF = float('inf')
@@ -128,6 +129,9 @@ def connected_components(graph: DirectedWeightedGraph) -> Array:
     """
     Find strongly connected components (SCCs) using Kosaraju's algorithm.
 
+    Both DFS passes are iterative and run on typed vertex Stacks, so deep
+    graphs do not hit the recursion limit.
+
     Returns:
         Array: Each element is an Array representing a strongly connected component.
 
@@ -138,19 +142,29 @@ def connected_components(graph: DirectedWeightedGraph) -> Array:
     for _ in range(V):
         visited.append(False)
 
-    stack = Array()
-
-    def fill_order(u: int):
-        visited.set(u, True)
-        for i in range(len(graph.adj[u])):
-            v, _ = graph.adj[u].get(i)
+    order = Stack("l", V)  # Vertices by finishing time
+    stack = Stack("l", V)
+    cursor = [None] * V  # Next adjacency-list node to explore for each vertex
+
+    for s in range(V):
+        if visited.get(s):
+            continue
+        visited.set(s, True)
+        cursor[s] = graph.adj[s].head
+        stack.push(s)
+
+        while not stack.is_empty():
+            u = stack.peek()
+            node = cursor[u]
+            if node is None:
+                order.push(stack.pop())
+                continue
+            cursor[u] = node.next
+            v, _ = node.value
             if not visited.get(v):
-                fill_order(v)
-        stack.append(u)
-
-    for i in range(V):
-        if not visited.get(i):
-            fill_order(i)
+                visited.set(v, True)
+                cursor[v] = graph.adj[v].head
+                stack.push(v)
 
     g_transpose = _transpose(graph)
 
@@ -159,21 +173,25 @@ def connected_components(graph: DirectedWeightedGraph) -> Array:
 
     scc_list = Array()
 
-    def dfs_collect(u: int, component: Array):
+    while not order.is_empty():
+        u = order.pop()
+        if visited.get(u):
+            continue
+
+        component = Array()
         visited.set(u, True)
-        component.append(u)
-        for i in range(len(g_transpose.adj[u])):
-            v, _ = g_transpose.adj[u].get(i)
-            if not visited.get(v):
-                dfs_collect(v, component)
-
-    while len(stack) > 0:
-        u = stack.get(len(stack) - 1)
-        stack.delete(len(stack) - 1)
-        if not visited.get(u):
-            component = Array()
-            dfs_collect(u, component)
-            scc_list.append(component)
+        stack.push(u)
+        while not stack.is_empty():
+            x = stack.pop()
+            component.append(x)
+            node = g_transpose.adj[x].head
+            while node is not None:
+                v, _ = node.value
+                if not visited.get(v):
+                    visited.set(v, True)
+                    stack.push(v)
+                node = node.next
+        scc_list.append(component)
 
     return scc_list
 
@@ -1,5 +1,6 @@
 from Linear.arrays import MyArray as Array
 from Linear.singly_linked_list import SinglyLinkedList as LinkedList
+from Linear.stack import Stack
 
 
 class DirectedGraph:
@@ -323,57 +324,97 @@ class DirectedGraph:
         return False
 
 
+    def _dfs_postorder(self, start: int, visited, order: Stack, detect_cycle: bool = False) -> None:
+        """
+        Iterative DFS from 'start' that pushes every newly finished vertex onto 'order'.
+
+        An explicit vertex stack (typed, preallocated to n) replaces recursion, and a
+        per-vertex cursor into the adjacency list remembers which neighbor to try next,
+        so vertices finish in exactly the same order as the recursive version.
+
+        Vertices on the current path are marked 1 in 'visited' and finished
+        vertices are marked 2; unvisited vertices must be 0.
+
+        Raises:
+            ValueError: If detect_cycle is True and a back edge (cycle) is found.
+
+        Time Complexity: O(V + E)
+        Space Complexity: O(V)
+        """
+        stack = Stack("l", self.n)
+        cursor = [None] * self.n  # Next adjacency-list node to explore for each vertex
+
+        visited[start] = 1
+        cursor[start] = self.adj.get(start).head
+        stack.push(start)
+
+        while not stack.is_empty():
+            u = stack.peek()
+            node = cursor[u]
+            if node is None:
+                # All neighbors explored: u is finished
+                stack.pop()
+                visited[u] = 2
+                order.push(u)
+                continue
+
+            cursor[u] = node.next
+            v = node.value
+            if visited[v] == 1 and detect_cycle:  # back edge detected
+                raise ValueError("Graph contains a cycle. Topological sort not possible.")
+            if visited[v] == 0:
+                visited[v] = 1  # mark as visiting
+                cursor[v] = self.adj.get(v).head
+                stack.push(v)
+
+
     def connected_components(self):
         """
         Finds all Strongly Connected Components (SCCs) in the directed graph
         using Kosaraju's algorithm.
 
+        Both DFS passes are iterative and run on typed vertex stacks, so deep
+        graphs do not hit the recursion limit.
+
         Returns:
             List[List[int]]: A list of SCCs, each SCC is a list of vertices.
 
         Time Complexity: O(V + E)
         """
-        visited = [False] * self.n
-        stack = []
+        visited = [0] * self.n
+        order = Stack("l", self.n)
 
         # Step 1: Fill vertices in stack according to their finishing times
-        def dfs_fill(u):
-            visited[u] = True
-            for i in range(len(self.adj.get(u))):
-                v = self.adj.get(u).get(i)
-                if not visited[v]:
-                    dfs_fill(v)
-            stack.append(u)
-
         for u in range(self.n):
-            if not visited[u]:
-                dfs_fill(u)
+            if visited[u] == 0:
+                self._dfs_postorder(u, visited, order)
 
         # Step 2: Reverse the graph
-        reversed_graph = DirectedGraph(self.n)
-        for u in range(self.n):
-            for i in range(len(self.adj.get(u))):
-                v = self.adj.get(u).get(i)
-                reversed_graph.add_edge(v, u)
+        reversed_graph = self.transpose()
 
         # Step 3: Perform DFS on reversed graph using the stack order
         visited = [False] * self.n
         scc_list = []
+        stack = Stack("l", self.n)
 
-        def dfs_collect(u, component):
-            visited[u] = True
-            component.append(u)
-            for i in range(len(reversed_graph.adj.get(u))):
-                v = reversed_graph.adj.get(u).get(i)
-                if not visited[v]:
-                    dfs_collect(v, component)
+        while not order.is_empty():
+            u = order.pop()
+            if visited[u]:
+                continue
 
-        while stack:
-            u = stack.pop()
-            if not visited[u]:
-                component = []
-                dfs_collect(u, component)
-                scc_list.append(component)
+            component = []
+            visited[u] = True
+            stack.push(u)
+            while not stack.is_empty():
+                x = stack.pop()
+                component.append(x)
+                node = reversed_graph.adj.get(x).head
+                while node is not None:
+                    if not visited[node.value]:
+                        visited[node.value] = True
+                        stack.push(node.value)
+                    node = node.next
+            scc_list.append(component)
 
         return scc_list
 
@@ -388,33 +429,19 @@ class DirectedGraph:
 
         Returns:
             List[int]: Vertices in topological order.
+
+        Time Complexity: O(V + E)
+        Space Complexity: O(V)
         """
         visited = [0] * self.n  # 0 = unvisited, 1 = visiting, 2 = visited
-        stack = []
-        has_cycle = [False]  # To detect cycles (use list as mutable flag)
-
-        def dfs(u):
-            if visited[u] == 1:  # back edge detected
-                has_cycle[0] = True
-                return
-            if visited[u] == 2:
-                return
-            visited[u] = 1  # mark as visiting
-            for i in range(len(self.adj.get(u))):
-                v = self.adj.get(u).get(i)
-                dfs(v)
-            visited[u] = 2  # mark as visited
-            stack.append(u)
+        order = Stack("l", self.n)
 
         for u in range(self.n):
             if visited[u] == 0:
-                dfs(u)
-
-        if has_cycle[0]:
-            raise ValueError("Graph contains a cycle. Topological sort not possible.")
+                self._dfs_postorder(u, visited, order, detect_cycle=True)
 
-        stack.reverse()
-        return stack
+        # Reverse postorder is simply the finishing stack popped top-first
+        return order.pop_many(len(order))
 
 
     def has_cycle(self) -> bool:
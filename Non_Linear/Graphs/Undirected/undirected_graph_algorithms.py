@@ -4,6 +4,7 @@ from undirected_graph_base import Graph
 # If you need Array and LinkedList (for custom queues or BFS), import them like:
 from Linear.arrays import MyArray as Array
 from Linear.singly_linked_list import SinglyLinkedList as LinkedList
+from Linear.stack import Stack
 from collections import deque
 
 def cycle_detection(graph: Graph) -> bool:
@@ -477,16 +478,17 @@ def find_eulerian_path(graph: Graph):
                 start = u
                 break
 
-    stack = [start]
+    stack = Stack("l", graph.vertex_count())
+    stack.push(start)
     path = []
 
-    while stack:
-        u = stack[-1]
+    while not stack.is_empty():
+        u = stack.peek()
         if adj_copy[u]:
             v = adj_copy[u].pop()
             # Remove edge both ways
             adj_copy[v].remove(u)
-            stack.append(v)
+            stack.push(v)
         else:
             path.append(stack.pop())
 
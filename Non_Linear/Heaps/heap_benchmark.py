@@ -0,0 +1,105 @@
+"""
+Merge-heavy benchmark: PairingHeap vs MinHeap vs heapq.
+
+Simulates a scheduler that shards tasks into per-worker priority queues,
+periodically merges all shards into one queue and then serves a few tasks.
+Each case reports the best time of the merge + extract phase.
+
+Run from the repository root:
+    python -m Non_Linear.Heaps.heap_benchmark
+"""
+import heapq
+import random
+import time
+
+from Non_Linear.Heaps.min_heap import MinHeap
+from Non_Linear.Heaps.pairing_heap import PairingHeap
+
+
+def _make_shards(num_shards: int, shard_size: int, seed: int = 42):
+    rng = random.Random(seed)
+    return [[rng.random() for _ in range(shard_size)] for _ in range(num_shards)]
+
+
+def bench_pairing_meld(shards, extracts: int) -> float:
+    heaps = []
+    for shard in shards:
+        heap = PairingHeap()
+        for value in shard:
+            heap.insert(value)
+        heaps.append(heap)
+    start = time.perf_counter()
+    merged = heaps[0]
+    for heap in heaps[1:]:
+        merged.meld(heap)           # O(1) per merge
+    for _ in range(extracts):
+        merged.extract_min()
+    return time.perf_counter() - start
+
+
+def bench_minheap_reinsert(shards, extracts: int) -> float:
+    heaps = []
+    for shard in shards:
+        heap = MinHeap()
+        heap.heapify(shard)
+        heaps.append(heap)
+    start = time.perf_counter()
+    merged = heaps[0]
+    for heap in heaps[1:]:
+        for value in heap.data:     # O(m log n) per merge
+            merged.insert(value)
+    for _ in range(extracts):
+        merged.extract_min()
+    return time.perf_counter() - start
+
+
+def bench_minheap_merge(shards, extracts: int) -> float:
+    heaps = []
+    for shard in shards:
+        heap = MinHeap()
+        heap.heapify(shard)
+        heaps.append(heap)
+    start = time.perf_counter()
+    merged = heaps[0]
+    for heap in heaps[1:]:
+        merged.merge(heap)          # O(n + m) rebuild per merge
+    for _ in range(extracts):
+        merged.extract_min()
+    return time.perf_counter() - start
+
+
+def bench_heapq(shards, extracts: int) -> float:
+    heaps = []
+    for shard in shards:
+        heap = list(shard)
+        heapq.heapify(heap)
+        heaps.append(heap)
+    start = time.perf_counter()
+    merged = heaps[0]
+    for heap in heaps[1:]:
+        merged.extend(heap)         # O(n + m) rebuild per merge
+        heapq.heapify(merged)
+    for _ in range(extracts):
+        heapq.heappop(merged)
+    return time.perf_counter() - start
+
+
+def run(num_shards: int = 64, shard_size: int = 2000, extracts: int = 1000, repeat: int = 3) -> None:
+    shards = _make_shards(num_shards, shard_size)
+    cases = [
+        ("PairingHeap.meld", bench_pairing_meld),
+        ("MinHeap re-insert", bench_minheap_reinsert),
+        ("MinHeap.merge", bench_minheap_merge),
+        ("heapq extend+heapify", bench_heapq),
+    ]
+    print(f"{num_shards} shards x {shard_size} items: merge all shards, then {extracts} extract_min calls")
+    print("(shard construction is not timed)")
+    for name, fn in cases:
+        best = float("inf")
+        for _ in range(repeat):
+            best = min(best, fn(shards, extracts))
+        print(f"  {name:<22} {best * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    run()
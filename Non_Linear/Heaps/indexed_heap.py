@@ -0,0 +1,281 @@
+from array import array
+from typing import Any, List, Optional, Tuple
+
+
+class IndexedHeap:
+    """
+    An indexed d-ary heap of integer item IDs ordered by a priority key.
+
+    Besides the usual heap operations, every item's position in the heap is
+    tracked in an array-backed position table, so an item can be found, have its
+    key changed or be removed in O(log n) without searching the heap.
+    This is the priority queue needed by Dijkstra, Prim and timer wheels.
+
+    Items are non-negative integers (e.g. vertex IDs). The heap is a min-heap by
+    default; pass max_heap=True for a max-heap. A wider arity d makes the tree
+    shallower, trading slightly more comparisons per level in _bubble_down for
+    fewer levels and better cache locality; d=4 is usually the fastest.
+    """
+
+    def __init__(self, d: int = 4, capacity: int = 0, max_heap: bool = False):
+        """
+        Initialize an empty indexed heap.
+
+        Time Complexity: O(capacity)
+        Space Complexity: O(capacity)
+
+        Args:
+            d (int): Arity of the heap (children per node), at least 2.
+            capacity (int): Initial size of the position/key tables. Item IDs
+                at or above it are still accepted; the tables grow on demand.
+            max_heap (bool): Order by largest key first instead of smallest.
+
+        Raises:
+            ValueError: If d < 2 or capacity < 0.
+        """
+        if d < 2:
+            raise ValueError("Heap arity must be at least 2")
+        if capacity < 0:
+            raise ValueError("Capacity must be non-negative")
+        self.d = d
+        self.max_heap = max_heap
+        self.heap = array("l")                    # heap[i] = item stored at heap slot i
+        self.pos = array("l", [-1]) * capacity    # pos[item] = heap slot of item, -1 if absent
+        self.keys: List[Any] = [None] * capacity  # keys[item] = priority of item
+
+
+    def _higher(self, a: Any, b: Any) -> bool:
+        """Return True if key a must sit above key b in the heap."""
+        return a > b if self.max_heap else a < b
+
+
+    def _ensure_capacity(self, item: int) -> None:
+        """Grow the position and key tables so that item is a valid index."""
+        if item < 0:
+            raise ValueError(f"Item {item} must be a non-negative integer")
+        missing = item + 1 - len(self.pos)
+        if missing > 0:
+            # Grow geometrically so repeated inserts stay amortized O(1)
+            missing = max(missing, len(self.pos))
+            self.pos.extend(array("l", [-1]) * missing)
+            self.keys.extend([None] * missing)
+
+
+    def contains(self, item: int) -> bool:
+        """
+        Check whether item is currently in the heap.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return 0 <= item < len(self.pos) and self.pos[item] != -1
+
+
+    def __contains__(self, item: int) -> bool:
+        """Support `item in heap`."""
+        return self.contains(item)
+
+
+    def key_of(self, item: int) -> Any:
+        """
+        Return the current key of item.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Raises:
+            KeyError: If item is not in the heap.
+        """
+        if not self.contains(item):
+            raise KeyError(f"Item {item} is not in the heap")
+        return self.keys[item]
+
+
+    def insert(self, item: int, key: Any) -> None:
+        """
+        Insert item with the given key.
+        Time Complexity: O(log_d n)
+        Space Complexity: O(1) amortized
+
+        Raises:
+            ValueError: If item is negative.
+            KeyError: If item is already in the heap (use update instead).
+        """
+        self._ensure_capacity(item)
+        if self.pos[item] != -1:
+            raise KeyError(f"Item {item} is already in the heap")
+        self.keys[item] = key
+        self.pos[item] = len(self.heap)
+        self.heap.append(item)
+        self._bubble_up(len(self.heap) - 1)
+
+
+    def peek(self) -> Optional[Tuple[int, Any]]:
+        """
+        Return (item, key) at the top of the heap without removing it, or None if empty.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not self.heap:
+            return None
+        item = self.heap[0]
+        return item, self.keys[item]
+
+
+    def pop(self) -> Optional[Tuple[int, Any]]:
+        """
+        Remove and return (item, key) at the top of the heap, or None if empty.
+        Time Complexity: O(d log_d n)
+        Space Complexity: O(1)
+        """
+        if not self.heap:
+            return None
+        item = self.heap[0]
+        key = self.keys[item]
+        self._remove_at(0)
+        return item, key
+
+
+    def remove(self, item: int) -> Any:
+        """
+        Remove an arbitrary item from the heap and return its key.
+        Time Complexity: O(d log_d n)
+        Space Complexity: O(1)
+
+        Raises:
+            KeyError: If item is not in the heap.
+        """
+        key = self.key_of(item)
+        self._remove_at(self.pos[item])
+        return key
+
+
+    def update(self, item: int, new_key: Any) -> None:
+        """
+        Change the key of item in either direction and restore the heap property.
+        Time Complexity: O(d log_d n)
+        Space Complexity: O(1)
+
+        Raises:
+            KeyError: If item is not in the heap.
+        """
+        old_key = self.key_of(item)
+        self.keys[item] = new_key
+        index = self.pos[item]
+        if self._higher(new_key, old_key):
+            self._bubble_up(index)
+        else:
+            self._bubble_down(index)
+
+
+    def decrease_key(self, item: int, new_key: Any) -> None:
+        """
+        Lower the key of item (the Dijkstra / Prim relaxation step).
+        Time Complexity: O(log_d n) for a min-heap, O(d log_d n) for a max-heap
+        Space Complexity: O(1)
+
+        Raises:
+            KeyError: If item is not in the heap.
+            ValueError: If new_key is greater than the current key.
+        """
+        if new_key > self.key_of(item):
+            raise ValueError("New key is greater than the current key")
+        self.update(item, new_key)
+
+
+    def increase_key(self, item: int, new_key: Any) -> None:
+        """
+        Raise the key of item.
+        Time Complexity: O(d log_d n) for a min-heap, O(log_d n) for a max-heap
+        Space Complexity: O(1)
+
+        Raises:
+            KeyError: If item is not in the heap.
+            ValueError: If new_key is smaller than the current key.
+        """
+        if new_key < self.key_of(item):
+            raise ValueError("New key is smaller than the current key")
+        self.update(item, new_key)
+
+
+    def _remove_at(self, index: int) -> None:
+        """
+        Remove the item stored at heap slot index by moving the last item into
+        its place and sifting that item in whichever direction is needed.
+        """
+        removed = self.heap[index]
+        last = self.heap.pop()
+        self.pos[removed] = -1
+        self.keys[removed] = None  # Release the key object
+        if index < len(self.heap):
+            self.heap[index] = last
+            self.pos[last] = index
+            self._bubble_up(index)
+            self._bubble_down(self.pos[last])
+
+
+    def _bubble_up(self, index: int) -> None:
+        """
+        Move the item at index up while it outranks its parent.
+        Uses a hole instead of pairwise swaps: each step is one array write.
+        """
+        heap, pos, keys, d = self.heap, self.pos, self.keys, self.d
+        item = heap[index]
+        key = keys[item]
+        while index > 0:
+            parent = (index - 1) // d
+            parent_item = heap[parent]
+            if not self._higher(key, keys[parent_item]):
+                break
+            heap[index] = parent_item
+            pos[parent_item] = index
+            index = parent
+        heap[index] = item
+        pos[item] = index
+
+
+    def _bubble_down(self, index: int) -> None:
+        """
+        Move the item at index down while one of its d children outranks it.
+        """
+        heap, pos, keys, d = self.heap, self.pos, self.keys, self.d
+        n = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            first = d * index + 1
+            if first >= n:
+                break
+            # Pick the best of up to d consecutive children
+            best = first
+            best_key = keys[heap[first]]
+            for child in range(first + 1, min(first + d, n)):
+                child_key = keys[heap[child]]
+                if self._higher(child_key, best_key):
+                    best, best_key = child, child_key
+            if not self._higher(best_key, key):
+                break
+            heap[index] = heap[best]
+            pos[heap[index]] = index
+            index = best
+        heap[index] = item
+        pos[item] = index
+
+
+    def __len__(self) -> int:
+        """Return the number of items in the heap."""
+        return len(self.heap)
+
+
+    def __str__(self) -> str:
+        """String representation for debugging: (item, key) pairs in heap order."""
+        return str([(item, self.keys[item]) for item in self.heap])
+
+
+if __name__ == "__main__":
+    # Dijkstra-style usage on vertex IDs
+    pq = IndexedHeap(d=4)
+    for vertex, dist in [(0, 7), (1, 3), (2, 9), (3, 5)]:
+        pq.insert(vertex, dist)
+    pq.decrease_key(2, 1)
+    pq.remove(1)
+    print(pq.peek())                          # (2, 1)
+    print([pq.pop() for _ in range(len(pq))])  # [(2, 1), (3, 5), (0, 7)]
@@ -1,18 +1,28 @@
-from typing import List, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 class MaxHeap:
     """
     A Max-Heap implementation using an array (list) for storage.
     Provides O(log n) insertion and extraction of the maximum element.
+
+    An optional key function orders records by key(value) instead of the value
+    itself. Keys are computed once per value and kept in a parallel list, so
+    records never need to be wrapped in (key, value) tuples.
     """
 
-    def __init__(self):
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None):
         """
         Initialize an empty max-heap.
         Time Complexity: O(1)
         Space Complexity: O(1)
+
+        Args:
+            key (callable, optional): Maps a value to the key it is ordered by.
         """
-        self.data: List[int] = []
+        self.key = key
+        self.data: List[Any] = []
+        # keys[i] is the ordering key of data[i]; without a key function it is data itself
+        self.keys: List[Any] = [] if key is not None else self.data
 
     def __len__(self) -> int:
         """
@@ -23,30 +33,42 @@ class MaxHeap:
         return len(self.data)
     
 
-    def insert(self, value: int) -> None:
+    def insert(self, value: Any) -> None:
       """
       Insert a value into the heap, maintaining the max-heap property.
       Time Complexity: O(log n)
       Space Complexity: O(1)
       """
+      if self.key is not None:
+          self.keys.append(self.key(value))  # Key first, so a failing key function changes nothing
       self.data.append(value)
       self._bubble_up(len(self.data) - 1)
 
 
+    def _swap(self, i: int, j: int) -> None:
+      """
+      Swap two slots, keeping the parallel key list in step.
+      """
+      self.data[i], self.data[j] = self.data[j], self.data[i]
+      if self.key is not None:
+          self.keys[i], self.keys[j] = self.keys[j], self.keys[i]
+
+
     def _bubble_up(self, index: int) -> None:
       """
       Move the element at the given index up to restore the max-heap property.
       Time Complexity: O(log n)
       Space Complexity: O(1)
       """
+      keys = self.keys
       parent = (index - 1) // 2
-      while index > 0 and self.data[index] > self.data[parent]:
-          self.data[index], self.data[parent] = self.data[parent], self.data[index]
+      while index > 0 and keys[index] > keys[parent]:
+          self._swap(index, parent)
           index = parent
           parent = (index - 1) // 2
 
 
-    def extract_max(self) -> Optional[int]:
+    def extract_max(self) -> Optional[Any]:
       """
       Remove and return the maximum element from the heap.
       Time Complexity: O(log n)
@@ -56,8 +78,11 @@ class MaxHeap:
           return None
       max_val = self.data[0]
       last_val = self.data.pop()
+      last_key = self.keys.pop() if self.key is not None else last_val
       if self.data:
           self.data[0] = last_val
+          if self.key is not None:
+              self.keys[0] = last_key
           self._bubble_down(0)
       return max_val
 
@@ -68,25 +93,26 @@ class MaxHeap:
       Time Complexity: O(log n)
       Space Complexity: O(1)
       """
+      keys = self.keys
       n = len(self.data)
       while True:
           left = 2 * index + 1
           right = 2 * index + 2
           largest = index
 
-          if left < n and self.data[left] > self.data[largest]:
+          if left < n and keys[left] > keys[largest]:
               largest = left
-          if right < n and self.data[right] > self.data[largest]:
+          if right < n and keys[right] > keys[largest]:
               largest = right
 
           if largest == index:
               break
-          self.data[index], self.data[largest] = self.data[largest], self.data[index]
+          self._swap(index, largest)
           index = largest
 
     
     # In most heap implementations, peek() and get_max() (or top()) are actually the same method under different names.
-    def get_max(self) -> Optional[int]:
+    def get_max(self) -> Optional[Any]:
       """
       Return the maximum element from the heap without removing it.
       Time Complexity: O(1)
@@ -97,7 +123,7 @@ class MaxHeap:
       return self.data[0]
     
 
-    def replace(self, value: int) -> Optional[int]:
+    def replace(self, value: Any) -> Optional[Any]:
       """
       Remove and return the maximum element, replacing it with a new value.
       Restores max-heap property by bubbling down from root.
@@ -105,26 +131,148 @@ class MaxHeap:
       Space Complexity: O(1)
       """
       if not self.data:
-          self.data.append(value)
+          self.insert(value)
           return None  # No previous max to return
+      if self.key is not None:
+          self.keys[0] = self.key(value)
       max_val = self.data[0]
       self.data[0] = value
       self._bubble_down(0)
       return max_val
 
 
-    def heapify(self, elements: List[int]) -> None:
+    def pushpop(self, value: Any) -> Any:
+      """
+      Insert value, then remove and return the maximum, as one operation.
+      Unlike replace(), value itself is returned when it is not smaller than the root.
+      Time Complexity: O(log n)
+      Space Complexity: O(1)
+      """
+      value_key = self.key(value) if self.key is not None else value
+      if not self.data or not self.keys[0] > value_key:
+          return value
+      max_val = self.data[0]
+      self.data[0] = value
+      if self.key is not None:
+          self.keys[0] = value_key
+      self._bubble_down(0)
+      return max_val
+
+
+    def heapify(self, elements: Iterable[Any]) -> None:
       """
       Transform a list of elements into a valid max-heap in O(n) time.
       Time Complexity: O(n)
       Space Complexity: O(n) (for the data list)
       """
-      self.data = elements[:]
+      data = list(elements)
+      # Keys first, so a failing key function leaves the heap untouched
+      keys = [self.key(v) for v in data] if self.key is not None else data
+      self.data, self.keys = data, keys
+      self._build()
+
+
+    def _build(self) -> None:
+      """
+      Restore the heap property for the whole array bottom-up in O(n).
+      """
       n = len(self.data)
       # Start from the last parent and heapify-down each node
       for i in reversed(range(n // 2)):
           self._bubble_down(i)
 
+
+    def push_many(self, elements: Iterable[Any]) -> None:
+      """
+      Insert every element of an iterable.
+      Large batches (at least as big as the heap) are appended and rebuilt
+      bottom-up in O(n + k); small batches are bubbled up one by one.
+      Time Complexity: O(min(k log(n + k), n + k))
+      Space Complexity: O(k)
+      """
+      elements = list(elements)
+      # Keys first, so a failing key function leaves data and keys in step
+      keys = [self.key(v) for v in elements] if self.key is not None else None
+      start = len(self.data)
+      self.data.extend(elements)
+      if keys is not None:
+          self.keys.extend(keys)
+      if len(elements) >= start:
+          self._build()
+      else:
+          for i in range(start, len(self.data)):
+              self._bubble_up(i)
+
+
+    def merge(self, other: "MaxHeap") -> None:
+      """
+      Copy the elements of another MaxHeap into this one (other is not
+      modified) and rebuild the heap bottom-up in O(n + m).
+      Time Complexity: O(n + m)
+      Space Complexity: O(m)
+      """
+      if self.key is not None:
+          if other.key is self.key:
+              keys = other.keys  # Reuse the precomputed keys
+          else:
+              keys = [self.key(v) for v in other.data]
+          self.keys.extend(keys)
+      self.data.extend(other.data)
+      self._build()
+
+
+    def top_k(self, k: int) -> List[Any]:
+      """
+      Return the k largest elements in descending order without modifying the heap.
+
+      Walks the heap best-first: a small candidate heap of slot indices starts
+      at the root, and each popped slot adds its two children as candidates.
+      Time Complexity: O(k log k)
+      Space Complexity: O(k)
+      """
+      n = len(self.data)
+      result: List[Any] = []
+      if k <= 0 or n == 0:
+          return result
+      candidates = MaxHeap(key=self.keys.__getitem__)
+      candidates.insert(0)
+      while candidates and len(result) < k:
+          index = candidates.extract_max()
+          result.append(self.data[index])
+          for child in (2 * index + 1, 2 * index + 2):
+              if child < n:
+                  candidates.insert(child)
+      return result
+
+
+    def nlargest(self, k: int) -> List[Any]:
+      """
+      Return the k largest elements in descending order without modifying the heap.
+      Time Complexity: O(k log k)
+      Space Complexity: O(k)
+      """
+      return self.top_k(k)
+
+
+    def nsmallest(self, k: int) -> List[Any]:
+      """
+      Return the k smallest elements in ascending order without modifying the heap.
+      Keeps a bounded max-heap of the k best elements seen so far.
+      Time Complexity: O(n log k)
+      Space Complexity: O(k)
+      """
+      if k <= 0:
+          return []
+      best = MaxHeap(key=self.key)
+      for value in self.data:
+          if len(best) < k:
+              best.insert(value)
+          else:
+              best.pushpop(value)
+      result = [best.extract_max() for _ in range(len(best))]
+      result.reverse()
+      return result
+
 if __name__ == "__main__":
     print("🔹 Testing heapify with [3, 10, 2, 7, 8, 1, 6]")
     elements = [3, 10, 2, 7, 8, 1, 6]
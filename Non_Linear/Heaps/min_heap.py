@@ -1,28 +1,42 @@
-from typing import List, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 class MinHeap:
     """
     A Min-Heap implementation using an array (list) for storage.
     Provides O(log n) insertion and extraction of the minimum element.
+
+    An optional key function orders records by key(value) instead of the value
+    itself. Keys are computed once per value and kept in a parallel list, so
+    records never need to be wrapped in (key, value) tuples.
     """
 
-    def __init__(self):
-        """Initialize an empty min-heap."""
-        self.data: List[int] = []
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize an empty min-heap.
+
+        Args:
+            key (callable, optional): Maps a value to the key it is ordered by.
+        """
+        self.key = key
+        self.data: List[Any] = []
+        # keys[i] is the ordering key of data[i]; without a key function it is data itself
+        self.keys: List[Any] = [] if key is not None else self.data
 
 
-    def insert(self, value: int) -> None:
+    def insert(self, value: Any) -> None:
         """
         Insert a value into the heap, maintaining the min-heap property.
         Time Complexity: O(log n)
         Space Complexity: O(1)
         """
+        if self.key is not None:
+            self.keys.append(self.key(value)) # key first, so a failing key function changes nothing
         self.data.append(value) # appends the new value at the end of the list to maintain the heap as complete binary tree
-        self._bubble_up(len(self.data) - 1) # Bubble up from new values position 
+        self._bubble_up(len(self.data) - 1) # Bubble up from new values position
         #  The new value might be smaller than its parent, which would break the min-heap property, so we move it up until order is restored.
 
 
-    def extract_min(self) -> Optional[int]:
+    def extract_min(self) -> Optional[Any]:
         """
         Remove and return the minimum element from the heap.
         Time Complexity: O(log n)
@@ -31,16 +45,19 @@ class MinHeap:
         # Handle empty heap
         if not self.data:
             return None
-        min_val = self.data[0] # Stores the first element from the list which is minimum 
+        min_val = self.data[0] # Stores the first element from the list which is minimum
         last_val = self.data.pop() # Removes the last element and stores it
+        last_key = self.keys.pop() if self.key is not None else last_val
         if self.data:
             self.data[0] = last_val
+            if self.key is not None:
+                self.keys[0] = last_key
             self._bubble_down(0) # The last element (now at the root) might be greater than its children, breaking the min-heap rule.
             # Fix this by "bubbling down" from the root using _bubble_down(0).
         return min_val # after restoring the heap order return the value you removed
 
 
-    def get_min(self) -> Optional[int]:
+    def get_min(self) -> Optional[Any]:
         """
         Get the minimum element without removing it.
         Time Complexity: O(1)
@@ -51,17 +68,156 @@ class MinHeap:
         return self.data[0]
 
 
+    def heapify(self, elements: Iterable[Any]) -> None:
+        """
+        Replace the heap contents with the given elements in O(n) time.
+        Time Complexity: O(n)
+        Space Complexity: O(n) (for the data list)
+        """
+        data = list(elements)
+        # Keys first, so a failing key function leaves the heap untouched
+        keys = [self.key(v) for v in data] if self.key is not None else data
+        self.data, self.keys = data, keys
+        self._build()
+
+
+    def push_many(self, elements: Iterable[Any]) -> None:
+        """
+        Insert every element of an iterable.
+        Large batches (at least as big as the heap) are appended and rebuilt
+        bottom-up in O(n + k); small batches are bubbled up one by one.
+        Time Complexity: O(min(k log(n + k), n + k))
+        Space Complexity: O(k)
+        """
+        elements = list(elements)
+        # Keys first, so a failing key function leaves data and keys in step
+        keys = [self.key(v) for v in elements] if self.key is not None else None
+        start = len(self.data)
+        self.data.extend(elements)
+        if keys is not None:
+            self.keys.extend(keys)
+        if len(elements) >= start:
+            self._build()
+        else:
+            for i in range(start, len(self.data)):
+                self._bubble_up(i)
+
+
+    def pushpop(self, value: Any) -> Any:
+        """
+        Insert value, then remove and return the minimum, as one operation.
+        Faster than insert() followed by extract_min(): if value is not larger
+        than the root it is returned immediately, otherwise it replaces the root.
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        value_key = self.key(value) if self.key is not None else value
+        if not self.data or not self.keys[0] < value_key:
+            return value
+        min_val = self.data[0]
+        self.data[0] = value
+        if self.key is not None:
+            self.keys[0] = value_key
+        self._bubble_down(0)
+        return min_val
+
+
+    def merge(self, other: "MinHeap") -> None:
+        """
+        Copy the elements of another MinHeap into this one (other is not
+        modified) and rebuild the heap bottom-up in O(n + m).
+        Time Complexity: O(n + m)
+        Space Complexity: O(m)
+        """
+        if self.key is not None:
+            if other.key is self.key:
+                keys = other.keys  # Reuse the precomputed keys
+            else:
+                keys = [self.key(v) for v in other.data]
+            self.keys.extend(keys)
+        self.data.extend(other.data)
+        self._build()
+
+
+    def top_k(self, k: int) -> List[Any]:
+        """
+        Return the k smallest elements in ascending order without modifying the heap.
+
+        Walks the heap best-first: a small candidate heap of slot indices starts
+        at the root, and each popped slot adds its two children as candidates.
+        Only O(k) slots are ever touched, regardless of the heap size.
+        Time Complexity: O(k log k)
+        Space Complexity: O(k)
+        """
+        n = len(self.data)
+        result: List[Any] = []
+        if k <= 0 or n == 0:
+            return result
+        candidates = MinHeap(key=self.keys.__getitem__)
+        candidates.insert(0)
+        while candidates and len(result) < k:
+            index = candidates.extract_min()
+            result.append(self.data[index])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < n:
+                    candidates.insert(child)
+        return result
+
+
+    def nsmallest(self, k: int) -> List[Any]:
+        """
+        Return the k smallest elements in ascending order without modifying the heap.
+        Time Complexity: O(k log k)
+        Space Complexity: O(k)
+        """
+        return self.top_k(k)
+
+
+    def nlargest(self, k: int) -> List[Any]:
+        """
+        Return the k largest elements in descending order without modifying the heap.
+        Keeps a bounded min-heap of the k best elements seen so far.
+        Time Complexity: O(n log k)
+        Space Complexity: O(k)
+        """
+        if k <= 0:
+            return []
+        best = MinHeap(key=self.key)
+        for value in self.data:
+            if len(best) < k:
+                best.insert(value)
+            else:
+                best.pushpop(value)
+        result = [best.extract_min() for _ in range(len(best))]
+        result.reverse()
+        return result
+
+
+    def _build(self) -> None:
+        """Restore the heap property for the whole array bottom-up in O(n)."""
+        for i in reversed(range(len(self.data) // 2)):
+            self._bubble_down(i)
+
+
+    def _swap(self, i: int, j: int) -> None:
+        """Swap two slots, keeping the parallel key list in step."""
+        self.data[i], self.data[j] = self.data[j], self.data[i]
+        if self.key is not None:
+            self.keys[i], self.keys[j] = self.keys[j], self.keys[i]
+
+
     def _bubble_up(self, index: int) -> None:
         """
         Restore the heap property going up from index.
 
         After append, only one thing can break: the new element might be smaller than its parent. This method moves the element up until the parent is smaller or it reaches the root.
-        
+
         """
+        keys = self.keys
         parent = (index - 1) // 2 # calculates parent index for the current node
         # As long as we’re not at the root (index > 0) and the current value is less than its parent, keep moving up.
-        while index > 0 and self.data[index] < self.data[parent]: 
-            self.data[index], self.data[parent] = self.data[parent], self.data[index] # Swap the current node and its parent.
+        while index > 0 and keys[index] < keys[parent]:
+            self._swap(index, parent) # Swap the current node and its parent.
             # Move up one level and repeat the check.
             index = parent
             parent = (index - 1) // 2
@@ -70,28 +226,29 @@ class MinHeap:
     def _bubble_down(self, index: int) -> None:
         """
         Restore the heap property going down from index.
-        
+
         After removing the min element (the root), we move the last element to the root
 
         This new root might break the min-heap property: it could be larger than its children.
 
         Goal: Move it down to its correct spot so every parent is less than or equal to its children.
-        
+
         """
+        keys = self.keys
         n = len(self.data)
         while True:
             left = 2 * index + 1
             right = 2 * index + 2
             smallest = index
 
-            if left < n and self.data[left] < self.data[smallest]:
+            if left < n and keys[left] < keys[smallest]:
                 smallest = left
-            if right < n and self.data[right] < self.data[smallest]:
+            if right < n and keys[right] < keys[smallest]:
                 smallest = right
 
             if smallest == index:
                 break
-            self.data[index], self.data[smallest] = self.data[smallest], self.data[index]
+            self._swap(index, smallest)
             index = smallest
 
 
@@ -103,4 +260,3 @@ class MinHeap:
     def __str__(self) -> str:
         """String representation for debugging."""
         return str(self.data)
-
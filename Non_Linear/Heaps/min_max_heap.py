@@ -0,0 +1,286 @@
+from typing import Any, Callable, Iterable, List, Optional
+
+class MinMaxHeap:
+    """
+    A Min-Max Heap (double-ended priority queue) using an array (list) for storage.
+
+    Levels alternate: nodes on even levels (the root is level 0) are smaller than
+    everything below them, nodes on odd levels are larger than everything below
+    them. The minimum is therefore the root and the maximum is one of its two
+    children, so one array serves both ends instead of a MinHeap and a MaxHeap
+    kept in sync.
+
+    Optionally bounded: with a capacity, inserting into a full heap evicts the
+    worst element (the maximum by default, or the minimum with evict="min").
+
+    An optional key function orders values by key(value), with the keys kept in
+    a parallel list like MinHeap and MaxHeap.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, evict: str = "max",
+                 key: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize an empty min-max heap.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+
+        Args:
+            capacity (int, optional): Maximum number of elements, or None for unbounded.
+            evict (str): Which end is dropped when a bounded heap is full: "max" or "min".
+            key (callable, optional): Maps a value to the key it is ordered by.
+
+        Raises:
+            ValueError: If capacity < 1 or evict is not "max"/"min".
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if evict not in ("max", "min"):
+            raise ValueError("Evict must be 'max' or 'min'")
+        self.capacity = capacity
+        self.evict = evict
+        self.key = key
+        self.data: List[Any] = []
+        # keys[i] is the ordering key of data[i]; without a key function it is data itself
+        self.keys: List[Any] = [] if key is not None else self.data
+
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the heap.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return len(self.data)
+
+
+    @staticmethod
+    def _is_min_level(index: int) -> bool:
+        """Return True if index lies on a min (even) level."""
+        return (index + 1).bit_length() % 2 == 1
+
+
+    def _swap(self, i: int, j: int) -> None:
+        """Swap two slots, keeping the parallel key list in step."""
+        self.data[i], self.data[j] = self.data[j], self.data[i]
+        if self.key is not None:
+            self.keys[i], self.keys[j] = self.keys[j], self.keys[i]
+
+
+    def _max_index(self) -> int:
+        """Index of the maximum element (the root or the larger of its children)."""
+        n = len(self.data)
+        if n <= 2:
+            return n - 1
+        return 1 if self.keys[1] >= self.keys[2] else 2
+
+
+    def get_min(self) -> Optional[Any]:
+        """
+        Return the minimum element without removing it.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not self.data:
+            return None
+        return self.data[0]
+
+
+    def get_max(self) -> Optional[Any]:
+        """
+        Return the maximum element without removing it.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not self.data:
+            return None
+        return self.data[self._max_index()]
+
+
+    def insert(self, value: Any) -> Optional[Any]:
+        """
+        Insert a value, maintaining the min-max heap property.
+        In a full bounded heap the worst element is evicted and returned; if the
+        new value is itself the worst, it is rejected and returned unchanged.
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+
+        Returns:
+            The evicted element, or None if nothing was evicted.
+        """
+        value_key = self.key(value) if self.key is not None else value
+        if self.capacity is not None and len(self.data) >= self.capacity:
+            if self.evict == "max":
+                worst = self._max_index()
+                if not value_key < self.keys[worst]:
+                    return value
+            else:
+                worst = 0
+                if not value_key > self.keys[0]:
+                    return value
+            evicted = self.data[worst]
+            self.data[worst] = value
+            if self.key is not None:
+                self.keys[worst] = value_key
+            self._fix(worst)
+            return evicted
+
+        self.data.append(value)
+        if self.key is not None:
+            self.keys.append(value_key)
+        self._bubble_up(len(self.data) - 1)
+        return None
+
+
+    def extract_min(self) -> Optional[Any]:
+        """
+        Remove and return the minimum element from the heap.
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        if not self.data:
+            return None
+        return self._remove_at(0)
+
+
+    def extract_max(self) -> Optional[Any]:
+        """
+        Remove and return the maximum element from the heap.
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        if not self.data:
+            return None
+        return self._remove_at(self._max_index())
+
+
+    def heapify(self, elements: Iterable[Any]) -> None:
+        """
+        Replace the heap contents with the given elements in O(n) time.
+        A bounded heap keeps only the best `capacity` elements.
+        Time Complexity: O(n) unbounded, O(n log capacity) when trimming
+        Space Complexity: O(n) (for the data list)
+        """
+        elements = list(elements)
+        limit = len(elements) if self.capacity is None else min(self.capacity, len(elements))
+        self.data = elements[:limit]
+        self.keys = [self.key(v) for v in self.data] if self.key is not None else self.data
+        for i in reversed(range(len(self.data) // 2)):
+            self._bubble_down(i)
+        for value in elements[limit:]:
+            self.insert(value)
+
+
+    def _remove_at(self, index: int) -> Any:
+        """Remove the element at index (the root or a child of the root)."""
+        value = self.data[index]
+        last_val = self.data.pop()
+        last_key = self.keys.pop() if self.key is not None else last_val
+        if index < len(self.data):
+            self.data[index] = last_val
+            if self.key is not None:
+                self.keys[index] = last_key
+            self._fix(index)
+        return value
+
+
+    def _fix(self, index: int) -> None:
+        """
+        Restore the heap after data[index] was overwritten.
+        Index is always the root or one of its children here, so moving the
+        value down (and, for a child of the root, possibly swapping it with the
+        root first) is enough.
+        """
+        if index > 0:
+            parent = (index - 1) // 2
+            keys = self.keys
+            # index is on a max level, its parent (the root) on a min level
+            if keys[index] < keys[parent]:
+                self._swap(index, parent)
+                self._bubble_down(parent)
+        self._bubble_down(index)
+
+
+    def _bubble_up(self, index: int) -> None:
+        """
+        Move a newly appended element up to restore the min-max heap property.
+        First decide whether it belongs among the min or the max levels by
+        comparing with its parent, then climb grandparents on those levels only.
+        Time Complexity: O(log n)
+        """
+        if index == 0:
+            return
+        keys = self.keys
+        parent = (index - 1) // 2
+        if self._is_min_level(index):
+            if keys[index] > keys[parent]:
+                self._swap(index, parent)
+                self._bubble_up_level(parent, larger=True)
+            else:
+                self._bubble_up_level(index, larger=False)
+        else:
+            if keys[index] < keys[parent]:
+                self._swap(index, parent)
+                self._bubble_up_level(parent, larger=False)
+            else:
+                self._bubble_up_level(index, larger=True)
+
+
+    def _bubble_up_level(self, index: int, larger: bool) -> None:
+        """Climb grandparents while the element is smaller (or larger) than them."""
+        keys = self.keys
+        while index > 2:
+            grandparent = ((index - 1) // 2 - 1) // 2
+            if (keys[index] > keys[grandparent]) if larger else (keys[index] < keys[grandparent]):
+                self._swap(index, grandparent)
+                index = grandparent
+            else:
+                break
+
+
+    def _bubble_down(self, index: int) -> None:
+        """
+        Move the element at index down to restore the min-max heap property.
+        On a min level it sinks towards the smallest child/grandchild, on a max
+        level towards the largest.
+        Time Complexity: O(log n)
+        """
+        keys = self.keys
+        n = len(self.data)
+        larger = not self._is_min_level(index)
+        while True:
+            first_child = 2 * index + 1
+            if first_child >= n:
+                return
+            # Best among up to 2 children and 4 grandchildren
+            best = first_child
+            for candidate in (first_child + 1, 2 * first_child + 1, 2 * first_child + 2,
+                              2 * first_child + 3, 2 * first_child + 4):
+                if candidate < n and ((keys[candidate] > keys[best]) if larger else (keys[candidate] < keys[best])):
+                    best = candidate
+
+            if not ((keys[best] > keys[index]) if larger else (keys[best] < keys[index])):
+                return
+            self._swap(best, index)
+            if best <= first_child + 1:
+                return  # A direct child: it has no descendants on our level type
+            parent = (best - 1) // 2
+            if (keys[best] < keys[parent]) if larger else (keys[best] > keys[parent]):
+                self._swap(best, parent)
+            index = best
+
+
+    def __str__(self) -> str:
+        """String representation for debugging."""
+        return str(self.data)
+
+
+if __name__ == "__main__":
+    heap = MinMaxHeap()
+    heap.heapify([7, 3, 9, 1, 5, 8, 2])
+    print(heap.get_min(), heap.get_max())  # 1 9
+    print(heap.extract_max(), heap.extract_min())  # 9 1
+
+    cheapest_three = MinMaxHeap(capacity=3)  # Evicts the most expensive request
+    for cost in [40, 10, 30, 20, 50]:
+        cheapest_three.insert(cost)
+    print(sorted(cheapest_three.data))  # [10, 20, 30]
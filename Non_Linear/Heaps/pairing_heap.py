@@ -0,0 +1,203 @@
+from typing import Any, Callable, List, Optional
+
+
+class PairingNode:
+    """
+    A node of a PairingHeap. insert() returns it as a handle for decrease_key().
+
+    Children are kept as a singly linked list (child -> sibling -> sibling ...);
+    prev points to the left sibling, or to the parent for the first child, so a
+    node can be cut out of the tree in O(1).
+    """
+
+    __slots__ = ("value", "key", "child", "sibling", "prev")
+
+    def __init__(self, value: Any, key: Any):
+        self.value = value
+        self.key = key
+        self.child: Optional["PairingNode"] = None
+        self.sibling: Optional["PairingNode"] = None
+        self.prev: Optional["PairingNode"] = None
+
+
+class PairingHeap:
+    """
+    A min-ordered pairing heap: a heap-ordered multiway tree.
+
+    insert, get_min and meld are O(1); extract_min and decrease_key are
+    O(log n) amortized. Unlike MinHeap, two heaps can be melded in O(1) by
+    linking their roots, which makes it a good fit for sharded priority queues
+    that are periodically combined.
+
+    Method names follow MinHeap. An optional key function orders values by
+    key(value); keys are computed once and stored on the nodes.
+    """
+
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None):
+        """Initialize an empty pairing heap."""
+        self.key = key
+        self.root: Optional[PairingNode] = None
+        self.size = 0
+
+
+    @staticmethod
+    def _link(a: PairingNode, b: PairingNode) -> PairingNode:
+        """
+        Make the root with the larger key the leftmost child of the other one.
+        Both arguments must be detached roots (no siblings, no prev).
+        Time Complexity: O(1)
+        """
+        if b.key < a.key:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+
+    def insert(self, value: Any) -> PairingNode:
+        """
+        Insert a value and return its node handle (needed for decrease_key).
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        node = PairingNode(value, self.key(value) if self.key is not None else value)
+        self.root = node if self.root is None else self._link(self.root, node)
+        self.size += 1
+        return node
+
+
+    def get_min(self) -> Optional[Any]:
+        """
+        Get the minimum element without removing it.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self.root is None:
+            return None
+        return self.root.value
+
+
+    def extract_min(self) -> Optional[Any]:
+        """
+        Remove and return the minimum element from the heap.
+        The root's children are combined with the standard two-pass pairing.
+        Time Complexity: O(log n) amortized
+        Space Complexity: O(n) worst case for the list of the root's children
+        """
+        if self.root is None:
+            return None
+        old_root = self.root
+        self.root = self._merge_pairs(old_root.child)
+        old_root.child = None
+        self.size -= 1
+        return old_root.value
+
+
+    def meld(self, other: "PairingHeap") -> None:
+        """
+        Move every element of another PairingHeap into this one.
+        The other heap is emptied; its node handles stay valid in this heap.
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if other is self or other.root is None:
+            return
+        self.root = other.root if self.root is None else self._link(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+
+    def decrease_key(self, node: PairingNode, new_value: Any) -> None:
+        """
+        Replace the value of a node with one whose key is not larger.
+        The node's subtree is cut from its parent and linked with the root.
+        Time Complexity: O(log n) amortized
+        Space Complexity: O(1)
+
+        Raises:
+            ValueError: If the node is not in the heap (e.g. already extracted)
+                or the new key is greater than the current key.
+        """
+        if node is not self.root and node.prev is None:
+            # Only the root has no prev; any other detached node is not in the heap
+            raise ValueError("Node is not in the heap")
+        new_key = self.key(new_value) if self.key is not None else new_value
+        if node.key < new_key:
+            raise ValueError("New key is greater than the current key")
+        node.value = new_value
+        node.key = new_key
+        if node is self.root:
+            return
+
+        # Cut node (with its subtree) out of its parent's child list
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = None
+        node.sibling = None
+
+        self.root = self._link(self.root, node)
+
+
+    def _merge_pairs(self, first: Optional[PairingNode]) -> Optional[PairingNode]:
+        """
+        Two-pass pairing of a sibling list, done iteratively.
+        Pass 1 links siblings in pairs left to right; pass 2 links the results
+        right to left into a single tree.
+        """
+        if first is None:
+            return None
+        pairs: List[PairingNode] = []
+        current = first
+        while current is not None:
+            a = current
+            b = a.sibling
+            current = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is None:
+                pairs.append(a)
+            else:
+                b.sibling = b.prev = None
+                pairs.append(self._link(a, b))
+
+        root = pairs.pop()
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+
+    def __len__(self) -> int:
+        """Return the number of elements in the heap."""
+        return self.size
+
+
+    def __str__(self) -> str:
+        """String representation for debugging (values in preorder, root first)."""
+        values = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            values.append(node.value)
+            if node.sibling is not None:
+                stack.append(node.sibling)
+            if node.child is not None:
+                stack.append(node.child)
+        return str(values)
+
+
+if __name__ == "__main__":
+    a, b = PairingHeap(), PairingHeap()
+    for v in [7, 3, 9]:
+        a.insert(v)
+    handle = b.insert(8)
+    b.insert(5)
+    a.meld(b)                      # O(1)
+    a.decrease_key(handle, 1)
+    print([a.extract_min() for _ in range(len(a))])  # [1, 3, 5, 7, 9]
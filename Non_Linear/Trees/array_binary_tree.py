@@ -0,0 +1,256 @@
+from array import array
+from typing import Iterable
+
+from Linear.stack import Stack
+
+
+class ArrayBinaryTree:
+    """
+    An implicit complete binary tree stored in a typed array, in level order.
+
+    The node at index i has its children at 2i + 1 and 2i + 2 and its parent at
+    (i - 1) // 2, so there are no Node objects or child pointers at all: a value
+    costs its machine size (8 bytes for the default 'q' typecode) instead of a
+    Python object with three references. Every query below is computed by index
+    arithmetic, iteratively.
+
+    The queries mirror BinaryTree (same names and conventions).
+
+    Attributes:
+        data (array): Values in level order.
+    """
+    def __init__(self, values: Iterable[int] = (), typecode: str = "q"):
+        """
+        Args:
+            values (Iterable[int]): Initial values, in level order.
+            typecode (str): array typecode, e.g. 'q' (int64) or 'd' (float).
+        """
+        self.data = array(typecode, values)
+
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+    def insert(self, value: int) -> None:
+        """
+        Inserts a value at the next free position in level order.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+        self.data.append(value)
+
+
+    def search(self, target: int) -> bool:
+        """
+        Returns True if target is stored.
+
+        Time Complexity: O(n), a linear scan over contiguous memory
+        Space Complexity: O(1)
+        """
+        return target in self.data
+
+
+    def delete(self, target: int) -> bool:
+        """
+        Deletes the first occurrence (in level order) of target by moving the
+        last value into its slot, like BinaryTree.delete.
+
+        Returns:
+            bool: True if deletion successful, False otherwise.
+
+        Time Complexity: O(n) to find target, O(1) to remove
+        Space Complexity: O(1)
+        """
+        index = self._index_of(target)
+        if index < 0:
+            return False
+        last = self.data.pop()
+        if index < len(self.data):
+            self.data[index] = last
+        return True
+
+
+    def _index_of(self, value: int) -> int:
+        """Level-order index of the first occurrence of value, or -1."""
+        for i, v in enumerate(self.data):
+            if v == value:
+                return i
+        return -1
+
+
+    def level_order_traversal(self) -> list[int]:
+        """
+        Returns the values in level order (a copy; see level_order_view()).
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        return self.data.tolist()
+
+
+    def level_order_view(self) -> memoryview:
+        """
+        Returns a zero-copy, read-only view of the values in level order.
+        The array cannot grow or shrink while a view is alive, so release it
+        (or use it in a with block) before inserting or deleting.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return memoryview(self.data).toreadonly()
+
+
+    def preorder(self) -> list[int]:
+        """
+        Performs preorder traversal: Root -> Left -> Right, with an index stack.
+
+        Time Complexity: O(n)
+        Space Complexity: O(log n) for the stack
+        """
+        data, n = self.data, len(self.data)
+        result = []
+        # Unboxed indices; at most one pending sibling per level plus the current path
+        stack = Stack(typecode="l", capacity=n.bit_length() + 1)
+        if n:
+            stack.push(0)
+        while not stack.is_empty():
+            i = stack.pop()
+            result.append(data[i])
+            if 2 * i + 2 < n:
+                stack.push(2 * i + 2)
+            if 2 * i + 1 < n:
+                stack.push(2 * i + 1)
+        return result
+
+
+    def inorder(self) -> list[int]:
+        """
+        Performs inorder traversal: Left -> Root -> Right.
+        No stack is needed: from a node the next one is either the leftmost
+        node of its right subtree, or the first ancestor reached from a left child.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1) besides the result
+        """
+        data, n = self.data, len(self.data)
+        result = []
+        if n == 0:
+            return result
+        i = 0
+        while 2 * i + 1 < n:
+            i = 2 * i + 1
+        while True:
+            result.append(data[i])
+            if 2 * i + 2 < n:
+                i = 2 * i + 2
+                while 2 * i + 1 < n:
+                    i = 2 * i + 1
+                continue
+            # Climb while we are a right child (even index > 0)
+            while i > 0 and i % 2 == 0:
+                i = (i - 1) // 2
+            if i == 0:
+                return result
+            i = (i - 1) // 2
+
+
+    def postorder(self) -> list[int]:
+        """
+        Performs postorder traversal: Left -> Right -> Root
+        (a reversed Root -> Right -> Left preorder).
+
+        Time Complexity: O(n)
+        Space Complexity: O(log n) for the stack
+        """
+        data, n = self.data, len(self.data)
+        result = []
+        # Unboxed indices; at most one pending sibling per level plus the current path
+        stack = Stack(typecode="l", capacity=n.bit_length() + 1)
+        if n:
+            stack.push(0)
+        while not stack.is_empty():
+            i = stack.pop()
+            result.append(data[i])
+            if 2 * i + 1 < n:
+                stack.push(2 * i + 1)
+            if 2 * i + 2 < n:
+                stack.push(2 * i + 2)
+        result.reverse()
+        return result
+
+
+    def height(self) -> int:
+        """
+        Returns the number of levels (0 if empty), as BinaryTree.height does.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return len(self.data).bit_length()
+
+
+    def count_leaf_nodes(self) -> int:
+        """
+        Counts the leaves: exactly the indices i with 2i + 1 >= n.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        n = len(self.data)
+        return n - n // 2
+
+
+    def diameter(self) -> int:
+        """
+        Returns the number of nodes on the longest path between two nodes,
+        as BinaryTree.diameter does. Subtree heights are filled from the last
+        index backwards, so children are always done before their parent.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n) for the heights
+        """
+        n = len(self.data)
+        heights = array("l", [0]) * n
+        best = 0
+        for i in range(n - 1, -1, -1):
+            left = heights[2 * i + 1] if 2 * i + 1 < n else 0
+            right = heights[2 * i + 2] if 2 * i + 2 < n else 0
+            heights[i] = 1 + (left if left > right else right)
+            if left + right + 1 > best:
+                best = left + right + 1
+        return best
+
+
+    def lowest_common_ancestor(self, p_val: int, q_val: int) -> int | None:
+        """
+        Finds the lowest common ancestor of the first occurrences of two values
+        by repeatedly moving the deeper index (the larger one) to its parent.
+
+        Returns:
+            int | None: Value of the LCA. As in BinaryTree, if only one value
+            is present that value is returned, and None if neither is.
+
+        Time Complexity: O(n) to locate the values, O(log n) to climb
+        Space Complexity: O(1)
+        """
+        i, j = self._index_of(p_val), self._index_of(q_val)
+        if i < 0 and j < 0:
+            return None
+        if i < 0 or j < 0:
+            return self.data[max(i, j)]
+        while i != j:
+            if i > j:
+                i = (i - 1) // 2
+            else:
+                j = (j - 1) // 2
+        return self.data[i]
+
+
+if __name__ == "__main__":
+    tree = ArrayBinaryTree(range(1, 8))
+    print(tree.inorder(), tree.height(), tree.diameter())  # [4, 2, 5, 1, 6, 3, 7] 3 5
+    print(tree.lowest_common_ancestor(4, 5), tree.lowest_common_ancestor(4, 7))  # 2 1
+    with tree.level_order_view() as view:
+        print(view[3], view.nbytes)  # 4 56 (7 int64 values, no per-node objects)
@@ -0,0 +1,180 @@
+from Non_Linear.Trees.avl_tree import AVLTree
+from Non_Linear.Trees.bst import BST, BSTNode
+
+
+class AugmentedNode(BSTNode):
+    """
+    BSTNode caching aggregates of the subtree rooted here. The tree recomputes
+    them from the children (see AugmentedBST._update) whenever the subtree changes.
+
+    :param key: Value to store in the node.
+    :param height: Height of the subtree (a leaf has height 0).
+    :param total: Sum of the keys in the subtree.
+    :param min_node / max_node: Nodes holding the smallest / largest key.
+    :param leaves: Number of leaves in the subtree.
+    :param diameter: Edges on the longest path inside the subtree.
+    :param balanced: True if every node of the subtree is height-balanced.
+    :param down: Largest sum of a path going down from this node.
+    :param best: Largest sum of any path inside the subtree.
+    """
+    def __init__(self, key: int):
+        super().__init__(key)
+        self.height = 0
+        self.total = key
+        self.min_node = self.max_node = self
+        self.leaves = 1
+        self.diameter = 0
+        self.balanced = True
+        self.down = self.best = key
+
+
+class AugmentedBST(BST):
+    """
+    Opt-in BST whose nodes cache subtree aggregates (size, height, sum, min,
+    max, leaf count, diameter, balance and path sums).
+
+    BST.insert() and delete() pass the modified path to _repair(), which here
+    recomputes the cached values of those nodes only, bottom-up, through
+    _update(); an update stays O(h). The whole-tree queries that BST answers
+    with a full traversal (sum_nodes, height, leaf_count, is_balanced,
+    diameter, min, max) then just read the root in O(1), and sum_range() is O(h). Use a plain BST when updates dominate and these
+    queries are rare: each node is larger and each update does more work.
+    """
+
+    def _new_node(self, key: int) -> AugmentedNode:
+        return AugmentedNode(key)
+
+
+    def _update(self, node: AugmentedNode) -> None:
+        """Recompute node's cached aggregates from its children."""
+        left, right = node.left, node.right
+        key = node.key
+        if left is None and right is None:
+            node.size, node.height, node.total = 1, 0, key
+            node.min_node = node.max_node = node
+            node.leaves, node.diameter, node.balanced = 1, 0, True
+            node.down = node.best = key
+            return
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+        node.total = key + (left.total if left else 0) + (right.total if right else 0)
+        node.min_node = left.min_node if left else node
+        node.max_node = right.max_node if right else node
+        node.leaves = (left.leaves if left else 0) + (right.leaves if right else 0)
+        node.diameter = max(left.diameter if left else 0, right.diameter if right else 0,
+                            left_height + right_height + 2)
+        node.balanced = ((left is None or left.balanced) and (right is None or right.balanced)
+                         and -1 <= left_height - right_height <= 1)
+        # Path sums as in BinaryTree.max_path_sum: negative branches are dropped
+        left_gain = left.down if left and left.down > 0 else 0
+        right_gain = right.down if right and right.down > 0 else 0
+        node.down = key + (left_gain if left_gain > right_gain else right_gain)
+        node.best = max(key + left_gain + right_gain,
+                        left.best if left else key, right.best if right else key)
+
+
+    def _repair(self, path: list[AugmentedNode], delta: int) -> None:
+        """Recompute the aggregates of the modified path, bottom-up."""
+        for i in range(len(path) - 1, -1, -1):
+            self._update(path[i])
+
+
+    # Whole-tree queries read the root's cache
+
+    def min(self) -> AugmentedNode | None:
+        """Node with the smallest key. Time Complexity: O(1)"""
+        return self.root.min_node if self.root else None
+
+
+    def max(self) -> AugmentedNode | None:
+        """Node with the largest key. Time Complexity: O(1)"""
+        return self.root.max_node if self.root else None
+
+
+    def height(self) -> int:
+        """Height of the tree, -1 if empty. Time Complexity: O(1)"""
+        return self.root.height if self.root else -1
+
+
+    def sum_nodes(self) -> int:
+        """Sum of all keys. Time Complexity: O(1)"""
+        return self.root.total if self.root else 0
+
+
+    def leaf_count(self) -> int:
+        """Number of leaves. Time Complexity: O(1)"""
+        return self.root.leaves if self.root else 0
+
+
+    def is_balanced(self) -> bool:
+        """True if every node is height-balanced. Time Complexity: O(1)"""
+        return self.root.balanced if self.root else True
+
+
+    def diameter(self) -> int:
+        """Edges on the longest path between two nodes. Time Complexity: O(1)"""
+        return self.root.diameter if self.root else 0
+
+
+    def max_path_sum(self) -> int | float:
+        """
+        Largest sum of keys along any path (as BinaryTree.max_path_sum),
+        -inf for an empty tree.
+
+        Time Complexity: O(1)
+        """
+        return self.root.best if self.root else float('-inf')
+
+
+    def sum_range(self, lo: int, hi: int) -> int:
+        """
+        Sum of the keys in [lo, hi] using the cached subtree sums.
+
+        Time Complexity: O(h)
+        Space Complexity: O(1)
+        """
+        if lo > hi:
+            return 0
+        return self._sum_below(hi, inclusive=True) - self._sum_below(lo, inclusive=False)
+
+
+    def _sum_below(self, key: int, inclusive: bool) -> int:
+        """Sum of keys < key (or <= key when inclusive), like BST._count_below."""
+        total = 0
+        current = self.root
+        while current:
+            if key < current.key or (key == current.key and not inclusive):
+                current = current.left
+            else:
+                # current and its whole left subtree are below key
+                total += (current.left.total if current.left else 0) + current.key
+                if key == current.key:
+                    break
+                current = current.right
+        return total
+
+
+class AugmentedAVLTree(AVLTree, AugmentedBST):
+    """
+    AVL tree with AugmentedBST's cached aggregates: AVLTree's _repair() and
+    rotations recompute nodes through _update(), which here refreshes every
+    aggregate, so updates stay O(log n) and the queries stay O(1).
+    """
+    _new_node = AugmentedBST._new_node
+    _update = AugmentedBST._update
+
+
+if __name__ == "__main__":
+    tree = AugmentedBST()
+    for key in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(key)
+    print(tree.sum_nodes(), tree.height(), tree.leaf_count(), tree.diameter())  # 350 2 4 4
+    tree.delete(50)
+    print(tree.root.key, tree.sum_range(25, 65), tree.min(), tree.max())  # 60 130 BSTNode(20) BSTNode(80)
+
+    balanced = AugmentedAVLTree()
+    for key in range(1, 1024):  # Sorted input stays O(log n) per insert
+        balanced.insert(key)
+    print(balanced.height(), balanced.sum_nodes(), balanced.is_balanced())  # 9 523776 True
@@ -0,0 +1,112 @@
+from Non_Linear.Trees.bst import BST, BSTNode
+
+
+class AVLNode(BSTNode):
+    """
+    Node for an AVL tree: a BSTNode that also stores the height of its subtree.
+
+    :param key: Value to store in the node.
+    """
+    def __init__(self, key: int):
+        super().__init__(key)
+        self.height = 0  # A leaf has height 0, an empty subtree -1 (same as BST.height)
+
+
+class AVLTree(BST):
+    """
+    Self-balancing BST (AVL tree).
+
+    After every insert and delete the heights of the two subtrees of any node
+    differ by at most one, restored by single or double rotations on the way
+    back up the search path. The height therefore stays below 1.44·log2(n + 2)
+    whatever the insertion order, so sorted or nearly sorted keys no longer
+    degrade the tree into a linked list.
+
+    Insert and delete are BST's iterative ones (an explicit path instead of
+    recursion), with _repair() rebalancing that path; every query method
+    (search, min, max, inorder, level_order, lowest_common_ancestor, ...) is
+    inherited from BST unchanged.
+    """
+
+    @staticmethod
+    def _height(node: AVLNode | None) -> int:
+        return node.height if node else -1
+
+
+    def _update(self, node: AVLNode) -> None:
+        """Recompute node's cached height and subtree size from its children."""
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+
+    def _new_node(self, key: int) -> AVLNode:
+        return AVLNode(key)
+
+
+    def _rotate_left(self, node: AVLNode) -> AVLNode:
+        """Rotate node down to the left; returns the new subtree root."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+
+    def _rotate_right(self, node: AVLNode) -> AVLNode:
+        """Rotate node down to the right; returns the new subtree root."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """
+        Restore the AVL property at node (its children are already balanced).
+        Returns the root of the (possibly rotated) subtree.
+        Time Complexity: O(1)
+        """
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)  # Left-Right case
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)  # Right-Left case
+            return self._rotate_left(node)
+        return node
+
+
+    def _repair(self, path: list[AVLNode], delta: int) -> None:
+        """
+        Rebalance every node of path (root first) from the bottom up,
+        re-linking rotated subtrees into their parents. BST.insert() and
+        BST.delete() call it with the ancestors of the changed position,
+        which makes both O(log n).
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            subtree = self._rebalance(node)
+            if subtree is node:
+                continue
+            if i == 0:
+                self.root = subtree
+            elif path[i - 1].left is node:
+                path[i - 1].left = subtree
+            else:
+                path[i - 1].right = subtree
+
+
+if __name__ == "__main__":
+    tree = AVLTree()
+    for key in range(1, 1024):  # Sorted input: a plain BST would be a 1023-node chain
+        tree.insert(key)
+    print(tree.height(), tree.is_balanced())  # 9 True
+    for key in range(1, 512):
+        tree.delete(key)
+    print(tree.min(), tree.height())  # BSTNode(512) 9
@@ -1,3 +1,10 @@
+from typing import Any, BinaryIO, Iterable
+
+from Linear.deque import Deque
+from Linear.stack import Stack
+from Non_Linear.Trees.tree_codec import decode_tree, encode_tree
+
+
 class Node:
     """
     Represents a single node in a binary tree.
@@ -65,15 +72,19 @@ class BinaryTree:
         Returns:
             list[int]: Inorder sequence of node values.
 
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(n), values are appended (no list concatenation per level)
+        Space Complexity: O(n) for the result, O(h) for the explicit stack
         """
-        def _inorder(node: Node) -> list[int]:
-            if not node:
-                return []
-            return _inorder(node.left) + [node.value] + _inorder(node.right)
-
-        return _inorder(self.root)
+        result, stack = [], Stack()
+        current = self.root
+        while current or not stack.is_empty():
+            while current:
+                stack.push(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current.value)
+            current = current.right
+        return result
 
 
     def preorder(self) -> list[int]:
@@ -84,14 +95,19 @@ class BinaryTree:
             list[int]: Preorder sequence of node values.
 
         Time Complexity: O(n)
-        Space Complexity: O(n)
+        Space Complexity: O(n) for the result, O(h) for the explicit stack
         """
-        def _preorder(node: Node) -> list[int]:
-            if not node:
-                return []
-            return [node.value] + _preorder(node.left) + _preorder(node.right)
-
-        return _preorder(self.root)
+        result, stack = [], Stack()
+        if self.root:
+            stack.push(self.root)
+        while not stack.is_empty():
+            current = stack.pop()
+            result.append(current.value)
+            if current.right:
+                stack.push(current.right)
+            if current.left:
+                stack.push(current.left)
+        return result
 
 
     def postorder(self) -> list[int]:
@@ -102,14 +118,21 @@ class BinaryTree:
             list[int]: Postorder sequence of node values.
 
         Time Complexity: O(n)
-        Space Complexity: O(n)
-        """
-        def _postorder(node: Node) -> list[int]:
-            if not node:
-                return []
-            return _postorder(node.left) + _postorder(node.right) + [node.value]
-
-        return _postorder(self.root)
+        Space Complexity: O(n) for the result, O(h) for the explicit stack
+        """
+        # Root -> Right -> Left preorder, reversed
+        result, stack = [], Stack()
+        if self.root:
+            stack.push(self.root)
+        while not stack.is_empty():
+            current = stack.pop()
+            result.append(current.value)
+            if current.left:
+                stack.push(current.left)
+            if current.right:
+                stack.push(current.right)
+        result.reverse()
+        return result
 
 
     def level_order_traversal(self) -> list[int]:
@@ -550,3 +573,238 @@ class BinaryTree:
 
         _dfs(self.root, [], 0)
         return self.min_path
+
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the tree (exact shape and values) in the compact binary format
+        of tree_codec: 2 shape bits per node in preorder, then the values.
+
+        Returns:
+            bytes: The encoded tree.
+
+        Raises:
+            TypeError: If a value is not None, bool, int, float, str or bytes.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        return encode_tree(self.root, lambda node: node.value)
+
+
+    @classmethod
+    def from_bytes(cls, data: "bytes | BinaryIO") -> "BinaryTree":
+        """
+        Rebuilds a tree written by to_bytes() from bytes or a binary stream.
+
+        Raises:
+            ValueError: If data is not an encoded tree.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        tree = cls()
+        tree.root, _, _ = decode_tree(data, Node)
+        return tree
+
+
+    def save(self, path: str) -> None:
+        """
+        Writes the tree to a file in the to_bytes() format.
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+    @classmethod
+    def load(cls, path: str) -> "BinaryTree":
+        """
+        Reads a tree written by save(), decoding the file as a stream.
+        """
+        with open(path, "rb") as f:
+            return cls.from_bytes(f)
+
+
+class CompleteBinaryTree(BinaryTree):
+    """
+    A binary tree kept complete: every level is full except possibly the last,
+    which is filled from the left (the shape of a binary heap).
+
+    Besides the inherited queries it tracks
+      - size: the number of nodes, so the node at level-order index i is
+        reached by following the bits of i + 1 below its leading 1
+        (0 = left, 1 = right) in O(log n),
+      - frontier: a Deque of the nodes that still have a free child slot, in
+        level order. Its front is always the parent of the next insert and its
+        back is always the last node.
+
+    insert() is O(1) instead of a BFS from the root, and delete() finds the
+    node to swap in (the last one) in O(log n) instead of scanning the tree.
+    """
+    def __init__(self, values: Iterable[Any] = ()):
+        super().__init__()
+        self.size = 0
+        self.frontier = Deque()  # Nodes with a free child slot, in level order
+        for value in values:
+            self.insert(value)
+
+
+    def __len__(self) -> int:
+        return self.size
+
+
+    def insert(self, value: int) -> None:
+        """
+        Inserts a value at the next free position in level order.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        new_node = Node(value)
+        if self.root is None:
+            self.root = new_node
+        else:
+            parent = self.frontier.peek_left()
+            if parent.left is None:
+                parent.left = new_node
+            else:
+                parent.right = new_node
+                self.frontier.pop_left()  # Both slots now used
+        self.frontier.append_right(new_node)
+        self.size += 1
+
+
+    def node_at(self, index: int) -> Node:
+        """
+        Returns the node at a level-order index (0 = root).
+
+        Raises:
+            IndexError: If index is not in [0, size).
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("Level-order index out of range")
+        position = index + 1
+        node = self.root
+        for shift in range(position.bit_length() - 2, -1, -1):
+            node = node.right if (position >> shift) & 1 else node.left
+        return node
+
+
+    def delete(self, target: int) -> bool:
+        """
+        Deletes the first node (in level order) holding target by moving the
+        last node's value into it and removing the last node.
+
+        Returns:
+            bool: True if deletion successful, False otherwise.
+
+        Time Complexity: O(k + log n), k = level-order position of target
+        Space Complexity: O(k) for the BFS queue
+        """
+        target_node = self._find(target)
+        if target_node is None:
+            return False
+
+        last_index = self.size - 1
+        if last_index == 0:
+            self.root = None
+            self.frontier = Deque()
+            self.size = 0
+            return True
+
+        parent = self.node_at((last_index - 1) // 2)
+        last = parent.left if last_index % 2 == 1 else parent.right
+        target_node.value = last.value
+
+        self.frontier.pop_right()  # The last node is always the frontier's back
+        if last is parent.right:
+            parent.right = None
+            self.frontier.append_left(parent)  # Parent has a free slot again, and it is the first one
+        else:
+            parent.left = None  # Parent already was the frontier's front
+        self.size -= 1
+        return True
+
+
+    def _find(self, target: int) -> Node | None:
+        """Level-order search that stops at the first match."""
+        if self.root is None:
+            return None
+        queue = [self.root]
+        front = 0
+        while front < len(queue):
+            current = queue[front]
+            front += 1
+            if current.value == target:
+                return current
+            if current.left:
+                queue.append(current.left)
+            if current.right:
+                queue.append(current.right)
+        return None
+
+
+    def rebuild_index(self) -> None:
+        """
+        Recomputes size and frontier from the nodes under root, e.g. after the
+        tree was assembled by hand.
+
+        Raises:
+            ValueError: If the tree is not complete.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        self.size = 0
+        self.frontier = Deque()
+        if self.root is None:
+            return
+        queue = [self.root]
+        front = 0
+        gap_seen = False  # A missing child was seen; every later slot must be empty
+        while front < len(queue):
+            current = queue[front]
+            front += 1
+            for child in (current.left, current.right):
+                if child is None:
+                    gap_seen = True
+                elif gap_seen:
+                    raise ValueError("Tree is not complete")
+                else:
+                    queue.append(child)
+            if current.left is None or current.right is None:
+                self.frontier.append_right(current)
+        self.size = len(queue)
+
+
+    def mirror(self) -> None:
+        """
+        Mirrors the tree in place and rebuilds size and frontier. Only a
+        perfect tree (every level full) is still complete once mirrored.
+
+        Raises:
+            ValueError: If the tree is not perfect (it is left unchanged).
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        if self.size & (self.size + 1):
+            raise ValueError("Mirroring would make the tree incomplete")
+        super().mirror()
+        self.rebuild_index()
+
+
+    @classmethod
+    def from_bytes(cls, data: "bytes | BinaryIO") -> "CompleteBinaryTree":
+        """
+        Rebuilds a tree written by to_bytes() and restores size and frontier.
+
+        Raises:
+            ValueError: If data is not an encoded tree or not a complete tree.
+        """
+        tree = super().from_bytes(data)
+        tree.rebuild_index()
+        return tree
@@ -0,0 +1,714 @@
+import io
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator
+
+from Non_Linear.Trees.tree_codec import Reader, write_value, write_varint
+
+
+class BPlusLeaf:
+    """
+    Leaf of a B+-tree: sorted keys with their values, chained to the next leaf.
+
+    :param keys: Sorted keys.
+    :param values: values[i] belongs to keys[i].
+    :param next: Page id of the right sibling leaf, or -1.
+    """
+    __slots__ = ("keys", "values", "next")
+
+    def __init__(self, keys: list | None = None, values: list | None = None, next: int = -1):
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        self.next = next
+
+
+class BPlusInternal:
+    """
+    Internal node of a B+-tree: children[i] holds the keys k with
+    keys[i-1] <= k < keys[i]. Children are page ids, not objects.
+    """
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys: list | None = None, children: list | None = None):
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+
+
+class MemoryPager:
+    """
+    Keeps B+-tree nodes in a Python list indexed by page id.
+    """
+
+    def __init__(self):
+        self.pages: list = []
+        self.free_pages: list[int] = []
+        self.meta = None  # Nothing to reopen
+
+    def allocate(self, node) -> int:
+        """Store a new node and return its page id."""
+        if self.free_pages:
+            page_id = self.free_pages.pop()
+            self.pages[page_id] = node
+            return page_id
+        self.pages.append(node)
+        return len(self.pages) - 1
+
+    def read(self, page_id: int):
+        return self.pages[page_id]
+
+    def write(self, page_id: int, node) -> None:
+        """Record that node (the object stored at page_id) was modified."""
+        self.pages[page_id] = node
+
+    def free(self, page_id: int) -> None:
+        self.pages[page_id] = None
+        self.free_pages.append(page_id)
+
+    def check(self, key, value, max_keys: int) -> None:
+        pass  # Any key and value can be kept in memory
+
+    def flush(self, meta: tuple) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _CacheEntry:
+    """Doubly linked LRU list entry for one cached page."""
+    __slots__ = ("page_id", "node", "dirty", "prev", "next")
+
+    def __init__(self, page_id: int, node, dirty: bool):
+        self.page_id = page_id
+        self.node = node
+        self.dirty = dirty
+        self.prev = None
+        self.next = None
+
+
+class FilePager:
+    """
+    Stores B+-tree nodes in fixed-size pages of a file, with an LRU cache of
+    decoded nodes in front of it.
+
+    Page 0 is a header (magic, page size, tree metadata, free-list head);
+    every other page holds one node, length-prefixed: a packed node header
+    (leaf flag, key count, next leaf), the keys, then the child page ids as
+    varints or the values, keys and values as tree_codec tagged values
+    (None, bool, int, float, str, bytes). Modified pages stay in
+    the cache marked dirty and are written back when evicted or on flush(),
+    so only `cache_pages` nodes are ever held in memory and the index can be
+    larger than RAM.
+
+    The cache is a dict from page id to entry plus a doubly linked list with
+    the most recently used entry at the head.
+    """
+
+    MAGIC = b"BPTREE01"
+    # magic, page size, order, root page, height, key count, page count, free-list head
+    _HEADER = struct.Struct("<8sIIqqqqq")
+    _LENGTH = struct.Struct("<I")
+    _FREE = struct.Struct("<Iq")  # Zero length marks a free page, followed by the next free page
+    _NODE = struct.Struct("<BIq")  # Leaf flag, key count, next leaf (-1 for internal nodes)
+    _MAX_VARINT = 10  # Longest varint of a 64-bit page id
+
+    def __init__(self, path: str, page_size: int = 4096, cache_pages: int = 128):
+        """
+        Opens path, creating it if it does not exist.
+
+        Raises:
+            ValueError: If cache_pages < 1, the page size is too small, or the
+                file is not a B+-tree file.
+        """
+        if cache_pages < 1:
+            raise ValueError("cache_pages must be at least 1")
+        self.cache_pages = cache_pages
+        self.cache: dict[int, _CacheEntry] = {}
+        self.head = _CacheEntry(-1, None, False)  # Sentinel: head.next is most recent
+        self.head.next = self.head.prev = self.head
+        self.meta = None  # (order, root, height, count) of an existing file
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            header = self.file.read(self._HEADER.size)
+            magic, page_size, order, root, height, count, page_count, free_head = self._HEADER.unpack(header)
+            if magic != self.MAGIC:
+                self.file.close()
+                raise ValueError("Not a B+-tree file")
+            self.meta = (order, root, height, count)
+        else:
+            if page_size < self._HEADER.size:
+                self.file.close()
+                raise ValueError("page_size is too small")
+            page_count, free_head = 1, -1
+        self.page_size = page_size
+        self.page_count = page_count
+        self.free_head = free_head
+
+
+    # LRU list helpers
+
+    def _unlink(self, entry: _CacheEntry) -> None:
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _push_front(self, entry: _CacheEntry) -> None:
+        entry.prev = self.head
+        entry.next = self.head.next
+        self.head.next.prev = entry
+        self.head.next = entry
+
+    def _cache(self, page_id: int, node, dirty: bool) -> None:
+        entry = self.cache.get(page_id)
+        if entry is not None:
+            self._unlink(entry)
+            entry.node = node
+            entry.dirty = entry.dirty or dirty
+        else:
+            entry = _CacheEntry(page_id, node, dirty)
+            self.cache[page_id] = entry
+        self._push_front(entry)
+        while len(self.cache) > self.cache_pages:
+            victim = self.head.prev  # Least recently used
+            if victim.dirty:
+                # Write before dropping the entry, so a failed write loses nothing
+                self._write_page(victim.page_id, victim.node)
+                victim.dirty = False
+            self._unlink(victim)
+            del self.cache[victim.page_id]
+
+
+    # Page I/O
+
+    def _write_page(self, page_id: int, node) -> None:
+        """
+        Raises:
+            TypeError: If a key or value is not None, bool, int, float, str or bytes.
+            ValueError: If the node does not fit in a page.
+        """
+        leaf = isinstance(node, BPlusLeaf)
+        payload = bytearray(self._NODE.pack(leaf, len(node.keys), node.next if leaf else -1))
+        for key in node.keys:
+            write_value(payload, key)
+        if leaf:
+            for value in node.values:
+                write_value(payload, value)
+        else:
+            for child in node.children:
+                write_varint(payload, child)
+        if self._LENGTH.size + len(payload) > self.page_size:
+            raise ValueError("Node does not fit in a page; use a smaller order or a larger page_size")
+        self.file.seek(page_id * self.page_size)
+        self.file.write(self._LENGTH.pack(len(payload)) + payload)
+
+    def _read_page(self, page_id: int):
+        """
+        Raises:
+            ValueError: If the page is not a valid node record.
+        """
+        self.file.seek(page_id * self.page_size)
+        data = self.file.read(self.page_size)
+        if len(data) < self._LENGTH.size + self._NODE.size:
+            raise ValueError("Corrupt B+-tree page")
+        (length,) = self._LENGTH.unpack_from(data, 0)
+        if not self._NODE.size <= length <= len(data) - self._LENGTH.size:
+            raise ValueError("Corrupt B+-tree page")
+        leaf, count, next_id = self._NODE.unpack_from(data, self._LENGTH.size)
+        start = self._LENGTH.size + self._NODE.size
+        reader = Reader(io.BytesIO(data[start:self._LENGTH.size + length]))
+        keys = [reader.read_value() for _ in range(count)]
+        if leaf:
+            return BPlusLeaf(keys, [reader.read_value() for _ in range(count)], next_id)
+        return BPlusInternal(keys, [reader.read_varint() for _ in range(count + 1)])
+
+
+    # Pager interface
+
+    def allocate(self, node) -> int:
+        """Store a new node and return its page id (reusing a freed page if any)."""
+        if self.free_head != -1:
+            page_id = self.free_head
+            self.file.seek(page_id * self.page_size)
+            _, self.free_head = self._FREE.unpack(self.file.read(self._FREE.size))
+        else:
+            page_id = self.page_count
+            self.page_count += 1
+        self._cache(page_id, node, dirty=True)
+        return page_id
+
+    def read(self, page_id: int):
+        entry = self.cache.get(page_id)
+        if entry is not None:
+            self._unlink(entry)
+            self._push_front(entry)
+            return entry.node
+        node = self._read_page(page_id)
+        self._cache(page_id, node, dirty=False)
+        return node
+
+    def write(self, page_id: int, node) -> None:
+        """Mark node (the object stored at page_id) as modified."""
+        self._cache(page_id, node, dirty=True)
+
+    def check(self, key, value, max_keys: int) -> None:
+        """
+        Checks, before the tree changes, that key and value can be written
+        back later. The bound is the worst case of a node with max_keys
+        entries this large: a full leaf, or a full internal node with this
+        key as every separator and 10-byte child ids. If every entry passes,
+        every node of the tree fits in a page.
+
+        Raises:
+            TypeError: If key or value is not None, bool, int, float, str or bytes.
+            ValueError: If a full node of such entries would not fit in a page.
+        """
+        scratch = bytearray()
+        write_value(scratch, key)
+        key_size = len(scratch)
+        write_value(scratch, value)
+        entry = max(len(scratch), key_size + self._MAX_VARINT)
+        if self._LENGTH.size + self._NODE.size + max_keys * entry + self._MAX_VARINT > self.page_size:
+            raise ValueError("Key and value are too large for a page; "
+                             "use a smaller order or a larger page_size")
+
+    def free(self, page_id: int) -> None:
+        entry = self.cache.pop(page_id, None)
+        if entry is not None:
+            self._unlink(entry)
+        self.file.seek(page_id * self.page_size)
+        self.file.write(self._FREE.pack(0, self.free_head))
+        self.free_head = page_id
+
+    def flush(self, meta: tuple) -> None:
+        """Write every dirty page and the header (meta = order, root, height, count)."""
+        entry = self.head.next
+        while entry is not self.head:
+            if entry.dirty:
+                self._write_page(entry.page_id, entry.node)
+                entry.dirty = False
+            entry = entry.next
+        self.file.seek(0)
+        self.file.write(self._HEADER.pack(self.MAGIC, self.page_size, *meta,
+                                          self.page_count, self.free_head))
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class BPlusTree:
+    """
+    B+-tree ordered map.
+
+    Keys live only in the leaves, which are chained left to right, so a range
+    scan is one descent followed by a walk along the leaf chain. Each node
+    holds up to order - 1 keys, so the height is about log_{order/2}(n) and a
+    lookup touches a handful of wide nodes instead of ~log2(n) BSTNodes.
+
+    Nodes are addressed by page id through a pager: in memory by default, or
+    in a file (pass `path`) with an LRU cache of `cache_pages` decoded pages.
+
+    The query API follows BST: search, contains, insert, delete, min, max,
+    iteration and iter_range, plus from_sorted() for bulk loading.
+    """
+
+    def __init__(self, order: int = 64, path: str | None = None,
+                 page_size: int = 4096, cache_pages: int = 128):
+        """
+        Create an empty tree, or open the tree stored at path.
+
+        Args:
+            order (int): Maximum number of children of an internal node (>= 3).
+                Ignored when an existing file is opened (its own order is used).
+            path (str, optional): File backing the tree; None keeps it in memory.
+            page_size (int): Bytes per page for a new file.
+            cache_pages (int): Number of pages kept in the LRU cache.
+
+        Raises:
+            ValueError: If order < 3.
+        """
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        if path is None:
+            self.pager = MemoryPager()
+        else:
+            self.pager = FilePager(path, page_size, cache_pages)
+
+        if self.pager.meta is not None:
+            self.order, self.root, self._height, self.count = self.pager.meta
+        else:
+            self.order = order
+            self.root = self.pager.allocate(BPlusLeaf())
+            self._height = 0   # Number of internal levels above the leaves
+            self.count = 0
+        self.max_keys = self.order - 1
+        self.min_keys = self.max_keys // 2
+
+
+    def __len__(self) -> int:
+        return self.count
+
+
+    def height(self) -> int:
+        """Number of levels below the root (0 when the root is a leaf)."""
+        return self._height
+
+
+    def _find_leaf(self, key: Any) -> tuple[int, BPlusLeaf]:
+        """Descend to the leaf that would hold key. Time: O(log n)"""
+        page_id = self.root
+        node = self.pager.read(page_id)
+        while isinstance(node, BPlusInternal):
+            page_id = node.children[bisect_right(node.keys, key)]
+            node = self.pager.read(page_id)
+        return page_id, node
+
+
+    def search(self, key: Any) -> Any:
+        """
+        Find the value stored under key.
+
+        Returns:
+            The value, or None if key is absent.
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        _, leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return None
+
+
+    def contains(self, key: Any) -> bool:
+        """Check if key is stored. Time Complexity: O(log n)"""
+        _, leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+
+    def __contains__(self, key: Any) -> bool:
+        return self.contains(key)
+
+
+    def min(self) -> Any:
+        """Smallest key, or None if the tree is empty. Time Complexity: O(log n)"""
+        node = self.pager.read(self.root)
+        while isinstance(node, BPlusInternal):
+            node = self.pager.read(node.children[0])
+        return node.keys[0] if node.keys else None
+
+
+    def max(self) -> Any:
+        """Largest key, or None if the tree is empty. Time Complexity: O(log n)"""
+        node = self.pager.read(self.root)
+        while isinstance(node, BPlusInternal):
+            node = self.pager.read(node.children[-1])
+        return node.keys[-1] if node.keys else None
+
+
+    def insert(self, key: Any, value: Any = None) -> None:
+        """
+        Insert key with value, replacing the value if key is already stored.
+        A full node is split in two and its separator pushed into the parent;
+        a split root makes the tree one level taller.
+
+        Raises:
+            TypeError: If the tree is file-backed and key or value is not
+                None, bool, int, float, str or bytes.
+            ValueError: If the tree is file-backed and key and value are too
+                large for a full node to fit in a page. The tree is unchanged.
+
+        Time Complexity: O(order · log n)
+        Space Complexity: O(log n) for the search path
+        """
+        self.pager.check(key, value, self.max_keys)
+        path = []  # (page id, internal node, child index) from the root down
+        page_id = self.root
+        node = self.pager.read(page_id)
+        while isinstance(node, BPlusInternal):
+            i = bisect_right(node.keys, key)
+            path.append((page_id, node, i))
+            page_id = node.children[i]
+            node = self.pager.read(page_id)
+
+        i = bisect_left(node.keys, key)
+        if i < len(node.keys) and node.keys[i] == key:
+            node.values[i] = value
+            self.pager.write(page_id, node)
+            return
+        node.keys.insert(i, key)
+        node.values.insert(i, value)
+        self.count += 1
+        self.pager.write(page_id, node)
+        if len(node.keys) <= self.max_keys:
+            return
+
+        # Split the leaf; the right half's first key is copied up
+        mid = len(node.keys) // 2
+        right = BPlusLeaf(node.keys[mid:], node.values[mid:], node.next)
+        del node.keys[mid:], node.values[mid:]
+        right_id = self.pager.allocate(right)
+        node.next = right_id
+        self.pager.write(page_id, node)
+        separator = right.keys[0]
+
+        while path:
+            parent_id, parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right_id)
+            self.pager.write(parent_id, parent)
+            if len(parent.keys) <= self.max_keys:
+                return
+            # Split the internal node; the middle key moves up
+            mid = len(parent.keys) // 2
+            separator = parent.keys[mid]
+            right = BPlusInternal(parent.keys[mid + 1:], parent.children[mid + 1:])
+            del parent.keys[mid:], parent.children[mid + 1:]
+            self.pager.write(parent_id, parent)
+            right_id = self.pager.allocate(right)
+
+        # The root itself was split
+        self.root = self.pager.allocate(BPlusInternal([separator], [self.root, right_id]))
+        self._height += 1
+
+
+    def delete(self, key: Any) -> None:
+        """
+        Delete key (missing keys are ignored).
+        An underfull node borrows a key from a sibling when it can, otherwise
+        it is merged with one; a root left with a single child is removed.
+
+        Time Complexity: O(order · log n)
+        Space Complexity: O(log n) for the search path
+        """
+        path = []
+        page_id = self.root
+        node = self.pager.read(page_id)
+        while isinstance(node, BPlusInternal):
+            i = bisect_right(node.keys, key)
+            path.append((page_id, node, i))
+            page_id = node.children[i]
+            node = self.pager.read(page_id)
+
+        i = bisect_left(node.keys, key)
+        if i == len(node.keys) or node.keys[i] != key:
+            return
+        del node.keys[i], node.values[i]
+        self.count -= 1
+        self.pager.write(page_id, node)
+
+        while path and len(node.keys) < self.min_keys:
+            parent_id, parent, i = path.pop()
+            self._fix_underflow(parent_id, parent, i, page_id, node)
+            page_id, node = parent_id, parent
+
+        root = self.pager.read(self.root)
+        if isinstance(root, BPlusInternal) and not root.keys:
+            old_root = self.root
+            self.root = root.children[0]
+            self.pager.free(old_root)
+            self._height -= 1
+
+
+    def _fix_underflow(self, parent_id: int, parent: BPlusInternal, i: int,
+                       node_id: int, node) -> None:
+        """Repair parent.children[i] (node), which has fewer than min_keys keys."""
+        is_leaf = isinstance(node, BPlusLeaf)
+        if i > 0:
+            left_id = parent.children[i - 1]
+            left = self.pager.read(left_id)
+            if len(left.keys) > self.min_keys:
+                # Borrow the last entry of the left sibling
+                if is_leaf:
+                    node.keys.insert(0, left.keys.pop())
+                    node.values.insert(0, left.values.pop())
+                    parent.keys[i - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent.keys[i - 1])
+                    parent.keys[i - 1] = left.keys.pop()
+                    node.children.insert(0, left.children.pop())
+                for pid, n in ((left_id, left), (node_id, node), (parent_id, parent)):
+                    self.pager.write(pid, n)
+                return
+        if i + 1 < len(parent.children):
+            right_id = parent.children[i + 1]
+            right = self.pager.read(right_id)
+            if len(right.keys) > self.min_keys:
+                # Borrow the first entry of the right sibling
+                if is_leaf:
+                    node.keys.append(right.keys.pop(0))
+                    node.values.append(right.values.pop(0))
+                    parent.keys[i] = right.keys[0]
+                else:
+                    node.keys.append(parent.keys[i])
+                    parent.keys[i] = right.keys.pop(0)
+                    node.children.append(right.children.pop(0))
+                for pid, n in ((right_id, right), (node_id, node), (parent_id, parent)):
+                    self.pager.write(pid, n)
+                return
+
+        # No sibling can spare a key: merge with one (left into right order)
+        if i > 0:
+            left_id, left, right_id, right, sep = parent.children[i - 1], left, node_id, node, i - 1
+        else:
+            left_id, left, right_id, right, sep = node_id, node, parent.children[1], right, 0
+        if is_leaf:
+            left.keys.extend(right.keys)
+            left.values.extend(right.values)
+            left.next = right.next
+        else:
+            left.keys.append(parent.keys[sep])
+            left.keys.extend(right.keys)
+            left.children.extend(right.children)
+        del parent.keys[sep], parent.children[sep + 1]
+        self.pager.write(left_id, left)
+        self.pager.write(parent_id, parent)
+        self.pager.free(right_id)
+
+
+    def iter_range(self, lo: Any = None, hi: Any = None) -> Iterator[tuple[Any, Any]]:
+        """
+        Iterate over (key, value) pairs with lo <= key <= hi in ascending order.
+        A bound of None means unbounded on that side.
+        One descent finds the first leaf, then the leaf chain is followed.
+
+        Time Complexity: O(log n + k), k = number of pairs yielded
+        Space Complexity: O(1)
+        """
+        if lo is None:
+            node = self.pager.read(self.root)
+            while isinstance(node, BPlusInternal):
+                node = self.pager.read(node.children[0])
+            i = 0
+        else:
+            _, node = self._find_leaf(lo)
+            i = bisect_left(node.keys, lo)
+        while True:
+            keys, values = node.keys, node.values
+            while i < len(keys):
+                if hi is not None and keys[i] > hi:
+                    return
+                yield keys[i], values[i]
+                i += 1
+            if node.next == -1:
+                return
+            node = self.pager.read(node.next)
+            i = 0
+
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """Iterate over all (key, value) pairs in key order."""
+        return self.iter_range()
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys in ascending order."""
+        for key, _ in self.iter_range():
+            yield key
+
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[tuple[Any, Any]], order: int = 64, **pager_options) -> "BPlusTree":
+        """
+        Bulk-load a tree from (key, value) pairs in strictly increasing key order.
+        Leaves are packed full and each internal level is built from the one
+        below, instead of n separate inserts with their splits.
+
+        Args:
+            items: (key, value) pairs sorted by key.
+            order (int): Fanout of the new tree.
+            pager_options: path / page_size / cache_pages, as for the constructor
+                (the file must not already hold a tree).
+
+        Raises:
+            ValueError: If the keys are not strictly increasing, the file
+                already holds a tree, or a key and value are too large for a page.
+            TypeError: If the tree is file-backed and a key or value is not
+                None, bool, int, float, str or bytes.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n / order) besides the tree
+        """
+        tree = cls(order, **pager_options)
+        keys, values = [], []
+        try:
+            if tree.count:
+                raise ValueError("from_sorted needs an empty tree")
+            for key, value in items:
+                if keys and not keys[-1] < key:
+                    raise ValueError("Keys must be strictly increasing")
+                tree.pager.check(key, value, tree.max_keys)
+                keys.append(key)
+                values.append(value)
+        except BaseException:
+            tree.pager.close()  # Leave an existing file untouched
+            raise
+        if not keys:
+            return tree
+
+        def chunks(n: int, capacity: int, minimum: int) -> list[tuple[int, int]]:
+            """Split n entries into ranges of at most capacity and at least minimum."""
+            bounds = [(start, min(start + capacity, n)) for start in range(0, n, capacity)]
+            if len(bounds) > 1 and bounds[-1][1] - bounds[-1][0] < minimum:
+                # Even out the last two chunks
+                (a, _), (_, b) = bounds[-2], bounds[-1]
+                middle = (a + b) // 2
+                bounds[-2:] = [(a, middle), (middle, b)]
+            return bounds
+
+        # Leaves, chained left to right; the first leaf reuses the empty root page
+        level = []  # (page id, smallest key in subtree)
+        leaf_ranges = chunks(len(keys), tree.max_keys, tree.min_keys)
+        page_ids = [tree.root] + [tree.pager.allocate(BPlusLeaf()) for _ in leaf_ranges[1:]]
+        for n, (start, end) in enumerate(leaf_ranges):
+            next_id = page_ids[n + 1] if n + 1 < len(page_ids) else -1
+            leaf = BPlusLeaf(keys[start:end], values[start:end], next_id)
+            tree.pager.write(page_ids[n], leaf)
+            level.append((page_ids[n], keys[start]))
+
+        # Internal levels until a single root remains
+        while len(level) > 1:
+            parents = []
+            for start, end in chunks(len(level), tree.order, tree.min_keys + 1):
+                group = level[start:end]
+                node = BPlusInternal([low for _, low in group[1:]], [pid for pid, _ in group])
+                parents.append((tree.pager.allocate(node), group[0][1]))
+            level = parents
+            tree._height += 1
+
+        tree.root = level[0][0]
+        tree.count = len(keys)
+        return tree
+
+
+    def flush(self) -> None:
+        """Write cached changes and tree metadata to the backing file (no-op in memory)."""
+        self.pager.flush((self.order, self.root, self._height, self.count))
+
+
+    def close(self) -> None:
+        """Flush and close the backing file."""
+        self.flush()
+        self.pager.close()
+
+
+    def __enter__(self) -> "BPlusTree":
+        return self
+
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    index = BPlusTree.from_sorted(((t, f"event-{t}") for t in range(0, 100000, 10)), order=32)
+    print(len(index), index.height())                  # 10000 2
+    print(index.search(500), index.min(), index.max())  # event-500 0 99990
+    print(list(index.iter_range(1000, 1030)))           # 4 pairs via the leaf chain
+    index.insert(1005, "late event")
+    index.delete(1010)
+    print([k for k, _ in index.iter_range(1000, 1030)])  # [1000, 1005, 1020, 1030]
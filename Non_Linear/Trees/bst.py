@@ -1,3 +1,8 @@
+from typing import BinaryIO, Iterable, Iterator
+
+from Non_Linear.Trees.tree_codec import decode_tree, encode_tree
+
+
 class BSTNode:
     """
     Node for a Binary Search Tree.
@@ -5,12 +10,14 @@ class BSTNode:
     :param key: Value to store in the node.
     :param left: Left child (BSTNode or None).
     :param right: Right child (BSTNode or None).
+    :param size: Number of nodes in the subtree rooted here (maintained by the tree).
     """
     def __init__(self, key: int):
         self.key = key
         # This just means "left and right can be either a BSTNode, or None."
         self.left: 'BSTNode' | None = None 
         self.right: 'BSTNode' | None = None
+        self.size = 1
 
     def __repr__(self):
         return f'BSTNode({self.key})'
@@ -33,19 +40,25 @@ class BST:
             key (int): Value to insert.
 
         Time Complexity: O(h), where h = height of tree
-        Space Complexity: O(h), due to recursion stack
+        Space Complexity: O(h) for the search path whose subtree sizes are updated;
+        iterative so deep (skewed) trees cannot overflow the stack
         """
-        def _insert(node: BSTNode | None, key: int) -> BSTNode:
-            if node is None:
-                return BSTNode(key)
-            if key < node.key:
-                node.left = _insert(node.left, key)
-            elif key > node.key:
-                node.right = _insert(node.right, key)
-            # If key == node.key, do nothing (no duplicates)
-            return node
-        
-        self.root = _insert(self.root, key)
+        path = []
+        current = self.root
+        while current:
+            if key == current.key:
+                return  # If key == node.key, do nothing (no duplicates)
+            path.append(current)
+            current = current.left if key < current.key else current.right
+
+        if not path:
+            self.root = self._new_node(key)
+            return
+        if key < path[-1].key:
+            path[-1].left = self._new_node(key)
+        else:
+            path[-1].right = self._new_node(key)
+        self._repair(path, 1)
 
     
     def search(self, key: int) -> BSTNode | None:
@@ -59,19 +72,12 @@ class BST:
             BSTNode | None: Node containing the key, or None if not found.
 
         Time Complexity: O(h), where h = height of tree
-        Space Complexity: O(h), due to recursion stack
+        Space Complexity: O(1)
         """
-        def _search(node: BSTNode | None, key: int) -> BSTNode | None:
-            if node is None:
-                return None
-            if key == node.key:
-                return node
-            if key < node.key:
-                return _search(node.left, key)
-            else:
-                return _search(node.right, key)
-        
-        return _search(self.root, key)
+        current = self.root
+        while current and key != current.key:
+            current = current.left if key < current.key else current.right
+        return current
     
 
     def contains(self, key: int) -> bool:
@@ -85,7 +91,7 @@ class BST:
             bool: True if key exists, False otherwise.
 
         Time Complexity: O(h), where h = height of tree
-        Space Complexity: O(h), due to recursion stack
+        Space Complexity: O(1)
         """
         return self.search(key) is not None
 
@@ -132,31 +138,52 @@ class BST:
             key (int): Value to delete.
 
         Time Complexity: O(h), where h = height of tree
-        Space Complexity: O(h), due to recursion stack
+        Space Complexity: O(h) for the search path whose subtree sizes are updated
         """
-
-        def _delete(node: BSTNode | None, key: int) -> BSTNode | None:
-            if node is None:
-                return None
-            if key < node.key:
-                node.left = _delete(node.left, key)
-            elif key > node.key:
-                node.right = _delete(node.right, key)
-            else:
-                # Node with only one child or no child
-                if node.left is None:
-                    return node.right
-                elif node.right is None:
-                    return node.left
-                # Node with two children: Get inorder successor (min value in right subtree)
-                temp = node.right
-                while temp.left:
-                    temp = temp.left
-                node.key = temp.key  # Copy inorder successor's key
-                node.right = _delete(node.right, temp.key)  # Delete inorder successor
-            return node
-
-        self.root = _delete(self.root, key)
+        path = []
+        node = self.root
+        while node and key != node.key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return  # Key not found
+
+        if node.left and node.right:
+            # Node with two children: Get inorder successor (min value in right subtree)
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key  # Copy inorder successor's key
+            node = successor          # and unlink the successor instead
+
+        # Node with only one child or no child
+        child = node.left if node.left else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._repair(path, -1)
+
+
+    def _update(self, node: BSTNode) -> None:
+        """Recompute node's cached fields from its children (BST caches only size)."""
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+
+    def _repair(self, path: list[BSTNode], delta: int) -> None:
+        """
+        Called by insert() (delta = 1) and delete() (delta = -1) with the
+        ancestors of the changed position, root first, to refresh their
+        cached fields. Each of them gained or lost one node. Subclasses
+        override it to recompute more fields (AugmentedBST) or to rebalance
+        (AVLTree).
+        """
+        for ancestor in path:
+            ancestor.size += delta
 
     # Tree traversals
 
@@ -247,6 +274,77 @@ class BST:
         return result
 
 
+    # Lazy iterators: an explicit stack of at most h nodes, nothing materialized
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the keys in ascending order, lazily.
+
+        Time Complexity: O(1) amortized per key
+        Space Complexity: O(h)
+        """
+        return self.iter_range(None, None)
+
+
+    def __reversed__(self) -> Iterator[int]:
+        """
+        Iterate over the keys in descending order, lazily.
+
+        Time Complexity: O(1) amortized per key
+        Space Complexity: O(h)
+        """
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.right
+            node = stack.pop()
+            yield node.key
+            current = node.left
+
+
+    def iter_from(self, key: int) -> Iterator[int]:
+        """
+        Iterate over the keys >= key in ascending order, lazily.
+
+        Time Complexity: O(h + k) for the first k keys
+        Space Complexity: O(h)
+        """
+        return self.iter_range(key, None)
+
+
+    def iter_range(self, lo: int | None, hi: int | None) -> Iterator[int]:
+        """
+        Iterate over the keys in the closed range [lo, hi] in ascending order.
+        A bound of None means unbounded on that side.
+
+        The stack starts as the search path for lo, holding only the nodes
+        whose key is >= lo, so subtrees entirely below lo are never visited,
+        and iteration stops at the first key above hi.
+
+        Time Complexity: O(h + k), k = number of keys yielded
+        Space Complexity: O(h)
+        """
+        stack = []
+        current = self.root
+        while current:
+            if lo is None or current.key >= lo:
+                stack.append(current)
+                current = current.left
+            else:
+                current = current.right  # current and its left subtree are below lo
+        while stack:
+            node = stack.pop()
+            if hi is not None and node.key > hi:
+                return
+            yield node.key
+            current = node.right
+            while current:
+                stack.append(current)
+                current = current.left
+
+
     def height(self) -> int:
         """
         Compute the height of the BST.
@@ -273,14 +371,105 @@ class BST:
         Returns:
             int: Total number of nodes in the tree.
 
-        Time Complexity: O(n), where n = number of nodes
-        Space Complexity: O(h), due to recursion stack (h = height of tree)
+        Time Complexity: O(1), read from the root's cached subtree size
+        Space Complexity: O(1)
         """
-        def _count(node: BSTNode | None) -> int:
-            if node is None:
-                return 0
-            return 1 + _count(node.left) + _count(node.right)
-        return _count(self.root)
+        return self._size(self.root)
+
+
+    @staticmethod
+    def _size(node: BSTNode | None) -> int:
+        return node.size if node else 0
+
+
+    def rank(self, key: int) -> int:
+        """
+        Count the keys strictly smaller than key (key need not be in the tree).
+
+        Returns:
+            int: Rank of key, i.e. its 0-based position in inorder() if present.
+
+        Time Complexity: O(h), O(log n) on a balanced tree
+        Space Complexity: O(1)
+        """
+        return self._count_below(key, inclusive=False)
+
+
+    def _count_below(self, key: int, inclusive: bool) -> int:
+        """Count keys < key (or <= key when inclusive) using subtree sizes."""
+        count = 0
+        current = self.root
+        while current:
+            if key < current.key or (key == current.key and not inclusive):
+                current = current.left
+            else:
+                # current and its whole left subtree are below key
+                count += self._size(current.left) + 1
+                if key == current.key:
+                    break
+                current = current.right
+        return count
+
+
+    def select(self, k: int) -> BSTNode:
+        """
+        Find the node holding the k-th smallest key (0-based).
+
+        Args:
+            k (int): Position in sorted order.
+
+        Returns:
+            BSTNode: The node at position k of inorder().
+
+        Raises:
+            IndexError: If k is not in [0, count_nodes()).
+
+        Time Complexity: O(h), O(log n) on a balanced tree
+        Space Complexity: O(1)
+        """
+        if not 0 <= k < self._size(self.root):
+            raise IndexError("select index out of range")
+        current = self.root
+        while True:
+            left_size = self._size(current.left)
+            if k < left_size:
+                current = current.left
+            elif k == left_size:
+                return current
+            else:
+                k -= left_size + 1
+                current = current.right
+
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """
+        Count the keys in the closed range [lo, hi].
+
+        Time Complexity: O(h), O(log n) on a balanced tree
+        Space Complexity: O(1)
+        """
+        if lo > hi:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo, inclusive=False)
+
+
+    def median(self) -> float | None:
+        """
+        Find the median key: the middle key for an odd count, the mean of the
+        two middle keys for an even count.
+
+        Returns:
+            float | None: The median, or None if the tree is empty.
+
+        Time Complexity: O(h), O(log n) on a balanced tree
+        Space Complexity: O(1)
+        """
+        n = self._size(self.root)
+        if n == 0:
+            return None
+        if n % 2 == 1:
+            return self.select(n // 2).key
+        return (self.select(n // 2 - 1).key + self.select(n // 2).key) / 2
     
 
     def is_empty(self) -> bool:
@@ -563,10 +752,12 @@ class BST:
         bst = BST()
         bst.root = root
         queue = [root]
+        front = 0  # Points to the front of the queue (pop(0) would make this O(n^2))
         idx = 1  # Index in data list
 
-        while queue and idx < len(data):
-            current = queue.pop(0)
+        while front < len(queue) and idx < len(data):
+            current = queue[front]
+            front += 1
             # Left child
             if idx < len(data) and data[idx] is not None:
                 current.left = BSTNode(data[idx])
@@ -578,5 +769,147 @@ class BST:
                 queue.append(current.right)
             idx += 1
 
+        # Subtree sizes, children before parents (reverse level order)
+        order = bst._level_order_nodes()
+        for node in reversed(order):
+            node.size = 1 + BST._size(node.left) + BST._size(node.right)
         return bst
 
+
+    def _level_order_nodes(self) -> list[BSTNode]:
+        """Return the nodes in level order (same queue as level_order())."""
+        if not self.root:
+            return []
+        queue = [self.root]
+        front = 0
+        while front < len(queue):
+            node = queue[front]
+            front += 1
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+        return queue
+
+
+    @classmethod
+    def from_sorted(cls, keys: Iterable[int]) -> 'BST':
+        """
+        Build a perfectly balanced tree from keys in strictly increasing order,
+        without n separate insert() calls: the middle key becomes the root and
+        each half is built the same way.
+
+        Args:
+            keys (Iterable[int]): Strictly increasing keys.
+
+        Returns:
+            BST: A tree of the calling class (BST, AVLTree, RedBlackTree, ...)
+            with height floor(log2 n).
+
+        Raises:
+            ValueError: If the keys are not strictly increasing.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n) for the key list, O(log n) recursion depth
+        """
+        keys = list(keys)
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError("Keys must be strictly increasing")
+        tree = cls()
+        max_depth = len(keys).bit_length() - 1
+
+        def _build(lo: int, hi: int, depth: int) -> BSTNode | None:
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = tree._new_node(keys[mid])
+            node.left = _build(lo, mid - 1, depth + 1)
+            node.right = _build(mid + 1, hi, depth + 1)
+            tree._finish_built_node(node, depth, max_depth)
+            return node
+
+        tree.root = _build(0, len(keys) - 1, 0)
+        return tree
+
+
+    def _new_node(self, key: int) -> BSTNode:
+        """Create a node of the type this tree uses (subclasses override)."""
+        return BSTNode(key)
+
+
+    def _finish_built_node(self, node: BSTNode, depth: int, max_depth: int) -> None:
+        """
+        Hook called by from_sorted() once node's children are built, so
+        subclasses can fill in their own node fields. Cached fields are
+        recomputed through _update().
+        """
+        self._update(node)
+
+
+    # Compact binary format (see tree_codec): preorder shape bitmap + varint keys
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the tree (its exact shape and keys) in the compact binary format.
+        Unlike serialize(), the size is linear in n even for skewed trees.
+
+        Returns:
+            bytes: About 2 bits + 1-2 bytes per node for small int keys.
+
+        Raises:
+            TypeError: If a key is not None, bool, int, float, str or bytes.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        flag_of = self._node_flag if self._stores_flag else None
+        return encode_tree(self.root, lambda node: node.key, flag_of)
+
+
+    @classmethod
+    def from_bytes(cls, data: "bytes | BinaryIO") -> 'BST':
+        """
+        Rebuild a tree written by to_bytes() from bytes or a binary stream,
+        restoring the shape exactly and recomputing cached node fields.
+
+        Raises:
+            ValueError: If data is not an encoded tree.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        tree = cls()
+        tree.root, nodes, flags = decode_tree(data, tree._new_node)
+        # Reverse preorder visits children before their parents
+        for i in range(len(nodes) - 1, -1, -1):
+            tree._finish_loaded_node(nodes[i], flags[i] if flags else False)
+        return tree
+
+
+    def save(self, path: str) -> None:
+        """Write the tree to a file in the to_bytes() format."""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+    @classmethod
+    def load(cls, path: str) -> 'BST':
+        """Read a tree written by save(), decoding the file as a stream."""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f)
+
+
+    # Extra per-node bit persisted by to_bytes() (red-black colors)
+    _stores_flag = False
+
+    def _node_flag(self, node: BSTNode) -> bool:
+        return False
+
+
+    def _finish_loaded_node(self, node: BSTNode, flag: bool) -> None:
+        """
+        Hook called by from_bytes() for every node, children first, to restore
+        cached fields through _update().
+        """
+        self._update(node)
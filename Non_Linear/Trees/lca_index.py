@@ -0,0 +1,201 @@
+from array import array
+from typing import Any, Iterable
+
+from Linear.stack import Stack
+from Non_Linear.Trees.bst import BST
+
+
+class LCAIndex:
+    """
+    Static index answering lowest-common-ancestor queries in O(1).
+
+    Built once from a BinaryTree or a BST (or any subclass). Nodes are numbered
+    in preorder, which is the Euler tour restricted to first visits. For
+    preorder numbers i < j, every node numbered i+1..j lies in the subtree of
+    LCA(i, j), and the shallowest ones are children of the LCA. A sparse table
+    over preorder positions, keyed by (depth, parent), therefore answers a
+    query with two lookups and a min. That is half the size of a table over
+    the full 2n - 1 Euler tour.
+
+    Queries take node values (BinaryTree values, BST keys). With duplicate
+    values the first one in preorder is used, as in BinaryTree.search. The
+    index is a snapshot: rebuild it after modifying the tree.
+
+    Attributes:
+        values (list): Node values in preorder.
+        depths (array): Depth of each node (root = 0), by preorder number.
+        parents (array): Preorder number of each node's parent (-1 for the root).
+    """
+    def __init__(self, tree: Any):
+        """
+        Args:
+            tree: A BinaryTree or BST (nodes with left / right and value or key).
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(n log n) for the sparse table
+        """
+        key_attr = "key" if isinstance(tree, BST) else "value"
+        self.values = []
+        self.depths = array("q")
+        self.parents = array("q")
+        self._index = {}
+
+        # Iterative preorder: (node, parent number, depth)
+        stack = Stack()
+        if tree.root is not None:
+            stack.push((tree.root, -1, 0))
+        while not stack.is_empty():
+            node, parent, depth = stack.pop()
+            number = len(self.values)
+            value = getattr(node, key_attr)
+            self.values.append(value)
+            self.depths.append(depth)
+            self.parents.append(parent)
+            self._index.setdefault(value, number)
+            if node.right is not None:
+                stack.push((node.right, number, depth + 1))
+            if node.left is not None:
+                stack.push((node.left, number, depth + 1))
+
+        # Level k holds, for each start i, the minimum key of positions i..i+2^k-1,
+        # where key = depth * n + parent (so key % n is the parent number)
+        n = len(self.values)
+        level = array("q", (d * n + p if p >= 0 else 0 for d, p in zip(self.depths, self.parents)))
+        self._table = [level]
+        span = 1
+        while 2 * span <= n:
+            count = n - 2 * span + 1
+            level = array("q", map(min, level[:count], level[span:span + count]))
+            self._table.append(level)
+            span *= 2
+
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._index
+
+
+    def _lca_number(self, i: int, j: int) -> int:
+        """LCA of two preorder numbers."""
+        if i == j:
+            return i
+        if i > j:
+            i, j = j, i
+        # Range i+1..j of length j - i, covered by two overlapping power-of-two blocks
+        k = (j - i).bit_length() - 1
+        row = self._table[k]
+        a, b = row[i + 1], row[j - (1 << k) + 1]
+        return (a if a < b else b) % len(self.values)
+
+
+    def lca(self, u: Any, v: Any) -> Any:
+        """
+        Returns the value of the lowest common ancestor of u and v.
+
+        Returns:
+            The LCA's value, or None if either value is not in the tree.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        i, j = self._index.get(u), self._index.get(v)
+        if i is None or j is None:
+            return None
+        return self.values[self._lca_number(i, j)]
+
+
+    def lca_many(self, pairs: Iterable[tuple[Any, Any]]) -> list:
+        """
+        Answers lca() for every (u, v) pair, in order, with the lookups
+        hoisted out of the loop.
+
+        Returns:
+            list: One LCA value per pair (None where a value is missing).
+
+        Time Complexity: O(q) for q pairs
+        Space Complexity: O(q) for the result
+        """
+        index, values, table = self._index, self.values, self._table
+        n = len(values)
+        result = []
+        append = result.append
+        for u, v in pairs:
+            i, j = index.get(u), index.get(v)
+            if i is None or j is None:
+                append(None)
+                continue
+            if i == j:
+                append(values[i])
+                continue
+            if i > j:
+                i, j = j, i
+            k = (j - i).bit_length() - 1
+            row = table[k]
+            a, b = row[i + 1], row[j - (1 << k) + 1]
+            append(values[(a if a < b else b) % n])
+        return result
+
+
+    def depth(self, u: Any) -> int:
+        """
+        Returns the depth of u (0 for the root), -1 if not found, as BST.node_depth does.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        i = self._index.get(u)
+        return -1 if i is None else self.depths[i]
+
+
+    def distance(self, u: Any, v: Any) -> int:
+        """
+        Returns the number of edges on the path between u and v, -1 if either is missing.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        i, j = self._index.get(u), self._index.get(v)
+        if i is None or j is None:
+            return -1
+        depths = self.depths
+        return depths[i] + depths[j] - 2 * depths[self._lca_number(i, j)]
+
+
+    def path(self, u: Any, v: Any) -> list:
+        """
+        Returns the values on the path from u to v (both included), empty if either is missing.
+
+        Time Complexity: O(length of the path)
+        Space Complexity: O(length of the path)
+        """
+        i, j = self._index.get(u), self._index.get(v)
+        if i is None or j is None:
+            return []
+        top = self._lca_number(i, j)
+        up, down = [], []
+        while i != top:
+            up.append(self.values[i])
+            i = self.parents[i]
+        while j != top:
+            down.append(self.values[j])
+            j = self.parents[j]
+        down.reverse()
+        return up + [self.values[top]] + down
+
+
+if __name__ == "__main__":
+    from Non_Linear.Trees.binary_tree import BinaryTree
+
+    tree = BinaryTree()
+    for value in range(1, 8):
+        tree.insert(value)  # Level order:  1 / 2 3 / 4 5 6 7
+    index = LCAIndex(tree)
+    print(index.lca(4, 5), index.lca(4, 7), index.lca(4, 42))  # 2 1 None
+    print(index.depth(6), index.distance(4, 7), index.path(4, 7))  # 2 4 [4, 2, 1, 3, 7]
+    print(index.lca_many([(4, 5), (6, 7), (2, 4)]))  # [2, 3, 2]
+
+    bst = BST.from_sorted(range(1, 16))
+    print(LCAIndex(bst).lca(1, 7), LCAIndex(bst).lca(9, 15))  # 4 12
@@ -0,0 +1,278 @@
+from Non_Linear.Trees.bst import BST, BSTNode
+
+
+class RBNode(BSTNode):
+    """
+    Node for a red-black tree: a BSTNode with a color and a parent pointer.
+    Missing children (None) count as black leaves.
+
+    :param key: Value to store in the node.
+    """
+    def __init__(self, key: int):
+        super().__init__(key)
+        self.red = True  # New nodes start red
+        self.parent: 'RBNode' | None = None
+
+
+class RedBlackTree(BST):
+    """
+    Self-balancing BST (red-black tree).
+
+    Invariants: the root is black, a red node has no red child, and every
+    path from a node down to a missing child crosses the same number of black
+    nodes. Together they keep the height below 2·log2(n + 1). Compared with an
+    AVL tree the balance is looser (slightly slower lookups) but an insert or
+    delete performs at most 2 or 3 rotations, which suits update-heavy workloads.
+
+    Insert and delete are iterative, following parent pointers upwards; every
+    query method is inherited from BST unchanged.
+    """
+
+    @staticmethod
+    def _is_red(node: RBNode | None) -> bool:
+        return node is not None and node.red
+
+
+    def _replace_child(self, parent: RBNode | None, old: RBNode, new: RBNode | None) -> None:
+        """Make new take old's place under parent (or as the root)."""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+        if new is not None:
+            new.parent = parent
+
+
+    def _new_node(self, key: int) -> RBNode:
+        return RBNode(key)
+
+
+    def _finish_built_node(self, node: RBNode, depth: int, max_depth: int) -> None:
+        """
+        from_sorted() builds a tree whose leaves are all on the last two levels:
+        coloring only the deepest level red gives every path the same black count.
+        """
+        node.red = depth == max_depth and depth > 0
+        for child in (node.left, node.right):
+            if child:
+                child.parent = node
+        self._update(node)
+
+
+    _stores_flag = True  # to_bytes() keeps one color bit per node
+
+    def _node_flag(self, node: RBNode) -> bool:
+        return node.red
+
+
+    def _finish_loaded_node(self, node: RBNode, flag: bool) -> None:
+        node.red = flag
+        for child in (node.left, node.right):
+            if child:
+                child.parent = node
+        self._update(node)
+
+
+    def _rotate_left(self, node: RBNode) -> None:
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left:
+            pivot.left.parent = node
+        self._replace_child(node.parent, node, pivot)
+        pivot.left = node
+        node.parent = pivot
+        pivot.size = node.size
+        self._update(node)
+
+
+    def _rotate_right(self, node: RBNode) -> None:
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right:
+            pivot.right.parent = node
+        self._replace_child(node.parent, node, pivot)
+        pivot.right = node
+        node.parent = pivot
+        pivot.size = node.size
+        self._update(node)
+
+
+    def insert(self, key: int) -> None:
+        """
+        Insert a key and restore the red-black invariants.
+
+        Args:
+            key (int): Value to insert (duplicates are ignored).
+
+        Time Complexity: O(log n), at most 2 rotations
+        Space Complexity: O(1)
+        """
+        parent = None
+        current = self.root
+        while current:
+            if key == current.key:
+                return  # No duplicates
+            parent = current
+            current = current.left if key < current.key else current.right
+
+        node = RBNode(key)
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        while parent:
+            parent.size += 1
+            parent = parent.parent
+        self._insert_fixup(node)
+
+
+    def _insert_fixup(self, node: RBNode) -> None:
+        """Fix a red node that may have a red parent, walking up the tree."""
+        while self._is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent  # Exists: a red parent is never the root
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if self._is_red(uncle):
+                    # Recolor and continue from the grandparent
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.right:
+                    self._rotate_left(parent)
+                    node, parent = parent, node
+                parent.red = False
+                grandparent.red = True
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if self._is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.left:
+                    self._rotate_right(parent)
+                    node, parent = parent, node
+                parent.red = False
+                grandparent.red = True
+                self._rotate_left(grandparent)
+        self.root.red = False
+
+
+    def delete(self, key: int) -> None:
+        """
+        Delete a key and restore the red-black invariants.
+        Nodes are relinked rather than having keys copied, so references to
+        other nodes stay valid.
+
+        Args:
+            key (int): Value to delete (missing keys are ignored).
+
+        Time Complexity: O(log n), at most 3 rotations
+        Space Complexity: O(1)
+        """
+        node = self.search(key)
+        if node is None:
+            return
+
+        removed_red = node.red
+        if node.left is None or node.right is None:
+            # At most one child: splice the node out
+            child = node.left if node.left else node.right
+            child_parent = node.parent
+            self._replace_child(node.parent, node, child)
+        else:
+            # Two children: move the inorder successor into node's place
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            removed_red = successor.red
+            child = successor.right
+            if successor.parent is node:
+                child_parent = successor
+            else:
+                child_parent = successor.parent
+                self._replace_child(successor.parent, successor, child)
+                successor.right = node.right
+                successor.right.parent = successor
+            self._replace_child(node.parent, node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.red = node.red
+
+        # Repair subtree sizes from the lowest changed node up to the root
+        ancestor = child_parent
+        while ancestor:
+            self._update(ancestor)
+            ancestor = ancestor.parent
+
+        if not removed_red:
+            self._delete_fixup(child, child_parent)
+
+
+    def _delete_fixup(self, node: RBNode | None, parent: RBNode | None) -> None:
+        """
+        node (possibly None) carries an extra black after a black node was removed;
+        push it up the tree or absorb it with rotations and recoloring.
+        """
+        while node is not self.root and not self._is_red(node):
+            if node is parent.left:
+                sibling = parent.right  # Never None: the path through it has a black to spare
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_left(parent)
+                    sibling = parent.right
+                if not self._is_red(sibling.left) and not self._is_red(sibling.right):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+                if not self._is_red(sibling.right):
+                    sibling.left.red = False
+                    sibling.red = True
+                    self._rotate_right(sibling)
+                    sibling = parent.right
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                self._rotate_left(parent)
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_right(parent)
+                    sibling = parent.left
+                if not self._is_red(sibling.left) and not self._is_red(sibling.right):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+                if not self._is_red(sibling.left):
+                    sibling.right.red = False
+                    sibling.red = True
+                    self._rotate_left(sibling)
+                    sibling = parent.left
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                self._rotate_right(parent)
+            node = self.root
+        if node is not None:
+            node.red = False
+
+
+if __name__ == "__main__":
+    tree = RedBlackTree()
+    for key in range(1, 1024):  # Sorted input: a plain BST would be a 1023-node chain
+        tree.insert(key)
+    print(tree.height())  # At most 2·log2(1024) = 20
+    for key in range(1, 1024, 2):
+        tree.delete(key)
+    print(tree.inorder()[:5], tree.root.red)  # [2, 4, 6, 8, 10] False
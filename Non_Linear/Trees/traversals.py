@@ -1,3 +1,6 @@
+from typing import Iterator
+
+from Linear.stack import Stack
 from Non_Linear.Trees.binary_tree import Node, BinaryTree
 
 class TreeTraversals:
@@ -15,13 +18,13 @@ class TreeTraversals:
       Time Complexity: O(n)
       Space Complexity: O(h) — h = height of the tree (stack depth)
       """
-      stack, result = [], []
+      stack, result = Stack(), []
       current = root
 
-      while current or stack:
+      while current or not stack.is_empty():
           # Reach the leftmost Node of the current Node
           while current:
-              stack.append(current)
+              stack.push(current)
               current = current.left
 
           # Current is None here, so we backtrack
@@ -50,17 +53,18 @@ class TreeTraversals:
         if not root:
             return []
 
-        stack, result = [root], []
+        stack, result = Stack(), []
+        stack.push(root)
 
-        while stack:
+        while not stack.is_empty():
             current = stack.pop()
             result.append(current.value)
 
             # Push right first so that left is processed first
             if current.right:
-                stack.append(current.right)
+                stack.push(current.right)
             if current.left:
-                stack.append(current.left)
+                stack.push(current.left)
 
         return result
 
@@ -82,17 +86,145 @@ class TreeTraversals:
         if not root:
             return []
 
-        stack, result = [root], []
+        stack, result = Stack(), []
+        stack.push(root)
 
-        while stack:
+        while not stack.is_empty():
             current = stack.pop()
             result.append(current.value)
 
             # Push left first so right is processed before left
             if current.left:
-                stack.append(current.left)
+                stack.push(current.left)
             if current.right:
-                stack.append(current.right)
+                stack.push(current.right)
 
         # Reverse the process to get left → right → root
         return result[::-1]
+
+    # Generator versions: values are produced lazily, so callers can stop early
+    # and nothing proportional to n is ever built.
+
+    @staticmethod
+    def iter_inorder(root: 'Node') -> Iterator[int]:
+        """
+        Lazily yields node values in inorder (Left -> Root -> Right).
+
+        Time Complexity: O(1) amortized per value, O(n) in total
+        Space Complexity: O(h) for the stack
+        """
+        stack = Stack()
+        current = root
+        while current or not stack.is_empty():
+            while current:
+                stack.push(current)
+                current = current.left
+            current = stack.pop()
+            yield current.value
+            current = current.right
+
+    @staticmethod
+    def iter_preorder(root: 'Node') -> Iterator[int]:
+        """
+        Lazily yields node values in preorder (Root -> Left -> Right).
+
+        Time Complexity: O(1) per value
+        Space Complexity: O(h) for the stack
+        """
+        if not root:
+            return
+        stack = Stack()
+        stack.push(root)
+        while not stack.is_empty():
+            current = stack.pop()
+            yield current.value
+            if current.right:
+                stack.push(current.right)
+            if current.left:
+                stack.push(current.left)
+
+    @staticmethod
+    def iter_postorder(root: 'Node') -> Iterator[int]:
+        """
+        Lazily yields node values in postorder (Left -> Right -> Root).
+        A node is emitted when we come back to it from its right subtree
+        (or it has none), tracked by the last emitted node.
+
+        Time Complexity: O(1) amortized per value
+        Space Complexity: O(h) for the stack
+        """
+        stack = Stack()
+        current = root
+        last_emitted = None
+        while current or not stack.is_empty():
+            while current:
+                stack.push(current)
+                current = current.left
+            top = stack.peek()
+            if top.right and top.right is not last_emitted:
+                current = top.right
+            else:
+                stack.pop()
+                yield top.value
+                last_emitted = top
+
+    @staticmethod
+    def _morris_step(current: 'Node', preorder: bool) -> tuple['Node', bool]:
+        """
+        One step of Morris traversal from current.
+        Returns (next node to visit, whether current's value is emitted now).
+        The rightmost node of a left subtree is threaded back to current on the
+        first visit and unthreaded on the second.
+        """
+        if current.left is None:
+            return current.right, True
+        predecessor = current.left
+        while predecessor.right and predecessor.right is not current:
+            predecessor = predecessor.right
+        if predecessor.right is None:
+            predecessor.right = current    # First visit: thread back to current
+            return current.left, preorder
+        predecessor.right = None           # Second visit: remove the thread
+        return current.right, not preorder
+
+    @staticmethod
+    def _morris(root: 'Node', preorder: bool) -> Iterator[int]:
+        current = root
+        try:
+            while current:
+                node = current
+                current, emit = TreeTraversals._morris_step(current, preorder)
+                if emit:
+                    yield node.value
+        finally:
+            # Stopped early: finish the walk without yielding so every thread is removed
+            while current:
+                current, _ = TreeTraversals._morris_step(current, preorder)
+
+    @staticmethod
+    def morris_inorder(root: 'Node') -> Iterator[int]:
+        """
+        Lazily yields node values in inorder using Morris traversal: instead of
+        a stack, the rightmost node of each left subtree temporarily points back
+        to its inorder successor (a "thread"), removed on the second visit.
+
+        The tree is modified while the generator is suspended; if the caller
+        stops early, closing the generator finishes the walk silently so the
+        tree is restored.
+
+        Time Complexity: O(n) in total (each edge is walked at most 3 times)
+        Space Complexity: O(1) extra
+        """
+        return TreeTraversals._morris(root, preorder=False)
+
+    @staticmethod
+    def morris_preorder(root: 'Node') -> Iterator[int]:
+        """
+        Lazily yields node values in preorder using Morris threading: a node is
+        emitted on its first visit, when its thread is created.
+        Early exit restores the tree the same way as morris_inorder.
+
+        Time Complexity: O(n) in total
+        Space Complexity: O(1) extra
+        """
+        return TreeTraversals._morris(root, preorder=True)
@@ -0,0 +1,249 @@
+"""
+Compact binary encoding for linked binary trees (BinaryTree, BST and subclasses).
+
+Layout (all integers little endian):
+  magic "BTC1" | value kind (1 byte) | has flags (1 byte) | node count (varint)
+  | shape bitmap: 2 bits per node in preorder (has left, has right)
+  | flag bitmap: 1 bit per node in preorder (only if has flags)
+  | values in preorder: zigzag varints (kind 0) or tagged values (kind 1)
+
+A node costs 2 bits of structure plus its value (1 byte for small ints), and
+the size is linear in the number of nodes whatever the tree's shape. Both
+directions are iterative, so degenerate trees of any depth are fine.
+
+Tagged values (write_value / Reader.read_value) are one tag byte followed by:
+nothing (None, False, True), a zigzag varint (int), a packed little-endian
+double (float), or a varint length and the bytes (str as UTF-8, bytes).
+Nothing else can be encoded, so decoding never runs code from the data.
+"""
+
+import io
+import struct
+from typing import Any, BinaryIO, Callable
+
+MAGIC = b"BTC1"
+_INTS = 0      # Every value is an int: zigzag varints
+_TAGGED = 1    # Any mix of the value types below, each with a tag byte
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES = range(7)
+_DOUBLE = struct.Struct("<d")
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """Append a signed int as a zigzag varint (7 bits per byte)."""
+    value = (value << 1) if value >= 0 else ((-value << 1) - 1)
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def write_value(out: bytearray, value: Any) -> None:
+    """
+    Append a tagged value: None, bool, int, float, str or bytes.
+
+    Raises:
+        TypeError: For any other type (subclasses included), so that
+            unsupported values are rejected when written, not when read.
+    """
+    kind = type(value)
+    if value is None:
+        out.append(_NONE)
+    elif kind is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif kind is int:
+        out.append(_INT)
+        write_varint(out, value)
+    elif kind is float:
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif kind is str or kind is bytes:
+        data = value.encode("utf-8") if kind is str else value
+        out.append(_STR if kind is str else _BYTES)
+        write_varint(out, len(data))
+        out += data
+    else:
+        raise TypeError(f"Cannot encode value of type {kind.__name__}")
+
+
+class Reader:
+    """
+    Buffered reader over a binary stream, decoding varints without per-byte reads.
+    It reads ahead in chunks; release() hands the unread part back to the stream.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = b""
+        self.pos = 0
+
+    def _fill(self) -> None:
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            raise ValueError("Truncated tree data")
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def read(self, n: int) -> bytes:
+        while len(self.buffer) - self.pos < n:
+            self._fill()
+        data = self.buffer[self.pos:self.pos + n]
+        self.pos += n
+        return data
+
+    def release(self) -> None:
+        """
+        Seek a seekable stream back to just after the last byte consumed, so
+        data stored after the tree can still be read. A non-seekable stream
+        stays wherever the last chunk read left it.
+        """
+        unread = len(self.buffer) - self.pos
+        seekable = getattr(self.stream, "seekable", None)
+        if unread and seekable is not None and seekable():
+            self.stream.seek(-unread, io.SEEK_CUR)
+        self.buffer, self.pos = b"", 0
+
+    def read_varint(self) -> int:
+        result = shift = 0
+        while True:
+            if self.pos == len(self.buffer):
+                self._fill()
+            byte = self.buffer[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        return (result >> 1) if not result & 1 else -((result + 1) >> 1)
+
+    def read_value(self) -> Any:
+        """Read a value written by write_value()."""
+        tag = self.read(1)[0]
+        if tag == _INT:
+            return self.read_varint()
+        if tag in (_STR, _BYTES):
+            length = self.read_varint()
+            if length < 0:
+                raise ValueError("Corrupt tree data")
+            data = self.read(length)
+            return data.decode("utf-8") if tag == _STR else data
+        if tag == _FLOAT:
+            return _DOUBLE.unpack(self.read(_DOUBLE.size))[0]
+        if tag == _NONE:
+            return None
+        if tag in (_FALSE, _TRUE):
+            return tag == _TRUE
+        raise ValueError("Corrupt tree data")
+
+
+def encode_tree(root: Any, value_of: Callable[[Any], Any],
+                flag_of: Callable[[Any], bool] | None = None) -> bytes:
+    """
+    Encode the tree under root (nodes with .left / .right).
+
+    Args:
+        root: Root node, or None for an empty tree.
+        value_of: Returns the value stored in a node.
+        flag_of: Optional extra bit per node (e.g. red-black color).
+
+    Raises:
+        TypeError: If a value is not None, bool, int, float, str or bytes.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the output, O(h) stack
+    """
+    shape = bytearray()
+    flags = bytearray()
+    values = []
+    stack = [root] if root is not None else []
+    count = 0
+    while stack:
+        node = stack.pop()
+        if count % 4 == 0:
+            shape.append(0)
+        shape[-1] |= ((node.left is not None) << 1 | (node.right is not None)) << (2 * (count % 4))
+        if flag_of is not None:
+            if count % 8 == 0:
+                flags.append(0)
+            flags[-1] |= bool(flag_of(node)) << (count % 8)
+        values.append(value_of(node))
+        count += 1
+        # Right pushed first so the left subtree is emitted first (preorder)
+        if node.right is not None:
+            stack.append(node.right)
+        if node.left is not None:
+            stack.append(node.left)
+
+    kind = _INTS if all(type(v) is int for v in values) else _TAGGED
+    out = bytearray(MAGIC)
+    out.append(kind)
+    out.append(1 if flag_of is not None else 0)
+    write_varint(out, count)
+    out += shape
+    out += flags
+    write = write_varint if kind == _INTS else write_value
+    for v in values:
+        write(out, v)
+    return bytes(out)
+
+
+def decode_tree(source: bytes | BinaryIO, make_node: Callable[[Any], Any]) -> tuple[Any, list, list]:
+    """
+    Rebuild a tree written by encode_tree(), reading source sequentially.
+
+    Args:
+        source: The encoded bytes, or a binary stream positioned at them.
+            A seekable stream is left just past the encoded tree.
+        make_node: Creates a node (with left/right = None) from a value.
+
+    Returns:
+        (root, nodes, flags): the root (None if empty), all nodes in preorder
+        (parents before children), and their flag bits (empty if none stored).
+
+    Raises:
+        ValueError: If the data is not an encoded tree or is truncated.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the nodes, O(h) stack
+    """
+    reader = Reader(io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source)
+    if reader.read(4) != MAGIC:
+        raise ValueError("Not an encoded tree")
+    kind, has_flags = reader.read(2)
+    if kind not in (_INTS, _TAGGED):
+        raise ValueError("Unknown value kind")
+    count = reader.read_varint()
+    if count < 0:
+        raise ValueError("Not an encoded tree")
+    shape = reader.read((2 * count + 7) // 8)
+    flag_bits = reader.read((count + 7) // 8) if has_flags else b""
+    read_value = reader.read_varint if kind == _INTS else reader.read_value
+
+    nodes = []
+    root = None
+    pending = []        # Nodes whose right child is still to come
+    parent, side = None, ""
+    for i in range(count):
+        node = make_node(read_value())
+        nodes.append(node)
+        if parent is None:
+            root = node
+        elif side == "left":
+            parent.left = node
+        else:
+            parent.right = node
+
+        bits = (shape[i // 4] >> (2 * (i % 4))) & 3
+        if bits & 2:                   # Left child comes next
+            if bits & 1:
+                pending.append(node)
+            parent, side = node, "left"
+        elif bits & 1:                 # Only a right child
+            parent, side = node, "right"
+        elif pending:                  # Leaf: next node is the right child of the latest pending node
+            parent, side = pending.pop(), "right"
+
+    reader.release()
+    flags = [bool((flag_bits[i // 8] >> (i % 8)) & 1) for i in range(count)] if has_flags else []
+    return root, nodes, flags
@@ -0,0 +1,180 @@
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from Non_Linear.Trie.trie import Trie
+
+
+class AhoCorasick:
+    """
+    An Aho–Corasick automaton matching every word of a Trie in one pass over a text.
+
+    States are the trie nodes numbered breadth-first (root = 0). Each state has
+      - a failure link: the state of its longest proper suffix that is also a
+        trie prefix,
+      - an output link: the nearest state on the failure chain where a pattern
+        ends, so reporting matches never walks non-terminal states.
+    When the states × σ goto table fits in dense_limit cells, the goto
+    function is completed into that dense table (a 4-byte typed array) so every
+    character costs one array read; otherwise per-state dicts are used and
+    failure links are followed at scan time.
+
+    feed(chunk) is streaming: the automaton state and the stream offset are kept
+    between calls, so matches spanning chunk boundaries are found.
+    The empty word, if stored in the trie, is ignored.
+    """
+
+    def __init__(self, trie: Trie, dense_limit: int = 1 << 20):
+        """
+        Compiles the words stored in trie.
+        Time: O(N·σ) with a dense table, O(N) otherwise (N = trie nodes)
+        Space: O(N·σ) dense, O(N) sparse
+
+        Args:
+            trie (Trie): Source of the patterns; it is not modified.
+            dense_limit (int): Largest number of cells (states × alphabet size)
+                of a dense goto table, 4 bytes each; bigger automata stay sparse.
+        """
+        # Number the nodes breadth-first; children come out in sorted order
+        nodes = [trie.root]
+        parent = [-1]
+        via = [""]
+        head = 0
+        while head < len(nodes):
+            node = nodes[head]
+            for ch, child in zip(node.chars, node.children):
+                nodes.append(child)
+                parent.append(head)
+                via.append(ch)
+            head += 1
+        size = len(nodes)
+
+        self.alphabet = "".join(sorted(set(via[1:])))
+        self.codes = {ch: i for i, ch in enumerate(self.alphabet)}
+        self.dense = size * len(self.alphabet) <= dense_limit
+        self.patterns: List[Optional[str]] = [None] * size
+        self.fail = array("i", [0]) * size
+        self.output = array("i", [-1]) * size   # -1 = no terminal state below on the chain
+
+        # Trie edges as sparse goto dicts keyed by character code, and the
+        # spelled-out patterns (parents are numbered before their children)
+        goto = [dict() for _ in range(size)]
+        spelled = [""] * size
+        for state in range(1, size):
+            goto[parent[state]][self.codes[via[state]]] = state
+            spelled[state] = spelled[parent[state]] + via[state]
+            if nodes[state].is_end_of_word:
+                self.patterns[state] = spelled[state]
+
+        # Failure and output links, breadth-first so shallower states are done first
+        for state in range(1, size):
+            p = parent[state]
+            c = self.codes[via[state]]
+            if p != 0:
+                f = self.fail[p]
+                while f and c not in goto[f]:
+                    f = self.fail[f]
+                self.fail[state] = goto[f].get(c, 0)
+            f = self.fail[state]
+            self.output[state] = f if self.patterns[f] is not None else self.output[f]
+
+        if self.dense:
+            sigma = len(self.alphabet)
+            table = array("i", [0]) * (size * sigma)
+            for c, child in goto[0].items():
+                table[c] = child
+            for state in range(1, size):
+                # Start from the failure state's row (already complete), then the own edges
+                row, fail_row = state * sigma, self.fail[state] * sigma
+                table[row:row + sigma] = table[fail_row:fail_row + sigma]
+                for c, child in goto[state].items():
+                    table[row + c] = child
+            self.table = table
+            self.goto = None
+        else:
+            self.table = None
+            self.goto = goto
+
+        self.state = 0
+        self.position = 0
+
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], dense_limit: int = 1 << 20) -> "AhoCorasick":
+        """
+        Builds an automaton from an iterable of patterns.
+        """
+        trie = Trie()
+        for word in words:
+            trie.insert(word)
+        return cls(trie, dense_limit)
+
+
+    def __len__(self) -> int:
+        """Returns the number of states."""
+        return len(self.fail)
+
+
+    def reset(self) -> None:
+        """Starts a new stream: back to the root state at offset 0."""
+        self.state = 0
+        self.position = 0
+
+
+    def feed(self, chunk: str) -> Iterator[Tuple[int, str]]:
+        """
+        Scans the next chunk of the stream and yields (offset, pattern) for every
+        occurrence ending inside it, offset being the start of the match in the
+        whole stream. Occurrences ending at the same position are yielded longest first.
+        The generator should be consumed fully before the next feed().
+        Time: O(C + Z) dense, O(C) amortized + Z sparse (C = chunk length, Z = matches)
+        Space: O(1)
+        """
+        state = self.state
+        position = self.position
+        codes, patterns, output = self.codes, self.patterns, self.output
+        try:
+            if self.dense:
+                table, sigma = self.table, len(self.alphabet)
+                for ch in chunk:
+                    position += 1
+                    c = codes.get(ch)
+                    state = 0 if c is None else table[state * sigma + c]
+                    match = state if patterns[state] is not None else output[state]
+                    while match != -1:
+                        yield position - len(patterns[match]), patterns[match]
+                        match = output[match]
+            else:
+                goto, fail = self.goto, self.fail
+                for ch in chunk:
+                    position += 1
+                    c = codes.get(ch)
+                    if c is None:
+                        state = 0
+                    else:
+                        while state and c not in goto[state]:
+                            state = fail[state]
+                        state = goto[state].get(c, 0)
+                    match = state if patterns[state] is not None else output[state]
+                    while match != -1:
+                        yield position - len(patterns[match]), patterns[match]
+                        match = output[match]
+        finally:
+            # Saved even if the caller stops early, so the stream stays consistent
+            self.state = state
+            self.position = position
+
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Returns every (offset, pattern) occurrence in text as a fresh stream.
+        """
+        self.reset()
+        return list(self.feed(text))
+
+
+if __name__ == "__main__":
+    matcher = AhoCorasick.from_words(["error", "err", "timeout", "out"])
+    for chunk in ["disk err", "or; conn time", "out"]:
+        for offset, pattern in matcher.feed(chunk):
+            print(offset, pattern)
+    # 5 err, 5 error, 17 timeout, 21 out
@@ -0,0 +1,188 @@
+from typing import List, Optional, Tuple
+
+from Linear.stack import Stack
+from Non_Linear.Heaps.min_heap import MinHeap
+from Non_Linear.Trie.trie import Trie, TrieNode
+
+
+class WeightedTrieNode(TrieNode):
+    """
+    A TrieNode that also stores the score of the word ending here (if any)
+    and `best`, the highest score of any word in its subtree.
+    """
+
+    __slots__ = ("score", "best")
+
+    def __init__(self):
+        super().__init__()
+        self.score = None              # Score of the word ending at this node
+        self.best = float("-inf")      # Max score in this subtree
+
+    def refresh_best(self) -> None:
+        """
+        Recomputes best from this node's own score and its children's best.
+        - Time: O(σ)
+        """
+        best = self.score if self.is_end_of_word else float("-inf")
+        for child in self.children:
+            if child.best > best:
+                best = child.best
+        self.best = best
+
+
+class AutocompleteTrie(Trie):
+    """
+    A Trie of scored words answering "top k completions of a prefix".
+
+    Every node caches the best score found in its subtree. top_k() then runs a
+    best-first search from the prefix node with a MinHeap ordered by
+    (-score, text): a subtree is only opened when its best score could still
+    make the top k, so the cost depends on k and the word lengths, not on how
+    many words share the prefix.
+
+    All read-only Trie methods (search, words_with_prefix, ...) keep working.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.root = WeightedTrieNode()
+
+    def _path(self, word: str) -> Optional[List[WeightedTrieNode]]:
+        """Returns the nodes from the root to word, or None if the path breaks."""
+        path = [self.root]
+        for ch in word:
+            node = path[-1].get(ch)
+            if node is None:
+                return None
+            path.append(node)
+        return path
+
+    def insert(self, word: str, score: float = 0) -> None:
+        """
+        Inserts word with the given score, or updates the score of an existing word.
+        - Time: O(L) for a new or higher score, O(L·σ) when a score is lowered
+        - Space: O(L) new nodes
+        """
+        node = self.root
+        path = [node]
+        for ch in word:
+            node = node.add(ch)
+            path.append(node)
+
+        lowered = node.is_end_of_word and score < node.score
+        if not node.is_end_of_word:
+            for n in path:
+                n.prefix_count += 1
+        node.is_end_of_word = True
+        node.score = score
+        if lowered:
+            # The old score may have been the best of some ancestors
+            for n in reversed(path):
+                n.refresh_best()
+        else:
+            for n in path:
+                if score > n.best:
+                    n.best = score
+
+    def delete(self, word: str) -> bool:
+        """
+        Deletes word and repairs the cached best scores along its path.
+        - Time: O(L·σ)
+        """
+        if not super().delete(word):
+            return False
+        # Nodes of the path that survived pruning
+        path = [self.root]
+        for ch in word:
+            node = path[-1].get(ch)
+            if node is None:
+                break
+            path.append(node)
+        if len(path) == len(word) + 1:
+            path[-1].score = None
+        for n in reversed(path):
+            n.refresh_best()
+        return True
+
+    def _word_data(self, node: WeightedTrieNode) -> str:
+        return f"{node.score!r};"  # The score, terminated by ';'
+
+    def _read_word_data(self, node: WeightedTrieNode, it) -> None:
+        text = []
+        ch = next(it)
+        while ch != ';':
+            text.append(ch)
+            ch = next(it)
+        text = ''.join(text)
+        try:
+            node.score = int(text)
+        except ValueError:
+            node.score = float(text)
+
+    def deserialize(self, data: str) -> None:
+        """
+        Rebuilds the trie from serialize() output, scores included, then
+        recomputes the cached best scores bottom-up.
+        - Time: O(N·σ), N = number of nodes
+        """
+        super().deserialize(data)
+        # Reverse preorder visits children before their parents
+        order, stack = [], Stack()
+        stack.push(self.root)
+        while not stack.is_empty():
+            node = stack.pop()
+            order.append(node)
+            stack.push_many(node.children)
+        for node in reversed(order):
+            node.refresh_best()
+
+    def score_of(self, word: str) -> Optional[float]:
+        """
+        Returns the score of word, or None if it is not stored.
+        - Time: O(L)
+        """
+        path = self._path(word)
+        if path is None or not path[-1].is_end_of_word:
+            return None
+        return path[-1].score
+
+    def top_k(self, prefix: str, k: int) -> List[Tuple[str, float]]:
+        """
+        Returns up to k (word, score) pairs starting with prefix, highest score
+        first (ties in lexicographic order).
+
+        A heap holds two kinds of entries: subtrees, ranked by their cached best
+        score, and finished words, ranked by their own score. Popping a word
+        emits it; popping a subtree pushes its own word and its children. A word
+        is only emitted once nothing left in the heap can beat it.
+        Time: O(k·L·σ·log(k·L·σ)), independent of the number of matching words
+        Space: O(k·L·σ)
+        """
+        path = self._path(prefix)
+        if path is None or k <= 0:
+            return []
+        node = path[-1]
+
+        # Entries are (priority, text, node); node is None for a finished word
+        frontier = MinHeap(key=lambda entry: (-entry[0], entry[1]))
+        frontier.insert((node.best, prefix, node))
+        results = []
+        while len(frontier) and len(results) < k:
+            priority, text, current = frontier.extract_min()
+            if current is None:
+                results.append((text, priority))
+                continue
+            if current.is_end_of_word:
+                frontier.insert((current.score, text, None))
+            for ch, child in zip(current.chars, current.children):
+                frontier.insert((child.best, text + ch, child))
+        return results
+
+
+if __name__ == "__main__":
+    ac = AutocompleteTrie()
+    for word, score in [("car", 50), ("cart", 80), ("cat", 20), ("care", 65), ("dog", 99)]:
+        ac.insert(word, score)
+    print(ac.top_k("ca", 2))   # [('cart', 80), ('care', 65)]
+    ac.delete("cart")
+    print(ac.top_k("ca", 2))   # [('care', 65), ('car', 50)]
@@ -0,0 +1,350 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+from Non_Linear.Trie.trie import Trie
+
+
+class DoubleArrayTrie:
+    """
+    An immutable trie packed into two typed arrays (base / check).
+
+    Every trie node is a state s (an array index, root = 0). The alphabet is
+    mapped to dense codes 1..σ in sorted order, and the child of s on code c
+    lives at t = base[s] + c, which is valid only if check[t] == s. A third
+    byte array marks the states where a word ends. Lookups are therefore a few
+    array reads per character with no per-node Python objects.
+
+    To enumerate children without probing all σ codes, first[s] holds the
+    code of s's smallest child and sibling[t] the code of the next child of
+    t's parent (0 ends either list).
+
+    Build one with from_trie() / from_words(), write it with save() and reopen
+    it with load(), which maps the file with mmap and queries it in place
+    without deserializing anything.
+    """
+
+    MAGIC = b"DATRIE02"
+    # magic, byte order flag, state count, alphabet byte length
+    _HEADER = struct.Struct("<8sBxxxII")
+    _EMPTY = -1   # check value of an unused slot
+
+    def __init__(self, base, check, end, first, sibling, alphabet: str, buffer=None):
+        """
+        Wraps already built arrays. Use from_trie(), from_words() or load() instead.
+        """
+        self.base = base
+        self.check = check
+        self.end = end
+        self.first = first
+        self.sibling = sibling
+        self.alphabet = alphabet
+        self.codes = {ch: i + 1 for i, ch in enumerate(alphabet)}
+        self._buffer = buffer  # Open mmap / file kept alive while the views are in use
+
+
+    @classmethod
+    def from_trie(cls, trie: Trie) -> "DoubleArrayTrie":
+        """
+        Compiles a Trie into a double array.
+        Nodes are placed breadth-first; for each node the smallest base is chosen
+        such that all its children land on free slots, scanning a linked list of
+        free cells rather than the whole array.
+        Time: O(N·F) worst case, N = number of trie nodes, F = free cells scanned
+        Space: O(N)
+        """
+        # Collect the alphabet actually used by the trie
+        symbols = set()
+        stack = [trie.root]
+        while stack:
+            node = stack.pop()
+            symbols.update(node.chars)
+            stack.extend(node.children)
+        alphabet = "".join(sorted(symbols))
+        codes = {ch: i + 1 for i, ch in enumerate(alphabet)}
+
+        base = array("i", [0])
+        check = array("i", [-2])   # Root slot is occupied and has no parent
+        end = array("B", [1 if trie.root.is_end_of_word else 0])
+
+        # Doubly linked list of free slots below len(check), so the base search
+        # only visits empty cells; every slot at or past len(check) is free.
+        # Index 0 (the root, never free) doubles as the list's sentinel.
+        nxt = [0]
+        prv = [0]
+
+        def grow(new_size: int) -> None:
+            old_size = len(check)
+            base.extend(array("i", [0]) * (new_size - old_size))
+            check.extend(array("i", [cls._EMPTY]) * (new_size - old_size))
+            end.extend(array("B", [0]) * (new_size - old_size))
+            for i in range(old_size, new_size):
+                last = prv[0]
+                nxt.append(0)
+                prv.append(last)
+                nxt[last] = i
+                prv[0] = i
+
+        def occupy(i: int) -> None:
+            nxt[prv[i]] = nxt[i]
+            prv[nxt[i]] = prv[i]
+
+        queue = [(trie.root, 0)]
+        head = 0
+        while head < len(queue):
+            node, state = queue[head]
+            head += 1
+            if not node.chars:
+                continue
+            child_codes = [codes[ch] for ch in node.chars]
+            first = child_codes[0]
+
+            # Find the smallest base that puts every child on a free slot,
+            # trying only bases that put the first child on a free cell
+            free = nxt[0]
+            while True:
+                if free == 0:
+                    b = max(len(check) - first, 0)  # Past the end, everything is free
+                    break
+                b = free - first
+                if b >= 0 and all(b + c >= len(check) or check[b + c] == cls._EMPTY
+                                  for c in child_codes):
+                    break
+                free = nxt[free]
+
+            top = b + child_codes[-1]
+            if top >= len(check):
+                grow(top + 1)
+
+            base[state] = b
+            for c, child in zip(child_codes, node.children):
+                t = b + c
+                check[t] = state
+                occupy(t)
+                end[t] = 1 if child.is_end_of_word else 0
+                queue.append((child, t))
+
+        first, sibling = cls._child_links(base, check)
+        return cls(base, check, end, first, sibling, alphabet)
+
+
+    @staticmethod
+    def _child_links(base, check) -> tuple[array, array]:
+        """
+        Builds first / sibling. Slots are visited from the highest down, and
+        for one parent a higher slot means a higher code, so pushing each child
+        in front of its parent's list leaves every list in ascending code order.
+        - Time: O(N)
+        """
+        size = len(check)
+        first = array("i", [0]) * size
+        sibling = array("i", [0]) * size
+        for t in range(size - 1, 0, -1):
+            parent = check[t]
+            if parent >= 0:
+                sibling[t] = first[parent]
+                first[parent] = t - base[parent]
+        return first, sibling
+
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "DoubleArrayTrie":
+        """
+        Builds a double-array trie from an iterable of words.
+        """
+        trie = Trie()
+        for word in words:
+            trie.insert(word)
+        return cls.from_trie(trie)
+
+
+    def _walk(self, prefix: str) -> int:
+        """
+        Follows prefix from the root. Returns the reached state, or -1.
+        - Time: O(P)
+        """
+        base, check, codes = self.base, self.check, self.codes
+        size = len(check)
+        state = 0
+        for ch in prefix:
+            c = codes.get(ch)
+            if c is None:
+                return -1
+            t = base[state] + c
+            if t >= size or check[t] != state:
+                return -1
+            state = t
+        return state
+
+
+    def search(self, word: str) -> bool:
+        """
+        Returns True if the word is stored as a complete word.
+        - Time: O(L)
+        - Space: O(1)
+        """
+        state = self._walk(word)
+        return state >= 0 and self.end[state] == 1
+
+
+    def starts_with(self, prefix: str) -> bool:
+        """
+        Returns True if any stored word starts with prefix.
+        - Time: O(L)
+        - Space: O(1)
+        """
+        return self._walk(prefix) >= 0
+
+
+    def words_with_prefix(self, prefix: str) -> list[str]:
+        """
+        Returns every stored word starting with prefix, in lexicographic order.
+        Children of a state are enumerated through the first / sibling links,
+        so only real children are visited whatever the alphabet size.
+        Time: O(P + M), M = number of states under the prefix
+        Space: O(N·L) for the result list
+        """
+        state = self._walk(prefix)
+        if state < 0:
+            return []
+        base, end, first, sibling, alphabet = self.base, self.end, self.first, self.sibling, self.alphabet
+        results = []
+        stack = [(state, prefix)]
+        while stack:
+            s, path = stack.pop()
+            if end[s]:
+                results.append(path)
+            b = base[s]
+            children = []
+            c = first[s]
+            while c:
+                t = b + c
+                children.append((t, path + alphabet[c - 1]))
+                c = sibling[t]
+            # Reverse code order on the stack so the smallest is popped first
+            children.reverse()
+            stack.extend(children)
+        return results
+
+
+    def __len__(self) -> int:
+        """Returns the number of slots in the double array."""
+        return len(self.check)
+
+
+    def save(self, path: str) -> None:
+        """
+        Writes the trie in a binary format that load() can mmap:
+          header | alphabet (UTF-8) | padding to 4 bytes
+          | base, check, first, sibling (int32 each) | end (uint8)
+        Arrays are written in native byte order, recorded in the header.
+        """
+        alphabet_bytes = self.alphabet.encode("utf-8")
+        header = self._HEADER.pack(self.MAGIC, 1 if sys.byteorder == "little" else 0,
+                                   len(self.check), len(alphabet_bytes))
+        padding = (-(len(header) + len(alphabet_bytes))) % 4
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(alphabet_bytes)
+            f.write(b"\0" * padding)
+            f.write(array("i", self.base).tobytes())
+            f.write(array("i", self.check).tobytes())
+            f.write(array("i", self.first).tobytes())
+            f.write(array("i", self.sibling).tobytes())
+            f.write(array("B", self.end).tobytes())
+
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "DoubleArrayTrie":
+        """
+        Opens a file written by save().
+        With use_mmap the arrays are zero-copy memoryviews over the mapped file,
+        so startup cost does not depend on the dictionary size; otherwise the
+        file is read into typed arrays.
+
+        Raises:
+            ValueError: If the file is not a double-array trie or is truncated
+                (the memory map, if any, is closed first).
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < cls._HEADER.size:
+                raise ValueError("Not a double-array trie file")
+            if use_mmap:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+
+        try:
+            magic, little, size, alphabet_len = cls._HEADER.unpack_from(buffer, 0)
+            if magic != cls.MAGIC:
+                raise ValueError("Not a double-array trie file")
+            offset = cls._HEADER.size
+            alphabet = bytes(buffer[offset:offset + alphabet_len]).decode("utf-8")
+            offset += alphabet_len
+            offset += (-offset) % 4
+            if len(buffer) < offset + 17 * size:
+                raise ValueError("Truncated double-array trie file")
+        except (ValueError, struct.error) as error:
+            if use_mmap:
+                buffer.close()
+            if isinstance(error, struct.error):
+                raise ValueError("Not a double-array trie file") from error
+            raise
+
+        native = (little == 1) == (sys.byteorder == "little")
+        view = memoryview(buffer)
+        arrays = [view[offset + 4 * size * i:offset + 4 * size * (i + 1)] for i in range(4)]
+        end = view[offset + 16 * size:offset + 17 * size]
+
+        if use_mmap and native:
+            base, check, first, sibling = (a.cast("i") for a in arrays)
+            return cls(base, check, end, first, sibling, alphabet, buffer)
+
+        # Copy into arrays (needed for a foreign byte order)
+        base, check, first, sibling = (array("i", a.tobytes()) for a in arrays)
+        if not native:
+            for a in (base, check, first, sibling):
+                a.byteswap()
+        result = cls(base, check, array("B", end.tobytes()), first, sibling, alphabet)
+        for a in arrays:
+            a.release()
+        end.release()
+        view.release()
+        if use_mmap:
+            buffer.close()
+        return result
+
+
+    def close(self) -> None:
+        """
+        Releases the memory map opened by load(). The trie must not be used afterwards.
+        """
+        if self._buffer is not None:
+            for view in (self.base, self.check, self.end, self.first, self.sibling):
+                if isinstance(view, memoryview):
+                    view.release()
+            self._buffer.close()
+            self._buffer = None
+
+
+    def __enter__(self) -> "DoubleArrayTrie":
+        return self
+
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    dat = DoubleArrayTrie.from_words(["cat", "car", "cart", "dog", "door"])
+    path = os.path.join(tempfile.gettempdir(), "words.dat")
+    dat.save(path)
+    with DoubleArrayTrie.load(path) as mapped:
+        print(mapped.search("cart"), mapped.search("ca"))   # True False
+        print(mapped.words_with_prefix("ca"))               # ['car', 'cart', 'cat']
+    os.remove(path)
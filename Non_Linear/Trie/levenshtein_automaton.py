@@ -0,0 +1,103 @@
+from typing import Dict, List, Optional, Tuple
+
+
+def next_row(query: str, row: List[int], ch: str) -> List[int]:
+    """
+    Extends one Levenshtein DP row by a character.
+    row[j] is the edit distance between the text read so far and query[:j];
+    the returned row is the same for that text followed by ch.
+    - Time: O(Q), Q = length of query
+    """
+    new_row = [row[0] + 1]
+    for j in range(1, len(query) + 1):
+        new_row.append(min(new_row[j - 1] + 1,                       # Insertion
+                           row[j] + 1,                               # Deletion
+                           row[j - 1] + (query[j - 1] != ch)))       # Substitution / match
+    return new_row
+
+
+class LevenshteinAutomaton:
+    """
+    A deterministic automaton accepting every string within max_dist edits of query.
+
+    A state is a DP row with every entry clipped to max_dist + 1, so only
+    finitely many states exist. Characters that do not occur in query all act
+    alike, so transitions are keyed by the character or a shared "other"
+    symbol and memoized. After compile() (or after enough queries) stepping
+    is a single dict lookup instead of an O(Q) row update, which pays off
+    when the same short query is matched against many strings or tries.
+    """
+
+    _OTHER = None  # Transition symbol shared by characters absent from query
+
+    def __init__(self, query: str, max_dist: int):
+        """
+        Raises:
+            ValueError: If max_dist is negative.
+        """
+        if max_dist < 0:
+            raise ValueError("max_dist must be non-negative")
+        self.query = query
+        self.max_dist = max_dist
+        self.letters = frozenset(query)
+        self.start = tuple(min(j, max_dist + 1) for j in range(len(query) + 1))
+        self.transitions: Dict[Tuple[Tuple[int, ...], Optional[str]], Tuple[int, ...]] = {}
+
+
+    def step(self, state: Tuple[int, ...], ch: str) -> Tuple[int, ...]:
+        """
+        Returns the state reached from state by reading ch.
+        - Time: O(1) when memoized, O(Q) otherwise
+        """
+        symbol = ch if ch in self.letters else self._OTHER
+        target = self.transitions.get((state, symbol))
+        if target is None:
+            cap = self.max_dist + 1
+            # Any character outside query never matches, like the shared symbol
+            row = next_row(self.query, list(state), ch if symbol is not None else "")
+            target = tuple(min(v, cap) for v in row)
+            self.transitions[(state, symbol)] = target
+        return target
+
+
+    def is_match(self, state: Tuple[int, ...]) -> bool:
+        """True if the text read so far is within max_dist of query."""
+        return state[-1] <= self.max_dist
+
+
+    def can_match(self, state: Tuple[int, ...]) -> bool:
+        """True if some continuation of the text read so far can still match."""
+        return min(state) <= self.max_dist
+
+
+    def distance(self, state: Tuple[int, ...]) -> int:
+        """Edit distance to query (exact when is_match(state), else max_dist + 1)."""
+        return state[-1]
+
+
+    def compile(self) -> int:
+        """
+        Eagerly builds every reachable live state and transition.
+        Returns the number of live states.
+        Time: O(S·Σ·Q), S = live states, Σ = distinct characters of query + 1
+        """
+        symbols = list(self.letters) + [""]
+        seen = {self.start}
+        pending = [self.start]
+        while pending:
+            state = pending.pop()
+            for ch in symbols:
+                target = self.step(state, ch)
+                if self.can_match(target) and target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+        return len(seen)
+
+
+if __name__ == "__main__":
+    dfa = LevenshteinAutomaton("cat", 1)
+    print(dfa.compile())  # Number of live states
+    state = dfa.start
+    for ch in "cart":
+        state = dfa.step(state, ch)
+    print(dfa.is_match(state), dfa.distance(state))  # True 1
@@ -0,0 +1,261 @@
+from bisect import bisect_left
+from typing import Optional, Tuple
+
+from Non_Linear.Trie.trie import TrieNode
+
+
+class RadixNode(TrieNode):
+    """
+    A node of a RadixTrie.
+
+    `label` is the string on the edge from the parent to this node. Children
+    are indexed by the first character of their label, using the same sorted
+    `chars` / `children` layout as TrieNode, so get() and remove() are inherited.
+    """
+
+    __slots__ = ("label",)
+
+    def __init__(self, label: str = ""):
+        super().__init__()
+        self.label = label
+
+    def attach(self, child: "RadixNode") -> None:
+        """
+        Adds child (keyed by its label's first character), replacing any child
+        that starts with the same character.
+        - Time: O(σ)
+        """
+        ch = child.label[0]
+        i = bisect_left(self.chars, ch)
+        if i < len(self.chars) and self.chars[i] == ch:
+            self.children = self.children[:i] + (child,) + self.children[i + 1:]
+        else:
+            self.chars = self.chars[:i] + ch + self.chars[i:]
+            self.children = self.children[:i] + (child,) + self.children[i:]
+
+
+class RadixTrie:
+    """
+    A radix tree (compressed trie / Patricia tree) with the same API as Trie.
+
+    Chains of single-child nodes are collapsed into one edge labelled with the
+    whole substring, so a URL or file path costs one node per branching point
+    instead of one node per character. Lookups compare whole edge labels at a
+    time (str.startswith), which cuts both node count and pointer chasing.
+    """
+
+    def __init__(self):
+        self.root = RadixNode()
+
+    def _locate(self, prefix: str) -> Tuple[Optional[RadixNode], str]:
+        """
+        Finds the topmost node whose subtree holds exactly the words starting with prefix.
+        Returns (node, path) where path is the full string spelled from the root
+        to node (it may extend past prefix in the middle of an edge), or (None, "").
+        - Time: O(P)
+        """
+        node, i = self.root, 0
+        while i < len(prefix):
+            child = node.get(prefix[i])
+            if child is None:
+                return None, ""
+            label = child.label
+            if prefix.startswith(label, i):
+                i += len(label)
+                node = child
+            elif label.startswith(prefix[i:]):
+                # prefix ends in the middle of this edge
+                return child, prefix[:i] + label
+            else:
+                return None, ""
+        return node, prefix
+
+    def insert(self, word: str) -> None:
+        """
+        Inserts a word into the RadixTrie, splitting an edge if the word diverges inside it.
+        - Time: O(L), where L = length of word
+        - Space: O(1) new nodes per insert (at most one split and one leaf)
+        """
+        node, i = self.root, 0
+        while i < len(word):
+            child = node.get(word[i])
+            if child is None:
+                leaf = RadixNode(word[i:])
+                leaf.is_end_of_word = True
+                node.attach(leaf)
+                return
+
+            label = child.label
+            if word.startswith(label, i):
+                node = child
+                i += len(label)
+                continue
+
+            # Length of the common prefix of label and word[i:]
+            common = 1
+            while common < len(label) and i + common < len(word) and label[common] == word[i + common]:
+                common += 1
+
+            # Split the edge: node -> mid(label[:common]) -> child(label[common:])
+            mid = RadixNode(label[:common])
+            child.label = label[common:]
+            mid.attach(child)
+            node.attach(mid)
+
+            i += common
+            if i == len(word):
+                mid.is_end_of_word = True
+            else:
+                leaf = RadixNode(word[i:])
+                leaf.is_end_of_word = True
+                mid.attach(leaf)
+            return
+        node.is_end_of_word = True
+
+
+    def search(self, word: str) -> bool:
+      """
+      Returns True if the word exists in the RadixTrie as a complete word, else False.
+      - Time: O(L), where L = length of word
+      - Space: O(1)
+      """
+      node, i = self.root, 0
+      while i < len(word):
+          child = node.get(word[i])
+          if child is None or not word.startswith(child.label, i):
+              return False
+          i += len(child.label)
+          node = child
+      return node.is_end_of_word
+
+
+    def starts_with(self, prefix: str) -> bool:
+      """
+      Returns True if any word in the RadixTrie starts with the given prefix.
+      - Time: O(L), where L = length of prefix
+      - Space: O(1)
+      """
+      return self._locate(prefix)[0] is not None
+
+
+    def words_with_prefix(self, prefix: str) -> list[str]:
+        """
+        Returns all words that start with the given prefix, in lexicographic order.
+        Time: O(P + N*L)
+        Space: O(N*L) for the result list
+        """
+        node, path = self._locate(prefix)
+        if node is None:
+            return []
+        results = []
+        stack = [(node, path)]
+        while stack:
+            current, current_path = stack.pop()
+            if current.is_end_of_word:
+                results.append(current_path)
+            # Push in reverse so the smallest child is processed first
+            for child in reversed(current.children):
+                stack.append((child, current_path + child.label))
+        return results
+
+
+    def count_words_with_prefix(self, prefix: str) -> int:
+        """
+        Returns the count of words that start with the given prefix.
+        Time: O(P + M), M = number of nodes under the prefix
+        Space: O(H)
+        """
+        node, _ = self._locate(prefix)
+        if node is None:
+            return 0
+        count = 0
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.is_end_of_word:
+                count += 1
+            stack.extend(current.children)
+        return count
+
+
+    def delete(self, word: str) -> bool:
+        """
+        Deletes a word. Returns True if the word was present.
+        Afterwards, a node left with no word and a single child is merged with
+        that child so the tree stays fully compressed.
+        - Time: O(L)
+        """
+        path = [self.root]
+        i = 0
+        while i < len(word):
+            child = path[-1].get(word[i])
+            if child is None or not word.startswith(child.label, i):
+                return False
+            i += len(child.label)
+            path.append(child)
+
+        node = path[-1]
+        if not node.is_end_of_word:
+            return False
+        node.is_end_of_word = False
+
+        if node is self.root:
+            return True
+        parent = path[-2]
+        if not node.children:
+            parent.remove(node.label[0])
+            # The parent may now be a word-less pass-through node
+            if parent is not self.root and not parent.is_end_of_word and len(parent.children) == 1:
+                self._merge_with_child(parent, path[-3])
+        elif len(node.children) == 1:
+            self._merge_with_child(node, parent)
+        return True
+
+
+    @staticmethod
+    def _merge_with_child(node: RadixNode, parent: RadixNode) -> None:
+        """Replace node by its only child, concatenating the two edge labels."""
+        child = node.children[0]
+        child.label = node.label + child.label
+        parent.attach(child)
+
+
+    def longest_prefix_match(self, query: str) -> str:
+        """
+        Returns the longest word in the RadixTrie that is a prefix of query.
+        - Time: O(L), L = length of query
+        """
+        node, i = self.root, 0
+        longest = 0
+        while i < len(query):
+            child = node.get(query[i])
+            if child is None or not query.startswith(child.label, i):
+                break
+            i += len(child.label)
+            node = child
+            if node.is_end_of_word:
+                longest = i
+        return query[:longest]
+
+
+    def node_count(self) -> int:
+        """
+        Returns the number of nodes, including the root.
+        - Time: O(N)
+        """
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children)
+        return count
+
+
+if __name__ == "__main__":
+    routes = RadixTrie()
+    for route in ["/api/v1/users", "/api/v1/users/settings", "/api/v1/orders", "/static/"]:
+        routes.insert(route)
+    print(routes.longest_prefix_match("/api/v1/users/42"))   # /api/v1/users
+    print(routes.words_with_prefix("/api/v1/"))
+    print(routes.node_count())                                # 7 nodes instead of 40+
@@ -1,32 +1,101 @@
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+
+from Non_Linear.Trie.levenshtein_automaton import LevenshteinAutomaton, next_row
+
+
 class TrieNode:
+    """
+    A compact Trie node.
+
+    Children are stored as a sorted string of characters (`chars`) and a
+    parallel tuple of child nodes (`children`), looked up with binary search.
+    Leaves share the empty string and empty tuple singletons, so a node costs
+    four slots instead of 26 preallocated pointers, and any Unicode character
+    can be used as an edge label.
+
+    `prefix_count` is the number of words stored in this node's subtree
+    (including a word ending here), kept up to date by Trie.insert/delete.
+    """
+
+    __slots__ = ("chars", "children", "is_end_of_word", "prefix_count")
+
     def __init__(self):
-        # Array of 26 children: one for each lowercase letter
-        self.children = [None] * 26
+        self.chars = ""           # Sorted child characters
+        self.children = ()        # children[i] is the child reached by chars[i]
         self.is_end_of_word = False
+        self.prefix_count = 0     # Words in this subtree
+
+    def get(self, ch: str) -> Optional["TrieNode"]:
+        """
+        Returns the child reached by ch, or None.
+        - Time: O(log σ), σ = number of children
+        """
+        i = bisect_left(self.chars, ch)
+        if i < len(self.chars) and self.chars[i] == ch:
+            return self.children[i]
+        return None
+
+    def add(self, ch: str) -> "TrieNode":
+        """
+        Returns the child reached by ch, creating it if needed.
+        - Time: O(σ) when a child is created (sorted insert), O(log σ) otherwise
+        """
+        i = bisect_left(self.chars, ch)
+        if i < len(self.chars) and self.chars[i] == ch:
+            return self.children[i]
+        child = self.__class__()  # Subclasses get children of their own node type
+        self.chars = self.chars[:i] + ch + self.chars[i:]
+        self.children = self.children[:i] + (child,) + self.children[i:]
+        return child
+
+    def remove(self, ch: str) -> None:
+        """
+        Removes the child reached by ch (if any).
+        - Time: O(σ)
+        """
+        i = bisect_left(self.chars, ch)
+        if i < len(self.chars) and self.chars[i] == ch:
+            self.chars = self.chars[:i] + self.chars[i + 1:]
+            self.children = self.children[:i] + self.children[i + 1:]
+
 
 class Trie:
     def __init__(self):
         self.root = TrieNode()
 
-    def _char_to_index(self, ch: str) -> int:
+    def _find_node(self, prefix: str) -> Optional[TrieNode]:
         """
-        Converts a character 'a'-'z' to a 0-based index.
+        Follows prefix from the root and returns the node it ends at, or None.
+        - Time: O(P log σ), P = length of prefix
         """
-        return ord(ch) - ord('a')
+        node = self.root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return None  # Path breaks
+        return node
+
+    @property
+    def total_words(self) -> int:
+        """Number of distinct words stored. Time: O(1)"""
+        return self.root.prefix_count
+
 
     def insert(self, word: str) -> None:
         """
-        Inserts a word into the Trie.
+        Inserts a word into the Trie. Re-inserting an existing word changes nothing.
         - Time: O(L), where L = length of word
         - Space: O(L), new nodes only for new characters
         """
-        node = self.root
+        path = [self.root]
         for ch in word:
-            idx = self._char_to_index(ch)
-            if node.children[idx] is None:
-                node.children[idx] = TrieNode()
-            node = node.children[idx]
-        node.is_end_of_word = True
+            path.append(path[-1].add(ch))
+        if path[-1].is_end_of_word:
+            return  # Already stored, counters stay as they are
+        path[-1].is_end_of_word = True
+        for node in path:
+            node.prefix_count += 1
 
 
     def search(self, word: str) -> bool:
@@ -35,14 +104,9 @@ class Trie:
       - Time: O(L), where L = length of word
       - Space: O(1)
       """
-      node = self.root
-      for ch in word:
-          idx = self._char_to_index(ch)
-          if node.children[idx] is None:
-              return False  # Path breaks: word not present
-          node = node.children[idx]
-      return node.is_end_of_word  # Only True if word ends here
-    
+      node = self._find_node(word)
+      return node is not None and node.is_end_of_word  # Only True if word ends here
+
 
     def starts_with(self, prefix: str) -> bool:
       """
@@ -50,92 +114,151 @@ class Trie:
       - Time: O(L), where L = length of prefix
       - Space: O(1)
       """
-      node = self.root
-      for ch in prefix:
-          idx = self._char_to_index(ch)
-          if node.children[idx] is None:
-              return False  # Path breaks: no word with this prefix
-          node = node.children[idx]
-      return True  # Successfully followed all prefix characters
+      return self._find_node(prefix) is not None
 
 
     def words_with_prefix(self, prefix: str) -> list[str]:
         """
-        Returns a list of all words in the Trie that start with the given prefix.
+        Returns a list of all words in the Trie that start with the given prefix,
+        in lexicographic (code point) order.
         Time: O(P + N*L) (P = prefix length, N = #words, L = avg word length under prefix)
         Space: O(N*L) for result list and call stack
         """
         def dfs(node: TrieNode, path: str, results: list):
             if node.is_end_of_word:
                 results.append(path)
-            for idx in range(26):
-                child = node.children[idx]
-                if child:
-                    dfs(child, path + chr(idx + ord('a')), results)
+            for ch, child in zip(node.chars, node.children):
+                dfs(child, path + ch, results)
 
         # First, find node matching the prefix
-        node = self.root
-        for ch in prefix:
-            idx = self._char_to_index(ch)
-            if node.children[idx] is None:
-                return []  # Prefix not in Trie
-            node = node.children[idx]
+        node = self._find_node(prefix)
+        if node is None:
+            return []  # Prefix not in Trie
         results = []
         dfs(node, prefix, results)
         return results
-    
+
 
     def count_words_with_prefix(self, prefix: str) -> int:
         """
         Returns the count of words in the Trie that start with the given prefix.
-        Time: O(P + N·L), P=prefix length, N=words under prefix, L=avg length
-        Space: O(H), H=height of Trie under prefix node (recursion stack)
+        Reads the cached counter of the prefix node instead of walking its subtree.
+        Time: O(P log σ), P=prefix length
+        Space: O(1)
         """
-        def dfs_count(node: TrieNode) -> int:
-            count = 1 if node.is_end_of_word else 0
-            for child in node.children:
-                if child:
-                    count += dfs_count(child)
-            return count
+        node = self._find_node(prefix)
+        if node is None:
+            return 0  # Prefix not in Trie
+        return node.prefix_count
+
 
-        # Find the node at the end of the prefix
+    def kth_word(self, k: int) -> str:
+        """
+        Returns the k-th word (0-based) in lexicographic order.
+        Children are sorted, so each level skips whole subtrees by their counters.
+        - Time: O(L·σ), L = length of the result
+
+        Raises:
+            IndexError: If k is not in [0, total_words).
+        """
+        if not 0 <= k < self.root.prefix_count:
+            raise IndexError("Word index out of range")
         node = self.root
-        for ch in prefix:
-            idx = self._char_to_index(ch)
-            if node.children[idx] is None:
-                return 0  # Prefix not in Trie
-            node = node.children[idx]
-        return dfs_count(node)
+        chars = []
+        while True:
+            if node.is_end_of_word:
+                if k == 0:
+                    return "".join(chars)
+                k -= 1  # A word ending here sorts before everything below it
+            for ch, child in zip(node.chars, node.children):
+                if k < child.prefix_count:
+                    chars.append(ch)
+                    node = child
+                    break
+                k -= child.prefix_count
+
+
+    def fuzzy_search(self, query: str, max_dist: int,
+                     automaton: Optional[LevenshteinAutomaton] = None) -> List[Tuple[str, int]]:
+        """
+        Returns (word, distance) for every word within max_dist edits
+        (Levenshtein distance) of query, in lexicographic order.
+
+        The trie is walked depth-first carrying one DP row per depth, so words
+        sharing a prefix share its rows; a branch is pruned as soon as its row
+        minimum exceeds max_dist. Passing a LevenshteinAutomaton for the same
+        query and max_dist replaces the O(Q) row update by a memoized
+        transition, which helps for short queries reused across searches.
+        Time: O(M·Q), M = trie nodes visited before pruning, Q = length of query
+        Space: O(H·Q), H = height of the trie
+
+        Raises:
+            ValueError: If max_dist is negative or the automaton was built for
+                a different query or distance.
+        """
+        if max_dist < 0:
+            raise ValueError("max_dist must be non-negative")
+        results = []
+
+        if automaton is not None:
+            if automaton.query != query or automaton.max_dist != max_dist:
+                raise ValueError("Automaton does not match query and max_dist")
+            stack = [(self.root, "", automaton.start)]
+            while stack:
+                node, path, state = stack.pop()
+                if node.is_end_of_word and automaton.is_match(state):
+                    results.append((path, automaton.distance(state)))
+                # Push in reverse so the smallest child is processed first
+                for i in range(len(node.chars) - 1, -1, -1):
+                    ch = node.chars[i]
+                    child_state = automaton.step(state, ch)
+                    if automaton.can_match(child_state):
+                        stack.append((node.children[i], path + ch, child_state))
+            return results
+
+        stack = [(self.root, "", list(range(len(query) + 1)))]
+        while stack:
+            node, path, row = stack.pop()
+            if node.is_end_of_word and row[-1] <= max_dist:
+                results.append((path, row[-1]))
+            for i in range(len(node.chars) - 1, -1, -1):
+                ch = node.chars[i]
+                child_row = next_row(query, row, ch)
+                if min(child_row) <= max_dist:  # Otherwise no extension can recover
+                    stack.append((node.children[i], path + ch, child_row))
+        return results
 
 
     def delete(self, word: str) -> bool:
         """
         Deletes a word from the Trie. Returns True if the word was present and is now unmarked.
+        Nodes that no longer lead to any word are pruned.
+        - Time: O(L)
+        - Space: O(L) for the path
         """
-        deleted = False
-
-        def _delete(node: TrieNode, word: str, depth: int) -> bool:
-            nonlocal deleted
+        path = [self.root]
+        for ch in word:
+            node = path[-1].get(ch)
             if node is None:
                 return False
-            if depth == len(word):
-                if not node.is_end_of_word:
-                    return False
-                node.is_end_of_word = False
-                deleted = True  # Mark as found and deleted
-                return not any(node.children)
-            idx = self._char_to_index(word[depth])
-            child = node.children[idx]
-            should_delete_child = _delete(child, word, depth + 1)
-            if should_delete_child:
-                node.children[idx] = None
-                return not node.is_end_of_word and not any(node.children)
+            path.append(node)
+
+        node = path[-1]
+        if not node.is_end_of_word:
             return False
+        node.is_end_of_word = False
+        for ancestor in path:
+            ancestor.prefix_count -= 1
+
+        # Walk back up, removing nodes that are now useless
+        for depth in range(len(word), 0, -1):
+            current = path[depth]
+            if current.is_end_of_word or current.children:
+                break
+            path[depth - 1].remove(word[depth - 1])
+        return True
+
 
-        _delete(self.root, word, 0)
-        return deleted
-          
-    
     def longest_prefix_match(self, query: str) -> str:
         """
         Returns the longest word in the Trie that is a prefix of query.
@@ -144,10 +267,9 @@ class Trie:
         node = self.root
         longest = 0
         for i, ch in enumerate(query):
-            idx = self._char_to_index(ch)
-            if idx < 0 or idx >= 26 or node.children[idx] is None:
+            node = node.get(ch)
+            if node is None:
                 break
-            node = node.children[idx]
             if node.is_end_of_word:
                 longest = i + 1
         return query[:longest]
@@ -158,20 +280,20 @@ class Trie:
         Serializes the Trie into a string.
         Preorder: for each node, record:
           - 1/0 for is_end_of_word
-          - two-digit child count
+          - after a 1, any per-word data a subclass adds (_word_data)
+          - child count in decimal, terminated by ':'
           - For each child: character + child's serialization
         """
         def serialize_node(node):
             result = []
             result.append('1' if node.is_end_of_word else '0')
-            # Count children
-            count = sum(child is not None for child in node.children)
-            result.append(f"{count:02d}")
+            if node.is_end_of_word:
+                result.append(self._word_data(node))
+            result.append(f"{len(node.chars)}:")
             # Serialize children
-            for idx, child in enumerate(node.children):
-                if child:
-                    result.append(chr(idx + ord('a')))
-                    result.append(serialize_node(child))
+            for ch, child in zip(node.chars, node.children):
+                result.append(ch)
+                result.append(serialize_node(child))
             return ''.join(result)
         return serialize_node(self.root)
 
@@ -179,20 +301,35 @@ class Trie:
         """
         Deserializes the string and rebuilds the Trie.
         """
-        self.root = TrieNode()
+        node_type = type(self.root)  # Subclasses keep their own node type
+
         def deserialize_node(it):
-            node = TrieNode()
+            node = node_type()
             node.is_end_of_word = (next(it) == '1')
-            # Read two digits for child count
-            count = int(next(it) + next(it))
-            for _ in range(count):
+            if node.is_end_of_word:
+                self._read_word_data(node, it)
+            # Read the child count up to the ':' terminator
+            digits = []
+            ch = next(it)
+            while ch != ':':
+                digits.append(ch)
                 ch = next(it)
-                idx = self._char_to_index(ch)
-                node.children[idx] = deserialize_node(it)
+            chars, children = [], []
+            for _ in range(int(''.join(digits))):
+                chars.append(next(it))
+                children.append(deserialize_node(it))
+            # Children were serialized in sorted order, so no re-sorting is needed
+            node.chars = ''.join(chars)
+            node.children = tuple(children)
+            node.prefix_count = node.is_end_of_word + sum(c.prefix_count for c in children)
             return node
 
         it = iter(data)
         self.root = deserialize_node(it)
 
+    def _word_data(self, node: TrieNode) -> str:
+        """Extra data serialized after the flag of a word's last node (none for Trie)."""
+        return ""
 
-
+    def _read_word_data(self, node: TrieNode, it) -> None:
+        """Reads back what _word_data() wrote, from the character iterator it."""
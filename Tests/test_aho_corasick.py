@@ -0,0 +1,77 @@
+import random
+import unittest
+from Non_Linear.Trie.aho_corasick import AhoCorasick
+from Non_Linear.Trie.trie import Trie
+
+
+def naive_matches(text, patterns):
+    found = []
+    for end in range(1, len(text) + 1):
+        for pattern in sorted(set(patterns), key=len, reverse=True):
+            if pattern and text.startswith(pattern, end - len(pattern)) and end >= len(pattern):
+                found.append((end - len(pattern), pattern))
+    return found
+
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def setUp(self):
+        self.patterns = ["he", "she", "his", "hers"]
+        self.dense = AhoCorasick.from_words(self.patterns)
+        self.sparse = AhoCorasick.from_words(self.patterns, dense_limit=0)
+
+    def test_classic_example(self):
+        expected = [(1, "she"), (2, "he"), (2, "hers")]
+        self.assertEqual(self.dense.find_all("ushers"), expected)
+        self.assertEqual(self.sparse.find_all("ushers"), expected)
+        self.assertTrue(self.dense.dense)
+        self.assertFalse(self.sparse.dense)
+
+    def test_dense_table_size_limit(self):
+        self.assertEqual(self.dense.table.itemsize, 4)
+        cells = len(self.dense) * len(self.dense.alphabet)
+        self.assertTrue(AhoCorasick.from_words(self.patterns, dense_limit=cells).dense)
+        small = AhoCorasick.from_words(self.patterns, dense_limit=cells - 1)
+        self.assertFalse(small.dense)
+        self.assertIsNone(small.table)
+        self.assertEqual(small.find_all("ushers"), self.dense.find_all("ushers"))
+
+    def test_from_trie(self):
+        trie = Trie()
+        for word in self.patterns:
+            trie.insert(word)
+        matcher = AhoCorasick(trie)
+        self.assertEqual(matcher.find_all("this"), [(1, "his")])
+        self.assertEqual(trie.words_with_prefix(""), sorted(self.patterns))  # Trie untouched
+
+    def test_stream_across_chunks(self):
+        for matcher in (self.dense, self.sparse):
+            matcher.reset()
+            found = []
+            for chunk in ["us", "h", "", "ers sh", "e"]:
+                found.extend(matcher.feed(chunk))
+            self.assertEqual(found, [(1, "she"), (2, "he"), (2, "hers"), (7, "she"), (8, "he")])
+
+    def test_unknown_characters_and_no_patterns(self):
+        self.assertEqual(self.dense.find_all("xyz hxe"), [])
+        empty = AhoCorasick.from_words([""])
+        self.assertEqual(empty.find_all("abc"), [])
+
+    def test_random_against_naive(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            patterns = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                        for _ in range(rng.randint(1, 8))]
+            text = "".join(rng.choice("abcd") for _ in range(60))
+            expected = naive_matches(text, patterns)
+            for limit in (1 << 20, 0):
+                matcher = AhoCorasick.from_words(patterns, dense_limit=limit)
+                self.assertEqual(matcher.find_all(text), expected)
+                matcher.reset()
+                cut = rng.randint(0, len(text))
+                streamed = list(matcher.feed(text[:cut])) + list(matcher.feed(text[cut:]))
+                self.assertEqual(streamed, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
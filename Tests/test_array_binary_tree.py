@@ -0,0 +1,68 @@
+import unittest
+from Non_Linear.Trees.array_binary_tree import ArrayBinaryTree
+from Non_Linear.Trees.binary_tree import CompleteBinaryTree
+
+
+class TestArrayBinaryTree(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = ArrayBinaryTree(range(1, 8))
+
+    def test_traversals(self):
+        self.assertEqual(self.tree.inorder(), [4, 2, 5, 1, 6, 3, 7])
+        self.assertEqual(self.tree.preorder(), [1, 2, 4, 5, 3, 6, 7])
+        self.assertEqual(self.tree.postorder(), [4, 5, 2, 6, 7, 3, 1])
+        self.assertEqual(self.tree.level_order_traversal(), [1, 2, 3, 4, 5, 6, 7])
+
+    def test_matches_linked_complete_tree(self):
+        for n in range(0, 40):
+            flat = ArrayBinaryTree(range(n))
+            linked = CompleteBinaryTree(range(n))
+            self.assertEqual(flat.inorder(), linked.inorder())
+            self.assertEqual(flat.preorder(), linked.preorder())
+            self.assertEqual(flat.postorder(), linked.postorder())
+            self.assertEqual(flat.height(), linked.height())
+            self.assertEqual(flat.count_leaf_nodes(), linked.count_leaf_nodes())
+            self.assertEqual(flat.diameter(), linked.diameter())
+            if n > 1:
+                self.assertEqual(flat.lowest_common_ancestor(n - 1, n // 2),
+                                 linked.lowest_common_ancestor(n - 1, n // 2))
+
+    def test_insert_search_delete(self):
+        self.tree.insert(8)
+        self.assertTrue(self.tree.search(8))
+        self.assertTrue(self.tree.delete(2))
+        self.assertEqual(self.tree.level_order_traversal(), [1, 8, 3, 4, 5, 6, 7])
+        self.assertFalse(self.tree.delete(42))
+        self.assertFalse(self.tree.search(2))
+
+    def test_lca(self):
+        self.assertEqual(self.tree.lowest_common_ancestor(4, 5), 2)
+        self.assertEqual(self.tree.lowest_common_ancestor(4, 7), 1)
+        self.assertEqual(self.tree.lowest_common_ancestor(2, 4), 2)
+        # Missing values follow BinaryTree.lowest_common_ancestor
+        for p_val, q_val in ((4, 99), (99, 6), (98, 99)):
+            self.assertEqual(self.tree.lowest_common_ancestor(p_val, q_val),
+                             CompleteBinaryTree(range(1, 8)).lowest_common_ancestor(p_val, q_val))
+        self.assertEqual(self.tree.lowest_common_ancestor(4, 99), 4)
+        self.assertIsNone(self.tree.lowest_common_ancestor(98, 99))
+
+    def test_level_order_view_is_zero_copy(self):
+        with self.tree.level_order_view() as view:
+            self.assertEqual(view.tolist(), [1, 2, 3, 4, 5, 6, 7])
+            self.assertTrue(view.readonly)
+            self.tree.data[0] = 10
+            self.assertEqual(view[0], 10)  # Same memory as the tree
+        self.tree.insert(8)  # Allowed again once the view is released
+
+    def test_empty_and_float_tree(self):
+        empty = ArrayBinaryTree()
+        self.assertEqual(empty.inorder(), [])
+        self.assertEqual(empty.height(), 0)
+        self.assertEqual(empty.diameter(), 0)
+        floats = ArrayBinaryTree([0.5, 1.5], typecode="d")
+        self.assertEqual(floats.inorder(), [1.5, 0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# test_augmented_bst.py
+
+import random
+
+from Non_Linear.Trees.augmented_bst import AugmentedAVLTree, AugmentedBST
+from Non_Linear.Trees.binary_tree import BinaryTree, Node
+from Non_Linear.Trees.bst import BST
+
+
+def max_path_sum(bst):
+    """Reference value from BinaryTree.max_path_sum on a copy of the tree."""
+    def copy(node):
+        if node is None:
+            return None
+        clone = Node(node.key)
+        clone.left, clone.right = copy(node.left), copy(node.right)
+        return clone
+    tree = BinaryTree()
+    tree.root = copy(bst.root)
+    return tree.max_path_sum()
+
+def assert_matches(tree, reference):
+    """Cached queries equal the plain BST's full-traversal answers."""
+    assert tree.inorder() == reference.inorder()
+    assert tree.sum_nodes() == reference.sum_nodes()
+    assert tree.height() == BST.height(tree)
+    assert tree.leaf_count() == BST.leaf_count(tree)
+    assert tree.is_balanced() == BST.is_balanced(tree)
+    assert tree.diameter() == BST.diameter(tree)
+    assert tree.max_path_sum() == max_path_sum(tree)
+    assert tree.count_nodes() == reference.count_nodes()
+    if reference.root:
+        assert tree.min().key == reference.min().key
+        assert tree.max().key == reference.max().key
+    else:
+        assert tree.min() is None and tree.max() is None
+
+def test_random_inserts_and_deletes():
+    rng = random.Random(3)
+    for cls in (AugmentedBST, AugmentedAVLTree):
+        tree, reference = cls(), BST()
+        for _ in range(400):
+            key = rng.randint(-60, 60)
+            if rng.random() < 0.6:
+                tree.insert(key)
+                reference.insert(key)
+            else:
+                tree.delete(key)
+                reference.delete(key)
+            assert_matches(tree, reference)
+
+def test_empty_tree():
+    tree = AugmentedBST()
+    assert tree.sum_nodes() == 0
+    assert tree.height() == -1
+    assert tree.leaf_count() == 0
+    assert tree.is_balanced()
+    assert tree.diameter() == 0
+    assert tree.max_path_sum() == float('-inf')
+    assert tree.sum_range(0, 10) == 0
+
+def test_sum_range():
+    tree = AugmentedBST()
+    keys = [50, 30, 70, 20, 40, 60, 80, 35, 65]
+    for key in keys:
+        tree.insert(key)
+    for lo in range(15, 90, 5):
+        for hi in range(lo - 5, 90, 5):
+            assert tree.sum_range(lo, hi) == sum(k for k in keys if lo <= k <= hi)
+
+def test_from_sorted_and_bytes():
+    tree = AugmentedAVLTree.from_sorted(range(1, 101))
+    assert tree.sum_nodes() == 5050
+    assert tree.height() == 6
+    loaded = AugmentedBST.from_bytes(tree.to_bytes())
+    assert isinstance(loaded.root, type(tree.root))
+    assert loaded.sum_nodes() == 5050
+    assert loaded.diameter() == BST.diameter(loaded)
+
+def test_avl_stays_balanced():
+    tree = AugmentedAVLTree()
+    for key in range(2000):
+        tree.insert(key)
+    assert tree.height() <= 11
+    assert tree.is_balanced()
+    assert tree.sum_range(100, 199) == sum(range(100, 200))
@@ -0,0 +1,84 @@
+import random
+import unittest
+from Non_Linear.Trie.autocomplete_trie import AutocompleteTrie
+
+
+class TestAutocompleteTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = AutocompleteTrie()
+        self.scores = {"car": 50, "cart": 80, "cat": 20, "care": 65, "dog": 99, "c": 10}
+        for word, score in self.scores.items():
+            self.trie.insert(word, score)
+
+    def brute_force(self, prefix, k):
+        matches = [(w, s) for w, s in self.scores.items() if w.startswith(prefix)]
+        matches.sort(key=lambda pair: (-pair[1], pair[0]))
+        return matches[:k]
+
+    def test_top_k(self):
+        self.assertEqual(self.trie.top_k("ca", 2), [("cart", 80), ("care", 65)])
+        self.assertEqual(self.trie.top_k("", 1), [("dog", 99)])
+        self.assertEqual(self.trie.top_k("c", 10), self.brute_force("c", 10))
+
+    def test_missing_prefix_and_zero_k(self):
+        self.assertEqual(self.trie.top_k("x", 3), [])
+        self.assertEqual(self.trie.top_k("ca", 0), [])
+
+    def test_ties_are_lexicographic(self):
+        for word in ["bb", "ba", "bc"]:
+            self.trie.insert(word, 7)
+        self.assertEqual(self.trie.top_k("b", 3), [("ba", 7), ("bb", 7), ("bc", 7)])
+
+    def test_update_score(self):
+        self.trie.insert("cart", 5)      # Lowered: "cart" was the best under "ca"
+        self.assertEqual(self.trie.score_of("cart"), 5)
+        self.assertEqual(self.trie.top_k("ca", 1), [("care", 65)])
+        self.trie.insert("cat", 100)     # Raised
+        self.assertEqual(self.trie.top_k("", 1), [("cat", 100)])
+
+    def test_delete(self):
+        self.assertTrue(self.trie.delete("cart"))
+        self.assertFalse(self.trie.delete("cart"))
+        self.assertIsNone(self.trie.score_of("cart"))
+        self.assertEqual(self.trie.top_k("car", 5), [("care", 65), ("car", 50)])
+        self.assertTrue(self.trie.delete("car"))
+        self.assertEqual(self.trie.top_k("car", 5), [("care", 65)])
+        self.assertTrue(self.trie.search("care"))
+
+    def test_inherited_queries(self):
+        self.assertEqual(self.trie.words_with_prefix("car"), ["car", "care", "cart"])
+        self.assertEqual(self.trie.longest_prefix_match("cartoon"), "cart")
+
+    def test_random_against_brute_force(self):
+        rng = random.Random(7)
+        self.trie = AutocompleteTrie()
+        self.scores = {}
+        for _ in range(500):
+            word = "".join(rng.choice("abc") for _ in range(rng.randint(1, 6)))
+            if rng.random() < 0.2 and word in self.scores:
+                self.trie.delete(word)
+                del self.scores[word]
+            else:
+                score = rng.randint(0, 50)
+                self.trie.insert(word, score)
+                self.scores[word] = score
+        for prefix in ["", "a", "ab", "cab", "bbb"]:
+            for k in (1, 3, 10):
+                self.assertEqual(self.trie.top_k(prefix, k), self.brute_force(prefix, k))
+
+    def test_serialize_round_trip(self):
+        self.trie.insert("naïve", -2.5)
+        restored = AutocompleteTrie()
+        restored.deserialize(self.trie.serialize())
+        self.assertIsInstance(restored.root, type(self.trie.root))
+        for prefix in ("", "c", "ca", "na"):
+            self.assertEqual(restored.top_k(prefix, 10), self.trie.top_k(prefix, 10))
+        self.assertEqual(restored.score_of("naïve"), -2.5)
+        self.assertEqual(restored.total_words, self.trie.total_words)
+        restored.insert("cab", 1000)
+        self.assertEqual(restored.top_k("ca", 1), [("cab", 1000)])
+
+
+if __name__ == "__main__":
+    unittest.main()
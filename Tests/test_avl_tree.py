@@ -0,0 +1,108 @@
+# test_avl_tree.py
+
+import random
+
+from Non_Linear.Trees.avl_tree import AVLTree
+
+
+def check_avl(node):
+    """Returns the height of node's subtree, asserting the AVL invariants."""
+    if node is None:
+        return -1
+    left, right = check_avl(node.left), check_avl(node.right)
+    assert node.left is None or node.left.key < node.key
+    assert node.right is None or node.right.key > node.key
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    assert node.size == 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+    return node.height
+
+def test_sorted_inserts_stay_balanced():
+    tree = AVLTree()
+    for v in range(1, 1024):
+        tree.insert(v)
+    assert tree.height() == 9
+    assert tree.is_balanced()
+    check_avl(tree.root)
+
+def test_deep_sorted_input_has_no_recursion_error():
+    tree = AVLTree()
+    for v in range(5000):
+        tree.insert(v)
+    assert tree.height() <= 13
+    assert tree.inorder() == list(range(5000))
+
+def test_bst_api():
+    tree = AVLTree()
+    for v in [10, 5, 20, 2, 7, 15]:
+        tree.insert(v)
+    tree.insert(10)  # Duplicate ignored
+    assert tree.count_nodes() == 6
+    assert tree.search(7).key == 7
+    assert tree.contains(15) and not tree.contains(99)
+    assert tree.min().key == 2 and tree.max().key == 20
+    assert tree.lowest_common_ancestor(2, 7).key == 5
+    assert tree.level_order() == [10, 5, 20, 2, 7, 15]
+
+def test_delete_rebalances():
+    tree = AVLTree()
+    for v in range(1, 32):
+        tree.insert(v)
+    for v in range(1, 16):
+        tree.delete(v)
+    tree.delete(99)  # Missing key ignored
+    assert tree.inorder() == list(range(16, 32))
+    check_avl(tree.root)
+    for v in range(16, 32):
+        tree.delete(v)
+    assert tree.is_empty()
+
+def test_random_operations():
+    rng = random.Random(5)
+    tree, keys = AVLTree(), set()
+    for _ in range(2000):
+        v = rng.randint(0, 300)
+        if rng.random() < 0.6:
+            tree.insert(v)
+            keys.add(v)
+        else:
+            tree.delete(v)
+            keys.discard(v)
+    assert tree.inorder() == sorted(keys)
+    check_avl(tree.root)
+
+def test_order_statistics():
+    tree = AVLTree()
+    for v in range(0, 2000, 2):  # Sorted input, 1000 even keys
+        tree.insert(v)
+    assert tree.count_nodes() == 1000
+    assert tree.select(10).key == 20
+    assert tree.rank(21) == 11
+    assert tree.count_range(100, 199) == 50
+    assert tree.median() == (998 + 1000) / 2
+    for v in range(0, 1000, 2):
+        tree.delete(v)
+    assert tree.count_nodes() == 500
+    assert tree.select(0).key == 1000
+
+def test_from_sorted_and_iterators():
+    for n in (1, 2, 7, 8, 100):
+        tree = AVLTree.from_sorted(range(n))
+        check_avl(tree.root)
+        assert list(tree) == list(range(n))
+    tree.insert(1000)
+    tree.delete(50)
+    check_avl(tree.root)
+    assert list(tree.iter_range(48, 52)) == [48, 49, 51, 52]
+    assert next(reversed(tree)) == 1000
+
+def test_binary_round_trip():
+    tree = AVLTree()
+    for v in [5, 3, 8, 1, 4, 7, 9, 2, 6]:
+        tree.insert(v)
+    restored = AVLTree.from_bytes(tree.to_bytes())
+    assert restored.level_order() == tree.level_order()
+    check_avl(restored.root)
+    restored.insert(10)
+    restored.delete(5)
+    check_avl(restored.root)
@@ -1,5 +1,5 @@
 import unittest
-from Non_Linear.Trees.binary_tree import Node, BinaryTree
+from Non_Linear.Trees.binary_tree import Node, BinaryTree, CompleteBinaryTree
 
 class TestBinaryTree(unittest.TestCase):
 
@@ -108,6 +108,148 @@ class TestBinaryTree(unittest.TestCase):
         bt.root.left.right = Node(1)
         self.assertEqual(bt.min_root_to_leaf_path(), [10, 5, 1])
 
+    def test_binary_round_trip(self):
+        restored = BinaryTree.from_bytes(self.bt.to_bytes())
+        self.assertEqual(restored.preorder(), self.bt.preorder())
+        self.assertEqual(restored.inorder(), self.bt.inorder())
+
+        # Skewed shape with negative and large values
+        skewed = BinaryTree()
+        skewed.root = Node(-1)
+        current = skewed.root
+        for v in range(2000):
+            current.right = Node(v * 1000003 - 7)
+            current = current.right
+        current.left = Node(2 ** 70)
+        data = skewed.to_bytes()
+        self.assertLess(len(data), 2002 * 6)
+        restored = BinaryTree.from_bytes(data)
+        self.assertEqual(restored.level_order_traversal(), skewed.level_order_traversal())
+
+        self.assertIsNone(BinaryTree.from_bytes(BinaryTree().to_bytes()).root)
+
+    def test_binary_non_int_values_and_files(self):
+        import os
+        import tempfile
+        tree = BinaryTree()
+        values = ["a", 2.5, None, True, b"\x00raw", -3, "żółw"]
+        for value in values:
+            tree.insert(value)
+        path = os.path.join(tempfile.mkdtemp(), "tree.bin")
+        tree.save(path)
+        self.assertEqual(BinaryTree.load(path).level_order_traversal(), values)
+        os.remove(path)
+        with self.assertRaises(ValueError):
+            BinaryTree.from_bytes(b"nope")
+
+    def test_binary_rejects_unsafe_values(self):
+        tree = BinaryTree()
+        tree.insert(1)
+        tree.insert((1, 2))  # Only None, bool, int, float, str and bytes are encodable
+        with self.assertRaises(TypeError):
+            tree.to_bytes()
+        # Unknown value kinds and value tags are rejected, never executed
+        with self.assertRaises(ValueError):
+            BinaryTree.from_bytes(b"BTC1\x02\x00\x02\x00\x00")
+        with self.assertRaises(ValueError):
+            BinaryTree.from_bytes(b"BTC1\x01\x00\x02\x00\x09")
+
+
+
+class TestCompleteBinaryTree(unittest.TestCase):
+
+    def test_insert_matches_level_order_insert(self):
+        bt = BinaryTree()
+        cbt = CompleteBinaryTree()
+        for i in range(1, 21):
+            bt.insert(i)
+            cbt.insert(i)
+        self.assertEqual(cbt.level_order_traversal(), bt.level_order_traversal())
+        self.assertEqual(cbt.inorder(), bt.inorder())
+        self.assertEqual(len(cbt), 20)
+
+    def test_node_at(self):
+        cbt = CompleteBinaryTree(range(100))
+        for i in range(100):
+            self.assertEqual(cbt.node_at(i).value, i)
+        with self.assertRaises(IndexError):
+            cbt.node_at(100)
+
+    def test_delete_uses_last_node(self):
+        cbt = CompleteBinaryTree([1, 2, 3, 4, 5, 6])
+        self.assertTrue(cbt.delete(2))
+        self.assertEqual(cbt.level_order_traversal(), [1, 6, 3, 4, 5])
+        self.assertFalse(cbt.delete(42))
+        cbt.insert(7)  # Goes into the slot the removed node left
+        self.assertEqual(cbt.level_order_traversal(), [1, 6, 3, 4, 5, 7])
+        self.assertTrue(cbt.delete(7))  # Target is the last node itself
+        self.assertEqual(cbt.level_order_traversal(), [1, 6, 3, 4, 5])
+
+    def test_mixed_operations_stay_complete(self):
+        cbt = CompleteBinaryTree()
+        expected = []
+        for i in range(200):
+            cbt.insert(i)
+            expected.append(i)
+            if i % 3 == 2:
+                target = expected[len(expected) // 2]
+                cbt.delete(target)
+                index = expected.index(target)
+                expected[index] = expected[-1]
+                expected.pop()
+            self.assertEqual(cbt.level_order_traversal(), expected)
+        while expected:
+            self.assertTrue(cbt.delete(expected[0]))
+            expected[0] = expected[-1]
+            expected.pop()
+        self.assertIsNone(cbt.root)
+        cbt.insert(1)
+        self.assertEqual(cbt.level_order_traversal(), [1])
+
+    def test_rebuild_index_and_bytes(self):
+        cbt = CompleteBinaryTree(range(10))
+        restored = CompleteBinaryTree.from_bytes(cbt.to_bytes())
+        self.assertEqual(len(restored), 10)
+        restored.insert(10)
+        self.assertEqual(restored.node_at(10).value, 10)
+
+        broken = CompleteBinaryTree()
+        broken.root = Node(1)
+        broken.root.right = Node(2)
+        with self.assertRaises(ValueError):
+            broken.rebuild_index()
+
+    def test_inherited_mutators_keep_index(self):
+        # mirror() on a non-perfect tree would break completeness: refused, tree unchanged
+        cbt = CompleteBinaryTree(range(1, 6))
+        with self.assertRaises(ValueError):
+            cbt.mirror()
+        self.assertEqual(cbt.level_order_traversal(), [1, 2, 3, 4, 5])
+        cbt.insert(6)
+        self.assertEqual(cbt.node_at(5).value, 6)
+
+        # A perfect tree stays complete and inserts continue in level order
+        cbt = CompleteBinaryTree(range(1, 8))
+        cbt.mirror()
+        self.assertEqual(cbt.level_order_traversal(), [1, 3, 2, 7, 6, 5, 4])
+        cbt.insert(8)
+        cbt.insert(9)
+        self.assertEqual(cbt.level_order_traversal(), [1, 3, 2, 7, 6, 5, 4, 8, 9])
+        self.assertEqual(cbt.node_at(8).value, 9)
+        self.assertTrue(cbt.delete(3))
+        self.assertEqual(cbt.level_order_traversal(), [1, 9, 2, 7, 6, 5, 4, 8])
+
+        # load() goes through from_bytes(), which restores the index
+        import os
+        import tempfile
+        path = os.path.join(tempfile.mkdtemp(), "complete.bin")
+        cbt.save(path)
+        loaded = CompleteBinaryTree.load(path)
+        os.remove(path)
+        loaded.insert(10)
+        self.assertEqual(len(loaded), 9)
+        self.assertEqual(loaded.node_at(8).value, 10)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,221 @@
+# test_bplus_tree.py
+
+import gc
+import os
+import random
+import struct
+import tempfile
+import warnings
+
+from Non_Linear.Trees.bplus_tree import BPlusInternal, BPlusLeaf, BPlusTree
+
+
+def check_tree(tree):
+    """Assert the B+-tree invariants; returns the keys found along the leaf chain."""
+    leaves = []
+
+    def walk(page_id, lo, hi, depth, is_root):
+        node = tree.pager.read(page_id)
+        assert len(node.keys) <= tree.max_keys
+        if not is_root:
+            assert len(node.keys) >= tree.min_keys
+        assert all(node.keys[i] < node.keys[i + 1] for i in range(len(node.keys) - 1))
+        assert all((lo is None or k >= lo) and (hi is None or k < hi) for k in node.keys)
+        if isinstance(node, BPlusLeaf):
+            assert depth == tree.height()
+            leaves.append(page_id)
+            return
+        assert isinstance(node, BPlusInternal)
+        assert len(node.children) == len(node.keys) + 1
+        bounds = [lo] + node.keys + [hi]
+        for i, child in enumerate(node.children):
+            walk(child, bounds[i], bounds[i + 1], depth + 1, False)
+
+    walk(tree.root, None, None, 0, True)
+    chained = []
+    for n, page_id in enumerate(leaves):
+        leaf = tree.pager.read(page_id)
+        assert leaf.next == (leaves[n + 1] if n + 1 < len(leaves) else -1)
+        chained.extend(leaf.keys)
+    assert len(chained) == len(tree)
+    return chained
+
+def test_insert_search_and_overwrite():
+    tree = BPlusTree(order=4)
+    for k in [50, 20, 80, 10, 30, 60, 90, 70, 40]:
+        tree.insert(k, str(k))
+    tree.insert(30, "thirty")
+    assert len(tree) == 9
+    assert tree.search(30) == "thirty"
+    assert tree.search(35) is None
+    assert 70 in tree and 75 not in tree
+    assert tree.min() == 10 and tree.max() == 90
+    assert list(tree) == [10, 20, 30, 40, 50, 60, 70, 80, 90]
+    check_tree(tree)
+
+def test_range_scans():
+    tree = BPlusTree(order=5)
+    for k in range(0, 200, 2):
+        tree.insert(k, k * k)
+    assert list(tree.iter_range(11, 19)) == [(12, 144), (14, 196), (16, 256), (18, 324)]
+    assert [k for k, _ in tree.iter_range(None, 4)] == [0, 2, 4]
+    assert [k for k, _ in tree.iter_range(195)] == [196, 198]
+    assert list(tree.iter_range(500, 600)) == []
+
+def test_empty_tree():
+    tree = BPlusTree(order=3)
+    assert tree.min() is None and tree.max() is None
+    assert list(tree) == []
+    tree.delete(1)
+    assert len(tree) == 0
+
+def test_random_against_dict():
+    rng = random.Random(4)
+    for order in (3, 4, 5, 8):
+        tree, expected = BPlusTree(order=order), {}
+        for step in range(3000):
+            k = rng.randint(0, 400)
+            if rng.random() < 0.6:
+                tree.insert(k, step)
+                expected[k] = step
+            else:
+                tree.delete(k)
+                expected.pop(k, None)
+        assert check_tree(tree) == sorted(expected)
+        assert list(tree.items()) == sorted(expected.items())
+        for k in sorted(expected):
+            tree.delete(k)
+        assert len(tree) == 0 and tree.height() == 0
+
+def test_from_sorted():
+    for n in (0, 1, 7, 8, 9, 100, 1001):
+        tree = BPlusTree.from_sorted(((k, -k) for k in range(n)), order=4)
+        assert check_tree(tree) == list(range(n))
+        if n:
+            assert tree.search(n - 1) == -(n - 1)
+    tree.insert(-5, 5)
+    tree.delete(500)
+    check_tree(tree)
+    try:
+        BPlusTree.from_sorted([(2, None), (1, None)])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+def test_file_backed_with_small_cache():
+    path = os.path.join(tempfile.mkdtemp(), "index.bpt")
+    rng = random.Random(8)
+    expected = {}
+    with BPlusTree(order=6, path=path, page_size=512, cache_pages=4) as tree:
+        for _ in range(2000):
+            k = rng.randint(0, 1000)
+            if rng.random() < 0.7:
+                tree.insert(k, f"v{k}")
+                expected[k] = f"v{k}"
+            else:
+                tree.delete(k)
+                expected.pop(k, None)
+        assert len(tree.pager.cache) <= 4
+        assert check_tree(tree) == sorted(expected)
+
+    with BPlusTree(path=path, cache_pages=4) as reopened:
+        assert reopened.order == 6
+        assert list(reopened.items()) == sorted(expected.items())
+        lo = sorted(expected)[10]
+        assert next(reopened.iter_range(lo))[0] == lo
+    os.remove(path)
+
+def test_file_backed_bulk_load():
+    path = os.path.join(tempfile.mkdtemp(), "bulk.bpt")
+    tree = BPlusTree.from_sorted(((k, k) for k in range(5000)), order=32, path=path, cache_pages=8)
+    tree.close()
+    with BPlusTree(path=path) as reopened:
+        assert len(reopened) == 5000
+        assert reopened.search(4321) == 4321
+        check_tree(reopened)
+    os.remove(path)
+
+def test_invalid_order():
+    try:
+        BPlusTree(order=2)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+def test_file_pages_use_safe_encoding():
+    path = os.path.join(tempfile.mkdtemp(), "typed.bpt")
+    items = [(-3, None), (0, b"\x00\xff"), (1, 2.5), (2, "żółw"), (3, True)]
+    with BPlusTree(order=4, path=path, cache_pages=1) as tree:
+        for key, value in items:
+            tree.insert(key, value)
+        try:
+            tree.insert(4, (1, 2))
+            assert False, "expected TypeError"
+        except TypeError:
+            pass
+        assert len(tree) == len(items)
+    with BPlusTree(path=path) as reopened:
+        assert list(reopened.items()) == items
+
+    # A page holding anything but a node record is rejected, not executed
+    size = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        for offset in range(4096, size, 4096):
+            f.seek(offset)
+            f.write(struct.pack("<I", 12) + b"\x80\x04K\x01." + b"\x00" * 7)  # A pickle
+    with BPlusTree(path=path) as reopened:
+        try:
+            reopened.search(1)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    os.remove(path)
+
+def test_from_sorted_closes_file_on_error():
+    folder = tempfile.mkdtemp()
+    existing, fresh = os.path.join(folder, "busy.bpt"), os.path.join(folder, "fresh.bpt")
+    BPlusTree.from_sorted([(1, "a")], path=existing).close()
+    for path, items in ((existing, [(5, "x")]), (fresh, [(2, "b"), (1, "c")])):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                BPlusTree.from_sorted(items, path=path)
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+            gc.collect()
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+    with BPlusTree(path=existing) as reopened:
+        assert list(reopened.items()) == [(1, "a")]
+    os.remove(existing)
+    os.remove(fresh)
+
+def test_oversized_values_leave_tree_unchanged():
+    path = os.path.join(tempfile.mkdtemp(), "large.bpt")
+    keys = list(range(300))
+    random.Random(3).shuffle(keys)
+    with BPlusTree(path=path, cache_pages=4) as tree:
+        for k in keys[:200]:
+            tree.insert(k, "v")
+        for value in ("v" * 80, "x" * 5000):
+            try:
+                tree.insert(keys[200], value)
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+            try:
+                tree.insert(keys[0], value)  # Overwrite
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+        assert len(tree) == 200
+        assert check_tree(tree) == sorted(keys[:200])
+    with BPlusTree(path=path, cache_pages=2) as reopened:
+        assert list(reopened.items()) == [(k, "v") for k in sorted(keys[:200])]
+    try:
+        BPlusTree.from_sorted([(1, "x" * 5000)], path=path + "2")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    os.remove(path)
+    os.remove(path + "2")
@@ -127,6 +127,114 @@ def test_serialize_deserialize():
     bst2 = BST.deserialize(arr)
     assert bst2.inorder() == bst.inorder()
 
+def test_iterative_insert_delete_on_skewed_tree():
+    bst = BST()
+    for v in range(3000):  # A 3000-deep chain: recursive insert used to overflow
+        bst.insert(v)
+    assert bst.search(2999).key == 2999
+    bst.delete(0)
+    bst.delete(1500)
+    assert bst.min().key == 1
+    assert not bst.contains(1500)
+
+def test_order_statistics():
+    bst = BST()
+    for v in [50, 30, 70, 20, 40, 60, 80, 35]:
+        bst.insert(v)
+    bst.insert(40)  # Duplicate: sizes must not change
+    keys = sorted([50, 30, 70, 20, 40, 60, 80, 35])
+    assert bst.count_nodes() == 8
+    for i, k in enumerate(keys):
+        assert bst.rank(k) == i
+        assert bst.select(i).key == k
+    assert bst.rank(0) == 0 and bst.rank(45) == 4 and bst.rank(100) == 8
+    assert bst.count_range(30, 60) == 5
+    assert bst.count_range(31, 59) == 3
+    assert bst.count_range(90, 10) == 0
+    assert bst.median() == (40 + 50) / 2
+    bst.delete(30)  # Two children
+    assert bst.count_nodes() == 7
+    assert bst.median() == 50
+    assert bst.select(1).key == 35
+
+def test_select_out_of_range():
+    bst = BST()
+    assert bst.median() is None
+    try:
+        bst.select(0)
+        assert False, "expected IndexError"
+    except IndexError:
+        pass
+
+def test_deserialize_restores_sizes():
+    bst = BST()
+    for v in [10, 5, 20, 2, 15]:
+        bst.insert(v)
+    bst2 = BST.deserialize(bst.serialize())
+    assert bst2.count_nodes() == 5
+    assert bst2.select(3).key == 15
+
+def test_lazy_iterators():
+    bst = BST()
+    for v in [50, 30, 70, 20, 40, 60, 80, 35]:
+        bst.insert(v)
+    assert list(bst) == bst.inorder()
+    assert list(reversed(bst)) == bst.inorder()[::-1]
+    assert list(bst.iter_range(33, 60)) == [35, 40, 50, 60]
+    assert list(bst.iter_range(81, 90)) == []
+    assert list(bst.iter_range(None, 30)) == [20, 30]
+    assert list(bst.iter_from(55)) == [60, 70, 80]
+    it = bst.iter_from(0)
+    assert next(it) == 20 and next(it) == 30  # Lazy: stops whenever the caller does
+
+def test_from_sorted():
+    bst = BST.from_sorted(range(1000))
+    assert bst.inorder() == list(range(1000))
+    assert bst.height() == 9
+    assert bst.is_balanced()
+    assert bst.select(500).key == 500
+    assert BST.from_sorted([]).is_empty()
+    try:
+        BST.from_sorted([1, 3, 2])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+def test_binary_serialization():
+    import os
+    import tempfile
+    bst = BST()
+    for v in [10, 5, 20, 2, 15, -3]:
+        bst.insert(v)
+    restored = BST.from_bytes(bst.to_bytes())
+    assert restored.level_order() == bst.level_order()
+    assert restored.select(2).key == 5  # Subtree sizes restored
+
+    skewed = BST()
+    for v in range(3000):
+        skewed.insert(v)
+    data = skewed.to_bytes()
+    assert len(data) < 3000 * 3  # The level-order list would need 2**3000 slots
+    path = os.path.join(tempfile.mkdtemp(), "bst.bin")
+    skewed.save(path)
+    loaded = BST.load(path)
+    assert loaded.node_depth(2999) == 2999  # Same chain shape
+    assert loaded.max().key == 2999
+    os.remove(path)
+
+def test_binary_stream_position_and_corrupt_count():
+    import io
+    first, second = BST.from_sorted(range(50)), BST.from_sorted([-1, 7])
+    stream = io.BytesIO(first.to_bytes() + second.to_bytes() + b"trailer")
+    assert BST.from_bytes(stream).inorder() == list(range(50))
+    assert BST.from_bytes(stream).inorder() == [-1, 7]  # Stream left right after the first tree
+    assert stream.read() == b"trailer"
+    try:
+        BST.from_bytes(b"BTC1\x00\x00\x01")  # Node count -1
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
 def run_all_tests():
     test_insert_and_inorder()
     test_search_and_contains()
@@ -144,6 +252,14 @@ def run_all_tests():
     test_lowest_common_ancestor()
     test_diameter()
     test_serialize_deserialize()
+    test_iterative_insert_delete_on_skewed_tree()
+    test_order_statistics()
+    test_select_out_of_range()
+    test_deserialize_restores_sizes()
+    test_lazy_iterators()
+    test_from_sorted()
+    test_binary_serialization()
+    test_binary_stream_position_and_corrupt_count()
     print("✅ All BST tests passed successfully!")
 
 if __name__ == "__main__":
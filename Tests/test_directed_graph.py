@@ -0,0 +1,42 @@
+import unittest
+from Non_Linear.Graphs.Directed.directed_graph import DirectedGraph
+
+
+class TestDirectedGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.g = DirectedGraph(6)
+        for u, v in [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]:
+            self.g.add_edge(u, v)
+
+    def test_topological_sort(self):
+        order = self.g.topological_sort()
+        self.assertEqual(order, [5, 4, 2, 3, 1, 0])
+        position = {v: i for i, v in enumerate(order)}
+        for u in range(6):
+            for i in range(len(self.g.adj.get(u))):
+                self.assertLess(position[u], position[self.g.adj.get(u).get(i)])
+
+    def test_topological_sort_cycle(self):
+        self.g.add_edge(1, 5)
+        with self.assertRaises(ValueError):
+            self.g.topological_sort()
+
+    def test_connected_components(self):
+        g = DirectedGraph(6)
+        for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3), (5, 4)]:
+            g.add_edge(u, v)
+        sccs = sorted(sorted(c) for c in g.connected_components())
+        self.assertEqual(sccs, [[0, 1, 2], [3, 4], [5]])
+
+    def test_deep_chain_no_recursion_limit(self):
+        n = 3000
+        g = DirectedGraph(n)
+        for i in range(n - 1):
+            g.add_edge(i, i + 1)
+        self.assertEqual(g.topological_sort(), list(range(n)))
+        self.assertEqual(len(g.connected_components()), n)
+
+
+if __name__ == "__main__":
+    unittest.main()
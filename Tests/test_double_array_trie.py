@@ -0,0 +1,88 @@
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+from Non_Linear.Trie.trie import Trie
+from Non_Linear.Trie.double_array_trie import DoubleArrayTrie
+
+
+class TestDoubleArrayTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ["cat", "car", "cart", "dog", "door", "doom", "東京", ""]
+        trie = Trie()
+        for word in self.words:
+            trie.insert(word)
+        self.trie = trie
+        self.dat = DoubleArrayTrie.from_trie(trie)
+        fd, self.path = tempfile.mkstemp(suffix=".dat")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def check_queries(self, dat):
+        for word in self.words:
+            self.assertTrue(dat.search(word))
+        for word in ["ca", "do", "cartoon", "東", "x"]:
+            self.assertFalse(dat.search(word))
+        self.assertTrue(dat.starts_with("doo"))
+        self.assertTrue(dat.starts_with("東"))
+        self.assertFalse(dat.starts_with("dx"))
+        self.assertEqual(dat.words_with_prefix("ca"), ["car", "cart", "cat"])
+        self.assertEqual(dat.words_with_prefix(""), self.trie.words_with_prefix(""))
+        self.assertEqual(dat.words_with_prefix("z"), [])
+
+    def test_queries_match_trie(self):
+        self.check_queries(self.dat)
+
+    def test_save_and_mmap_load(self):
+        self.dat.save(self.path)
+        with DoubleArrayTrie.load(self.path) as mapped:
+            self.assertIsInstance(mapped.check, memoryview)  # Queried in place
+            self.check_queries(mapped)
+
+    def test_load_without_mmap(self):
+        self.dat.save(self.path)
+        loaded = DoubleArrayTrie.load(self.path, use_mmap=False)
+        self.check_queries(loaded)
+
+    def test_from_words_and_empty(self):
+        dat = DoubleArrayTrie.from_words([])
+        self.assertFalse(dat.search(""))
+        self.assertEqual(dat.words_with_prefix(""), [])
+        dat = DoubleArrayTrie.from_words(["b", "a"])
+        self.assertEqual(dat.words_with_prefix(""), ["a", "b"])
+
+    def test_bad_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a trie at all, just some bytes")
+        for use_mmap in (True, False):
+            with self.assertRaises(ValueError):
+                DoubleArrayTrie.load(self.path, use_mmap=use_mmap)
+
+    def test_short_and_truncated_files(self):
+        self.dat.save(self.path)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for content in (b"", b"DATRIE", data[:40], data[:-1]):
+            with open(self.path, "wb") as f:
+                f.write(content)
+            for use_mmap in (True, False):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", ResourceWarning)
+                    with self.assertRaises(ValueError):
+                        DoubleArrayTrie.load(self.path, use_mmap=use_mmap)
+                    gc.collect()
+
+    def test_large_alphabet_prefix_listing(self):
+        words = [chr(0x4E00 + i) + chr(0x4E00 + (i * 7) % 3000) for i in range(3000)]
+        dat = DoubleArrayTrie.from_words(words)
+        self.assertEqual(len(dat.alphabet), 3000)
+        self.assertEqual(dat.words_with_prefix(""), sorted(words))
+        self.assertEqual(dat.words_with_prefix(words[5][0]), [words[5]])
+
+
+if __name__ == "__main__":
+    unittest.main()
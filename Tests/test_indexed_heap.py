@@ -0,0 +1,66 @@
+import unittest
+from Non_Linear.Heaps.indexed_heap import IndexedHeap
+
+
+class TestIndexedHeap(unittest.TestCase):
+
+    def setUp(self):
+        self.heap = IndexedHeap(d=4)
+
+    def test_empty_heap(self):
+        self.assertEqual(len(self.heap), 0)
+        self.assertIsNone(self.heap.peek())
+        self.assertIsNone(self.heap.pop())
+        self.assertFalse(self.heap.contains(0))
+
+    def test_insert_pop_sorted(self):
+        keys = [5, 3, 8, 1, 7, 2, 9, 4, 6, 0]
+        for item, key in enumerate(keys):
+            self.heap.insert(item, key)
+        result = [self.heap.pop()[1] for _ in range(len(keys))]
+        self.assertEqual(result, sorted(keys))
+
+    def test_decrease_and_increase_key(self):
+        for item, key in [(0, 10), (1, 20), (2, 30)]:
+            self.heap.insert(item, key)
+        self.heap.decrease_key(2, 5)
+        self.assertEqual(self.heap.peek(), (2, 5))
+        self.heap.increase_key(2, 25)
+        self.assertEqual(self.heap.peek(), (0, 10))
+        self.assertEqual(self.heap.key_of(2), 25)
+        with self.assertRaises(ValueError):
+            self.heap.decrease_key(0, 11)
+        with self.assertRaises(ValueError):
+            self.heap.increase_key(0, 9)
+
+    def test_remove_and_contains(self):
+        for item in range(6):
+            self.heap.insert(item, item * 10)
+        self.assertTrue(3 in self.heap)
+        self.assertEqual(self.heap.remove(3), 30)
+        self.assertFalse(self.heap.contains(3))
+        self.assertEqual([self.heap.pop()[0] for _ in range(5)], [0, 1, 2, 4, 5])
+        with self.assertRaises(KeyError):
+            self.heap.remove(3)
+
+    def test_max_heap_and_binary_arity(self):
+        heap = IndexedHeap(d=2, max_heap=True)
+        for item, key in enumerate([4, 9, 1, 7]):
+            heap.insert(item, key)
+        heap.decrease_key(1, 0)
+        self.assertEqual([heap.pop() for _ in range(4)], [(3, 7), (0, 4), (2, 1), (1, 0)])
+
+    def test_table_growth_and_errors(self):
+        heap = IndexedHeap(capacity=2)
+        heap.insert(1000, 1)
+        self.assertTrue(heap.contains(1000))
+        with self.assertRaises(KeyError):
+            heap.insert(1000, 2)
+        with self.assertRaises(ValueError):
+            heap.insert(-1, 0)
+        with self.assertRaises(ValueError):
+            IndexedHeap(d=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
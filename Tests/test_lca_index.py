@@ -0,0 +1,77 @@
+import random
+import unittest
+from Non_Linear.Trees.binary_tree import BinaryTree, Node
+from Non_Linear.Trees.avl_tree import AVLTree
+from Non_Linear.Trees.lca_index import LCAIndex
+
+
+class TestLCAIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = BinaryTree()
+        for value in range(1, 8):
+            self.tree.insert(value)
+        self.index = LCAIndex(self.tree)
+
+    def test_matches_binary_tree(self):
+        for u in range(1, 8):
+            for v in range(1, 8):
+                self.assertEqual(self.index.lca(u, v), self.tree.lowest_common_ancestor(u, v))
+
+    def test_depth_distance_path(self):
+        self.assertEqual(self.index.depth(1), 0)
+        self.assertEqual(self.index.depth(6), 2)
+        self.assertEqual(self.index.depth(42), -1)
+        self.assertEqual(self.index.distance(4, 7), 4)
+        self.assertEqual(self.index.distance(2, 5), 1)
+        self.assertEqual(self.index.distance(3, 3), 0)
+        self.assertEqual(self.index.path(4, 7), [4, 2, 1, 3, 7])
+        self.assertEqual(self.index.path(1, 5), [1, 2, 5])
+        self.assertEqual(self.index.path(5, 1), [5, 2, 1])
+
+    def test_missing_values(self):
+        self.assertIsNone(self.index.lca(4, 42))
+        self.assertEqual(self.index.distance(42, 4), -1)
+        self.assertEqual(self.index.path(4, 42), [])
+        self.assertNotIn(42, self.index)
+        self.assertIn(7, self.index)
+
+    def test_lca_many(self):
+        pairs = [(4, 5), (6, 7), (2, 4), (4, 4), (1, 42)]
+        self.assertEqual(self.index.lca_many(pairs), [2, 3, 2, 4, None])
+        self.assertEqual(self.index.lca_many(pairs), [self.index.lca(u, v) for u, v in pairs])
+
+    def test_empty_and_single(self):
+        self.assertEqual(len(LCAIndex(BinaryTree())), 0)
+        self.assertIsNone(LCAIndex(BinaryTree()).lca(1, 1))
+        tree = BinaryTree()
+        tree.insert(9)
+        self.assertEqual(LCAIndex(tree).lca(9, 9), 9)
+
+    def test_bst_keys(self):
+        rng = random.Random(7)
+        keys = rng.sample(range(1000), 300)
+        bst = AVLTree()
+        for key in keys:
+            bst.insert(key)
+        index = LCAIndex(bst)
+        for _ in range(500):
+            a, b = rng.choice(keys), rng.choice(keys)
+            self.assertEqual(index.lca(a, b), bst.lowest_common_ancestor(a, b).key)
+            self.assertEqual(index.depth(a), bst.node_depth(a))
+            self.assertEqual(index.distance(a, a), 0)
+
+    def test_degenerate_tree(self):
+        tree = BinaryTree()
+        tree.root = current = Node(0)
+        for i in range(1, 50000):
+            current.right = Node(i)
+            current = current.right
+        index = LCAIndex(tree)
+        self.assertEqual(index.lca(123, 45678), 123)
+        self.assertEqual(index.depth(49999), 49999)
+        self.assertEqual(index.distance(10, 49999), 49989)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import random
+import unittest
+from Non_Linear.Trie.levenshtein_automaton import LevenshteinAutomaton
+from Non_Linear.Trie.trie import Trie
+
+
+def edit_distance(a, b):
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        prev, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (ca != cb))
+    return row[-1]
+
+
+class TestFuzzySearch(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = Trie()
+        self.words = ["cat", "car", "cart", "care", "dog", "door", "doom", "act", "a"]
+        for word in self.words:
+            self.trie.insert(word)
+
+    def brute_force(self, query, max_dist):
+        return sorted((w, edit_distance(w, query)) for w in self.words
+                      if edit_distance(w, query) <= max_dist)
+
+    def test_fuzzy_search(self):
+        self.assertEqual(self.trie.fuzzy_search("cat", 0), [("cat", 0)])
+        self.assertEqual(self.trie.fuzzy_search("cat", 1),
+                         [("car", 1), ("cart", 1), ("cat", 0)])
+        self.assertEqual(self.trie.fuzzy_search("dor", 1),
+                         [("dog", 1), ("door", 1)])
+        self.assertEqual(self.trie.fuzzy_search("zzzz", 1), [])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(30):
+            query = "".join(rng.choice("acdort") for _ in range(rng.randint(0, 5)))
+            for max_dist in range(3):
+                expected = self.brute_force(query, max_dist)
+                self.assertEqual(self.trie.fuzzy_search(query, max_dist), expected)
+                dfa = LevenshteinAutomaton(query, max_dist)
+                self.assertEqual(self.trie.fuzzy_search(query, max_dist, dfa), expected)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.trie.fuzzy_search("cat", -1)
+        with self.assertRaises(ValueError):
+            self.trie.fuzzy_search("cat", 1, LevenshteinAutomaton("cat", 2))
+        with self.assertRaises(ValueError):
+            LevenshteinAutomaton("cat", -1)
+
+
+class TestLevenshteinAutomaton(unittest.TestCase):
+
+    def run_dfa(self, dfa, text):
+        state = dfa.start
+        for ch in text:
+            state = dfa.step(state, ch)
+        return state
+
+    def test_accepts_within_distance(self):
+        dfa = LevenshteinAutomaton("kitten", 3)
+        self.assertTrue(dfa.is_match(self.run_dfa(dfa, "sitting")))
+        self.assertEqual(dfa.distance(self.run_dfa(dfa, "sitting")), 3)
+        self.assertFalse(dfa.is_match(self.run_dfa(dfa, "sit")))
+        self.assertFalse(dfa.can_match(self.run_dfa(dfa, "xxxxxxxxxx")))
+
+    def test_compile_is_finite_and_consistent(self):
+        dfa = LevenshteinAutomaton("abc", 1)
+        states = dfa.compile()
+        self.assertGreater(states, 0)
+        transitions = len(dfa.transitions)
+        # Live paths use only precompiled transitions; characters outside the
+        # query share the "other" transitions
+        for text in ["aqc", "qbc", "xbc"]:
+            self.assertTrue(dfa.is_match(self.run_dfa(dfa, text)))
+        self.assertEqual(len(dfa.transitions), transitions)
+        for text in ["abc", "abd", "ab", "abcd", "zzz"]:
+            state = self.run_dfa(dfa, text)
+            self.assertEqual(dfa.is_match(state), edit_distance(text, "abc") <= 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
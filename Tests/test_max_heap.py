@@ -72,5 +72,49 @@ class TestMaxHeap(unittest.TestCase):
             self.heap.insert(v)
         self.assertEqual(self.heap.get_max(), max(vals))
 
+    def test_key_function_and_push_many(self):
+        heap = MaxHeap(key=len)
+        heap.push_many(["aa", "a", "aaaa"])
+        heap.insert("aaa")
+        self.assertEqual([heap.extract_max() for _ in range(4)], ["aaaa", "aaa", "aa", "a"])
+
+    def test_heapify_with_key(self):
+        heap = MaxHeap(key=lambda pair: pair[1])
+        heap.heapify(iter([("x", 1), ("y", 3), ("z", 2)]))
+        self.assertEqual(heap.get_max(), ("y", 3))
+        self.assertEqual(heap.replace(("w", 0)), ("y", 3))
+        self.assertEqual(heap.get_max(), ("z", 2))
+
+    def test_failing_key_leaves_heap_unchanged(self):
+        heap = MaxHeap(key=abs)
+        heap.heapify([2, 1])
+        for bad in (lambda: heap.push_many([3, "x"]), lambda: heap.insert("x"),
+                    lambda: heap.heapify([5, "x"])):
+            with self.assertRaises(TypeError):
+                bad()
+            self.assertEqual(len(heap.data), len(heap.keys))
+        other = MaxHeap(key=str)
+        other.heapify([3, "x"])
+        with self.assertRaises(TypeError):
+            heap.merge(other)
+        heap.insert(3)
+        self.assertEqual([heap.extract_max() for _ in range(len(heap))], [3, 2, 1])
+
+    def test_pushpop(self):
+        self.heap.heapify([2, 4, 6])
+        self.assertEqual(self.heap.pushpop(7), 7)
+        self.assertEqual(self.heap.pushpop(3), 6)
+        self.assertEqual(self.heap.get_max(), 4)
+
+    def test_top_k_and_merge(self):
+        self.heap.heapify([4, 9, 1, 7])
+        other = MaxHeap()
+        other.heapify([8, 3])
+        self.heap.merge(other)
+        self.assertEqual(self.heap.top_k(3), [9, 8, 7])
+        self.assertEqual(self.heap.nlargest(1), [9])
+        self.assertEqual(self.heap.nsmallest(2), [1, 3])
+        self.assertEqual(len(self.heap), 6)
+
 if __name__ == "__main__":
     unittest.main()
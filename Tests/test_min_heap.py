@@ -54,5 +54,59 @@ class TestMinHeap(unittest.TestCase):
             actual_mins.append(heap2.get_min())
         self.assertEqual(actual_mins, [7, 3, 3, 1, 1])
 
+    def test_heapify_and_push_many(self):
+        self.heap.heapify([9, 4, 7, 1, 8])
+        self.assertEqual(self.heap.get_min(), 1)
+        self.heap.push_many([3, 0])
+        self.heap.push_many(range(10, 30))
+        result = [self.heap.extract_min() for _ in range(len(self.heap))]
+        self.assertEqual(result, sorted([9, 4, 7, 1, 8, 3, 0] + list(range(10, 30))))
+
+    def test_key_function(self):
+        heap = MinHeap(key=lambda task: task["priority"])
+        heap.push_many([{"name": "b", "priority": 2}, {"name": "a", "priority": 1}])
+        heap.insert({"name": "c", "priority": 0})
+        self.assertEqual([heap.extract_min()["name"] for _ in range(3)], ["c", "a", "b"])
+
+    def test_failing_key_leaves_heap_unchanged(self):
+        heap = MinHeap(key=abs)
+        heap.heapify([2, 1])
+        for bad in (lambda: heap.push_many([3, "x"]), lambda: heap.insert("x"),
+                    lambda: heap.heapify([5, "x"])):
+            with self.assertRaises(TypeError):
+                bad()
+            self.assertEqual(len(heap.data), len(heap.keys))
+        other = MinHeap(key=str)
+        other.heapify([3, "x"])
+        with self.assertRaises(TypeError):
+            heap.merge(other)
+        heap.insert(3)
+        self.assertEqual([heap.extract_min() for _ in range(len(heap))], [1, 2, 3])
+
+    def test_pushpop(self):
+        self.assertEqual(self.heap.pushpop(5), 5)  # Empty heap returns the value itself
+        self.heap.heapify([2, 4, 6])
+        self.assertEqual(self.heap.pushpop(1), 1)
+        self.assertEqual(self.heap.pushpop(5), 2)
+        self.assertEqual(sorted(self.heap.data), [4, 5, 6])
+
+    def test_top_k_leaves_heap_intact(self):
+        values = [8, 3, 5, 1, 9, 2, 7]
+        self.heap.heapify(values)
+        snapshot = list(self.heap.data)
+        self.assertEqual(self.heap.top_k(3), [1, 2, 3])
+        self.assertEqual(self.heap.nsmallest(10), sorted(values))
+        self.assertEqual(self.heap.nlargest(2), [9, 8])
+        self.assertEqual(self.heap.top_k(0), [])
+        self.assertEqual(self.heap.data, snapshot)
+
+    def test_merge(self):
+        other = MinHeap()
+        other.heapify([6, 0, 4])
+        self.heap.heapify([5, 1, 3])
+        self.heap.merge(other)
+        self.assertEqual(len(other), 3)
+        self.assertEqual([self.heap.extract_min() for _ in range(6)], [0, 1, 3, 4, 5, 6])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from Non_Linear.Heaps.min_max_heap import MinMaxHeap
+
+
+class TestMinMaxHeap(unittest.TestCase):
+
+    def setUp(self):
+        self.heap = MinMaxHeap()
+
+    def test_empty_heap(self):
+        self.assertEqual(len(self.heap), 0)
+        self.assertIsNone(self.heap.get_min())
+        self.assertIsNone(self.heap.get_max())
+        self.assertIsNone(self.heap.extract_min())
+        self.assertIsNone(self.heap.extract_max())
+
+    def test_get_min_and_max(self):
+        for v in [5, 3, 8, 1, 7]:
+            self.heap.insert(v)
+        self.assertEqual(self.heap.get_min(), 1)
+        self.assertEqual(self.heap.get_max(), 8)
+
+    def test_alternating_extracts(self):
+        values = [15, 4, 42, 8, 16, 23, 4, 0, 99, -1]
+        for v in values:
+            self.heap.insert(v)
+        remaining = sorted(values)
+        while remaining:
+            self.assertEqual(self.heap.extract_min(), remaining.pop(0))
+            if remaining:
+                self.assertEqual(self.heap.extract_max(), remaining.pop())
+        self.assertEqual(len(self.heap), 0)
+
+    def test_heapify(self):
+        values = [9, 2, 7, 4, 6, 1, 8, 3, 5]
+        self.heap.heapify(values)
+        self.assertEqual(self.heap.get_min(), 1)
+        self.assertEqual(self.heap.get_max(), 9)
+        self.assertEqual([self.heap.extract_max() for _ in range(len(values))], sorted(values, reverse=True))
+
+    def test_bounded_evicts_max(self):
+        heap = MinMaxHeap(capacity=3)
+        self.assertIsNone(heap.insert(40))
+        heap.insert(10)
+        heap.insert(30)
+        self.assertEqual(heap.insert(20), 40)  # 40 is evicted
+        self.assertEqual(heap.insert(50), 50)  # 50 is rejected
+        self.assertEqual(len(heap), 3)
+        self.assertEqual(heap.get_max(), 30)
+
+    def test_bounded_evicts_min(self):
+        heap = MinMaxHeap(capacity=2, evict="min")
+        heap.heapify([5, 1, 9, 3])
+        self.assertEqual(sorted(heap.data), [5, 9])
+        self.assertEqual(heap.insert(7), 5)
+
+    def test_key_function(self):
+        heap = MinMaxHeap(key=lambda req: req["cost"])
+        for name, cost in [("a", 3), ("b", 1), ("c", 2)]:
+            heap.insert({"name": name, "cost": cost})
+        self.assertEqual(heap.extract_min()["name"], "b")
+        self.assertEqual(heap.extract_max()["name"], "a")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            MinMaxHeap(capacity=0)
+        with self.assertRaises(ValueError):
+            MinMaxHeap(evict="median")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+from Non_Linear.Heaps.pairing_heap import PairingHeap
+
+
+class TestPairingHeap(unittest.TestCase):
+
+    def setUp(self):
+        self.heap = PairingHeap()
+
+    def test_empty_heap(self):
+        self.assertEqual(len(self.heap), 0)
+        self.assertIsNone(self.heap.get_min())
+        self.assertIsNone(self.heap.extract_min())
+
+    def test_insert_extract_sorted(self):
+        values = [5, 3, 8, 1, 7, 1, -2]
+        for v in values:
+            self.heap.insert(v)
+        self.assertEqual(self.heap.get_min(), -2)
+        result = [self.heap.extract_min() for _ in range(len(values))]
+        self.assertEqual(result, sorted(values))
+
+    def test_meld(self):
+        other = PairingHeap()
+        for v in [4, 2]:
+            self.heap.insert(v)
+        for v in [3, 1]:
+            other.insert(v)
+        self.heap.meld(other)
+        self.assertEqual(len(self.heap), 4)
+        self.assertEqual(len(other), 0)
+        self.assertIsNone(other.get_min())
+        self.assertEqual([self.heap.extract_min() for _ in range(4)], [1, 2, 3, 4])
+
+    def test_decrease_key(self):
+        handles = {v: self.heap.insert(v) for v in [10, 20, 30, 40]}
+        self.heap.extract_min()  # Forces a multi-level tree
+        self.heap.decrease_key(handles[40], 5)
+        self.heap.decrease_key(handles[20], 15)
+        self.assertEqual([self.heap.extract_min() for _ in range(3)], [5, 15, 30])
+        with self.assertRaises(ValueError):
+            node = self.heap.insert(1)
+            self.heap.decrease_key(node, 2)
+
+    def test_decrease_key_on_detached_or_root_handle(self):
+        handles = [self.heap.insert(v) for v in [10, 20, 30]]
+        self.heap.decrease_key(handles[0], 5)  # The root itself
+        self.assertEqual(self.heap.extract_min(), 5)
+        with self.assertRaises(ValueError):
+            self.heap.decrease_key(handles[0], 1)  # Already extracted
+        other = PairingHeap()
+        with self.assertRaises(ValueError):
+            self.heap.decrease_key(other.insert(7), 1)  # Root of another heap
+        self.assertEqual([self.heap.extract_min() for _ in range(2)], [20, 30])
+
+    def test_key_function(self):
+        heap = PairingHeap(key=lambda task: task[0])
+        heap.insert((2, "write"))
+        heap.insert((1, "read"))
+        self.assertEqual(heap.extract_min(), (1, "read"))
+
+    def test_randomized_against_sorted(self):
+        rng = random.Random(7)
+        handles = []
+        for _ in range(300):
+            v = rng.randint(0, 1000)
+            handles.append(self.heap.insert(v))
+        for node in rng.sample(handles, 50):
+            node_value = node.value - rng.randint(0, 100)
+            self.heap.decrease_key(node, node_value)
+        model = sorted(node.value for node in handles)
+        self.assertEqual([self.heap.extract_min() for _ in range(300)], model)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from Linear.persistent_queue import PersistentQueue
+
+
+class TestPersistentQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.empty = PersistentQueue()
+
+    def test_fifo_order(self):
+        q = self.empty
+        for i in range(10):
+            q = q.enqueue(i)
+        result = []
+        while not q.is_empty():
+            result.append(q.peek())
+            q = q.dequeue()
+        self.assertEqual(result, list(range(10)))
+
+    def test_old_versions_unchanged(self):
+        q1 = self.empty.enqueue(1).enqueue(2).enqueue(3)
+        q2 = q1.dequeue()
+        q3 = q2.enqueue(4)
+        q4 = q2.enqueue(5)
+        self.assertEqual(str(q1), "Front → [1, 2, 3] ← Rear")
+        self.assertEqual(str(q2), "Front → [2, 3] ← Rear")
+        self.assertEqual(list(q3), [2, 3, 4])
+        self.assertEqual(list(q4), [2, 3, 5])
+        self.assertEqual(len(q1), 3)
+        self.assertEqual(q1.peek(), 1)
+        self.assertTrue(self.empty.is_empty())
+
+    def test_interleaved_operations(self):
+        q, model = self.empty, []
+        for i in range(100):
+            q, model = q.enqueue(i), model + [i]
+            if i % 3 == 0:
+                self.assertEqual(q.peek(), model[0])
+                q, model = q.dequeue(), model[1:]
+            self.assertEqual(list(q), model)
+
+    def test_exceptions(self):
+        with self.assertRaises(IndexError):
+            self.empty.dequeue()
+        with self.assertRaises(IndexError):
+            self.empty.peek()
+
+
+if __name__ == "__main__":
+    unittest.main()
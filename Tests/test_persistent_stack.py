@@ -0,0 +1,39 @@
+import unittest
+from Linear.persistent_stack import PersistentStack
+
+
+class TestPersistentStack(unittest.TestCase):
+
+    def setUp(self):
+        self.empty = PersistentStack()
+
+    def test_push_returns_new_version(self):
+        s1 = self.empty.push(1)
+        s2 = s1.push(2)
+        self.assertTrue(self.empty.is_empty())
+        self.assertEqual(len(s1), 1)
+        self.assertEqual(len(s2), 2)
+        self.assertEqual(s2.peek(), 2)
+        self.assertEqual(s1.peek(), 1)
+
+    def test_pop_shares_structure(self):
+        s1 = self.empty.push("a").push("b")
+        s2 = s1.push("c")
+        popped = s2.pop()
+        self.assertIs(popped.head, s1.head)
+        self.assertEqual(str(s2), "Bottom → ['a', 'b', 'c'] ← Top")
+        self.assertEqual(str(popped), "Bottom → ['a', 'b'] ← Top")
+
+    def test_iteration_order(self):
+        s = self.empty.push(1).push(2).push(3)
+        self.assertEqual(list(s), [3, 2, 1])
+
+    def test_exceptions(self):
+        with self.assertRaises(IndexError):
+            self.empty.pop()
+        with self.assertRaises(IndexError):
+            self.empty.peek()
+
+
+if __name__ == "__main__":
+    unittest.main()
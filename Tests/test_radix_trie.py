@@ -0,0 +1,68 @@
+import unittest
+from Non_Linear.Trie.radix_trie import RadixTrie
+
+
+class TestRadixTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = RadixTrie()
+        self.words = ["cat", "car", "cart", "dog", "door", "doom"]
+        for word in self.words:
+            self.trie.insert(word)
+
+    def test_insert_and_search(self):
+        for word in self.words:
+            self.assertTrue(self.trie.search(word))
+        for word in ["ca", "do", "cartoon", "", "x"]:
+            self.assertFalse(self.trie.search(word))
+
+    def test_starts_with_inside_an_edge(self):
+        self.assertTrue(self.trie.starts_with("doo"))
+        self.assertTrue(self.trie.starts_with(""))
+        self.assertFalse(self.trie.starts_with("dox"))
+
+    def test_words_with_prefix(self):
+        self.assertEqual(self.trie.words_with_prefix("ca"), ["car", "cart", "cat"])
+        self.assertEqual(self.trie.words_with_prefix("doo"), ["doom", "door"])
+        self.assertEqual(self.trie.words_with_prefix("z"), [])
+        self.assertEqual(self.trie.count_words_with_prefix("d"), 3)
+        self.assertEqual(self.trie.count_words_with_prefix(""), len(self.words))
+
+    def test_longest_prefix_match(self):
+        routes = RadixTrie()
+        for route in ["/api", "/api/v1/users", "/static/"]:
+            routes.insert(route)
+        self.assertEqual(routes.longest_prefix_match("/api/v1/users/42"), "/api/v1/users")
+        self.assertEqual(routes.longest_prefix_match("/api/v2"), "/api")
+        self.assertEqual(routes.longest_prefix_match("/other"), "")
+
+    def test_path_compression(self):
+        trie = RadixTrie()
+        trie.insert("/usr/local/bin")
+        self.assertEqual(trie.node_count(), 2)
+        trie.insert("/usr/local/lib")
+        self.assertEqual(trie.node_count(), 4)  # root, "/usr/local/", "bin", "lib"
+
+    def test_delete_merges_edges(self):
+        self.assertTrue(self.trie.delete("car"))
+        self.assertFalse(self.trie.search("car"))
+        self.assertTrue(self.trie.search("cart"))
+        self.assertFalse(self.trie.delete("car"))
+        self.assertFalse(self.trie.delete("ca"))
+
+        trie = RadixTrie()
+        trie.insert("/usr/local/bin")
+        trie.insert("/usr/local/lib")
+        self.assertTrue(trie.delete("/usr/local/lib"))
+        self.assertEqual(trie.node_count(), 2)  # Merged back into one edge
+        self.assertEqual(trie.words_with_prefix("/usr"), ["/usr/local/bin"])
+
+    def test_empty_word(self):
+        self.trie.insert("")
+        self.assertTrue(self.trie.search(""))
+        self.assertTrue(self.trie.delete(""))
+        self.assertFalse(self.trie.search(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
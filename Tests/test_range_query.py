@@ -0,0 +1,138 @@
+import operator
+import random
+import unittest
+from math import gcd
+from Linear.arrays import MyArray
+from Linear.range_query import FenwickTree, LazySegmentTree, SegmentTree
+
+
+class TestFenwickTree(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1)
+        values = [rng.randint(-50, 50) for _ in range(37)]
+        tree = FenwickTree(values)
+        for _ in range(300):
+            lo = rng.randint(0, len(values))
+            hi = rng.randint(lo, len(values))
+            action = rng.random()
+            if action < 0.3:
+                index, delta = rng.randrange(len(values)), rng.randint(-9, 9)
+                tree.add(index, delta)
+                values[index] += delta
+            elif action < 0.5:
+                delta = rng.randint(-9, 9)
+                tree.range_add(lo, hi, delta)
+                for i in range(lo, hi):
+                    values[i] += delta
+            elif action < 0.6:
+                index, value = rng.randrange(len(values)), rng.randint(-50, 50)
+                tree.set(index, value)
+                values[index] = value
+            self.assertEqual(tree.range_sum(lo, hi), sum(values[lo:hi]))
+            self.assertEqual(tree.prefix_sum(hi), sum(values[:hi]))
+        self.assertEqual([tree.get(i) for i in range(len(values))], values)
+
+    def test_bounds_and_floats(self):
+        tree = FenwickTree([0.5, 1.5, 2.0], typecode="d")
+        self.assertEqual(tree.range_sum(0, 3), 4.0)
+        self.assertEqual(len(tree), 3)
+        with self.assertRaises(IndexError):
+            tree.add(3, 1)
+        with self.assertRaises(IndexError):
+            tree.range_sum(2, 1)
+        self.assertEqual(FenwickTree().prefix_sum(0), 0)
+
+
+class TestSegmentTree(unittest.TestCase):
+
+    def test_operators(self):
+        rng = random.Random(2)
+        values = [rng.randint(1, 100) for _ in range(29)]
+        trees = [
+            (SegmentTree(values), operator.add, 0),
+            (SegmentTree(values, min, float("inf")), min, float("inf")),
+            (SegmentTree(values, max, float("-inf")), max, float("-inf")),
+            (SegmentTree(values, gcd, 0), gcd, 0),
+        ]
+        for _ in range(200):
+            index, value = rng.randrange(len(values)), rng.randint(1, 100)
+            values[index] = value
+            lo = rng.randint(0, len(values))
+            hi = rng.randint(lo, len(values))
+            for tree, op, identity in trees:
+                tree.set(index, value)
+                expected = identity
+                for v in values[lo:hi]:
+                    expected = op(expected, v)
+                self.assertEqual(tree.query(lo, hi), expected)
+                self.assertEqual(tree.get(index), value)
+
+    def test_non_commutative_order(self):
+        # Composition of affine maps x -> a*x + b, encoded as a*1000 + b
+        def compose(f, g):
+            a1, b1 = divmod(f, 1000)
+            a2, b2 = divmod(g, 1000)
+            return (a1 * a2 % 7) * 1000 + (a2 * b1 + b2) % 7
+        values = [3002, 2005, 1003, 5001, 4006]
+        tree = SegmentTree(values, compose, 1000)
+        for lo in range(len(values)):
+            for hi in range(lo, len(values) + 1):
+                expected = 1000
+                for v in values[lo:hi]:
+                    expected = compose(expected, v)
+                self.assertEqual(tree.query(lo, hi), expected)
+
+    def test_from_my_array(self):
+        data = MyArray()
+        for value in [4, 1, 3]:
+            data.append(value)
+        tree = SegmentTree(data, min, float("inf"))
+        self.assertEqual(tree.query(0, 3), 1)
+        with self.assertRaises(IndexError):
+            tree.query(0, 4)
+
+
+class TestLazySegmentTree(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for mode, fn in (("sum", sum), ("min", min), ("max", max)):
+            for n in (1, 2, 5, 16, 23):
+                values = [rng.randint(-20, 20) for _ in range(n)]
+                tree = LazySegmentTree(values, mode=mode)
+                for _ in range(150):
+                    lo = rng.randint(0, n)
+                    hi = rng.randint(lo, n)
+                    action = rng.random()
+                    if action < 0.35:
+                        delta = rng.randint(-5, 5)
+                        tree.range_add(lo, hi, delta)
+                        for i in range(lo, hi):
+                            values[i] += delta
+                    elif action < 0.7:
+                        value = rng.randint(-20, 20)
+                        tree.range_assign(lo, hi, value)
+                        for i in range(lo, hi):
+                            values[i] = value
+                    qlo = rng.randint(0, n - 1)
+                    qhi = rng.randint(qlo + 1, n)
+                    self.assertEqual(tree.query(qlo, qhi), fn(values[qlo:qhi]))
+                self.assertEqual([tree.get(i) for i in range(n)], values)
+
+    def test_empty_range_and_errors(self):
+        tree = LazySegmentTree([1, 2, 3], mode="min")
+        self.assertEqual(tree.query(1, 1), float("inf"))
+        tree.set(0, -4)
+        self.assertEqual(tree.query(0, 3), -4)
+        with self.assertRaises(IndexError):
+            tree.range_add(0, 4, 1)
+        with self.assertRaises(ValueError):
+            LazySegmentTree([1], mode="mean")
+        floats = LazySegmentTree([1.5, 2.5], mode="max", typecode="d")
+        floats.range_add(0, 2, 1.0)
+        self.assertEqual(floats.query(0, 2), 3.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# test_red_black_tree.py
+
+import random
+
+from Non_Linear.Trees.red_black_tree import RedBlackTree
+
+
+def check_rb(node, parent=None):
+    """Returns the black height of node's subtree, asserting the red-black invariants."""
+    if node is None:
+        return 1
+    assert node.parent is parent
+    assert node.left is None or node.left.key < node.key
+    assert node.right is None or node.right.key > node.key
+    if node.red:
+        assert not (node.left and node.left.red) and not (node.right and node.right.red)
+    left, right = check_rb(node.left, node), check_rb(node.right, node)
+    assert left == right
+    assert node.size == 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+    return left + (0 if node.red else 1)
+
+def test_sorted_inserts_stay_balanced():
+    tree = RedBlackTree()
+    for v in range(1, 1024):
+        tree.insert(v)
+    assert not tree.root.red
+    assert tree.height() <= 20
+    check_rb(tree.root)
+
+def test_bst_api():
+    tree = RedBlackTree()
+    for v in [10, 5, 20, 2, 7, 15]:
+        tree.insert(v)
+    tree.insert(5)  # Duplicate ignored
+    assert tree.inorder() == [2, 5, 7, 10, 15, 20]
+    assert tree.count_nodes() == 6
+    assert tree.min().key == 2 and tree.max().key == 20
+    assert tree.lowest_common_ancestor(2, 20).key == tree.root.key
+    assert tree.path_to_node(tree.root.key) == [tree.root.key]
+
+def test_delete_keeps_node_identity():
+    tree = RedBlackTree()
+    for v in range(1, 16):
+        tree.insert(v)
+    node = tree.search(9)
+    tree.delete(8)
+    assert tree.search(9) is node
+    tree.delete(99)  # Missing key ignored
+    assert tree.inorder() == [v for v in range(1, 16) if v != 8]
+    check_rb(tree.root)
+
+def test_random_operations():
+    rng = random.Random(9)
+    tree, keys = RedBlackTree(), set()
+    for step in range(3000):
+        v = rng.randint(0, 300)
+        if rng.random() < 0.55:
+            tree.insert(v)
+            keys.add(v)
+        else:
+            tree.delete(v)
+            keys.discard(v)
+        if step % 250 == 0:
+            check_rb(tree.root)
+    assert tree.inorder() == sorted(keys)
+    check_rb(tree.root)
+    for v in sorted(keys):
+        tree.delete(v)
+    assert tree.is_empty()
+
+def test_order_statistics():
+    tree = RedBlackTree()
+    for v in range(0, 2000, 2):  # Sorted input, 1000 even keys
+        tree.insert(v)
+    assert tree.count_nodes() == 1000
+    assert tree.select(10).key == 20
+    assert tree.rank(21) == 11
+    assert tree.count_range(100, 199) == 50
+    assert tree.median() == (998 + 1000) / 2
+    for v in range(0, 1000, 2):
+        tree.delete(v)
+    assert tree.count_nodes() == 500
+    assert tree.select(0).key == 1000
+
+def test_from_sorted_and_iterators():
+    for n in (1, 2, 7, 8, 100):
+        tree = RedBlackTree.from_sorted(range(n))
+        check_rb(tree.root)
+        assert list(tree) == list(range(n))
+    tree.insert(1000)
+    tree.delete(50)
+    check_rb(tree.root)
+    assert list(tree.iter_range(48, 52)) == [48, 49, 51, 52]
+    assert next(reversed(tree)) == 1000
+
+def test_binary_round_trip():
+    tree = RedBlackTree()
+    for v in [5, 3, 8, 1, 4, 7, 9, 2, 6]:
+        tree.insert(v)
+    restored = RedBlackTree.from_bytes(tree.to_bytes())
+    assert restored.level_order() == tree.level_order()
+    check_rb(restored.root)
+    restored.insert(10)
+    restored.delete(5)
+    check_rb(restored.root)
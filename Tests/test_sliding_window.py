@@ -0,0 +1,67 @@
+import unittest
+from math import gcd
+from Linear.sliding_window import (
+    MonotonicWindow,
+    SlidingWindowAggregator,
+    sliding_window_min,
+    sliding_window_max,
+    sliding_window_aggregate,
+)
+
+
+def brute_force(values, k, fn):
+    return [fn(values[i:i + k]) for i in range(len(values) - k + 1)]
+
+
+class TestSlidingWindow(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [4, 2, 12, 3, 8, 6, 1, 9, 9, 0, 5, 7]
+
+    def test_batch_min_max(self):
+        for k in range(1, len(self.values) + 1):
+            self.assertEqual(sliding_window_min(self.values, k), brute_force(self.values, k, min))
+            self.assertEqual(sliding_window_max(self.values, k), brute_force(self.values, k, max))
+
+    def test_batch_sum_and_gcd(self):
+        for k in (1, 3, 5):
+            self.assertEqual(sliding_window_aggregate(self.values, k, lambda a, b: a + b),
+                             brute_force(self.values, k, sum))
+        self.assertEqual(sliding_window_aggregate([12, 18, 9, 6, 4], 2, gcd), [6, 9, 3, 2])
+
+    def test_non_commutative_operator(self):
+        # String concatenation is associative but not commutative, so order must be preserved
+        letters = list("abcdefg")
+        self.assertEqual(sliding_window_aggregate(letters, 3, lambda a, b: a + b),
+                         ["abc", "bcd", "cde", "def", "efg"])
+
+    def test_streaming_push(self):
+        window = MonotonicWindow(3, "max")
+        self.assertEqual([window.push(v) for v in [1, 3, 2, 0, 0]], [1, 3, 3, 3, 2])
+        self.assertTrue(window.is_full())
+        self.assertEqual(len(window), 3)
+        self.assertEqual(window.query(), 2)
+
+        agg = SlidingWindowAggregator(2, lambda a, b: a + b)
+        self.assertFalse(agg.is_full())
+        self.assertEqual([agg.push(v) for v in [1, 2, 3, 4]], [1, 3, 5, 7])
+        self.assertEqual(len(agg), 2)
+
+    def test_window_larger_than_input(self):
+        self.assertEqual(sliding_window_min([3, 1], 5), [])
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            MonotonicWindow(0)
+        with self.assertRaises(ValueError):
+            MonotonicWindow(2, "median")
+        with self.assertRaises(ValueError):
+            SlidingWindowAggregator(0, max)
+        with self.assertRaises(IndexError):
+            MonotonicWindow(2).query()
+        with self.assertRaises(IndexError):
+            SlidingWindowAggregator(2, max).query()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,6 +45,56 @@ class TestStack(unittest.TestCase):
         self.stack.push("y")
         self.assertEqual(str(self.stack), "Bottom → ['x', 'y'] ← Top")
 
+    def test_peek_depth(self):
+        self.stack.push_many([1, 2, 3])
+        self.assertEqual(self.stack.peek(0), 3)
+        self.assertEqual(self.stack.peek(2), 1)
+        with self.assertRaises(IndexError):
+            self.stack.peek(3)
+
+    def test_push_many_and_pop_many(self):
+        self.stack.push_many(range(5))
+        self.assertEqual(len(self.stack), 5)
+        self.assertEqual(self.stack.pop_many(2), [4, 3])
+        self.assertEqual(self.stack.pop_many(0), [])
+        self.assertEqual(self.stack.pop(), 2)
+        with self.assertRaises(IndexError):
+            self.stack.pop_many(3)
+        self.assertEqual(len(self.stack), 2)
+
+    def test_preallocated_capacity(self):
+        stack = Stack(capacity=3)
+        self.assertTrue(stack.is_empty())
+        self.assertEqual(str(stack), "Bottom → [] ← Top")
+        stack.push_many("abcde")  # Crosses the preallocated region
+        self.assertEqual(str(stack), "Bottom → ['a', 'b', 'c', 'd', 'e'] ← Top")
+        self.assertEqual(stack.pop_many(4), ["e", "d", "c", "b"])
+        stack.push("z")
+        self.assertEqual(stack.pop_many(2), ["z", "a"])
+        with self.assertRaises(IndexError):
+            stack.pop()
+
+    def test_typed_backend(self):
+        stack = Stack("l", capacity=2)
+        stack.push_many([7, 8, 9])
+        self.assertEqual(stack.peek(), 9)
+        self.assertEqual(str(stack), "Bottom → [7, 8, 9] ← Top")
+        self.assertEqual(stack.pop_many(3), [9, 8, 7])
+        with self.assertRaises(TypeError):
+            stack.push("not an int")
+        with self.assertRaises(ValueError):
+            Stack("?")
+
+    def test_push_many_failure_keeps_size_in_step(self):
+        for capacity in (0, 1):
+            stack = Stack("l", capacity=capacity)
+            with self.assertRaises(TypeError):
+                stack.push_many([1, "x"])
+            self.assertEqual(len(stack), 1)
+            stack.push(5)
+            self.assertEqual(stack.peek(), 5)
+            self.assertEqual(stack.pop_many(2), [5, 1])
+
 
 if __name__ == "__main__":
     unittest.main()
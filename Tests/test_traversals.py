@@ -32,6 +32,48 @@ class TestIterativeTraversals(unittest.TestCase):
         expected = [4, 5, 2, 6, 7, 3, 1]
         self.assertEqual(TreeTraversals.iterative_postorder(self.bt.root), expected)
 
+    def test_generators(self):
+        root = self.bt.root
+        self.assertEqual(list(TreeTraversals.iter_inorder(root)), [4, 2, 5, 1, 6, 3, 7])
+        self.assertEqual(list(TreeTraversals.iter_preorder(root)), [1, 2, 4, 5, 3, 6, 7])
+        self.assertEqual(list(TreeTraversals.iter_postorder(root)), [4, 5, 2, 6, 7, 3, 1])
+        self.assertEqual(list(TreeTraversals.iter_inorder(None)), [])
+        self.assertEqual(list(TreeTraversals.iter_postorder(None)), [])
+
+    def test_morris(self):
+        root = self.bt.root
+        self.assertEqual(list(TreeTraversals.morris_inorder(root)), [4, 2, 5, 1, 6, 3, 7])
+        self.assertEqual(list(TreeTraversals.morris_preorder(root)), [1, 2, 4, 5, 3, 6, 7])
+        self.assertEqual(list(TreeTraversals.morris_inorder(None)), [])
+        # The tree is left unchanged
+        self.assertEqual(self.bt.preorder(), [1, 2, 4, 5, 3, 6, 7])
+        self.assertEqual(self.bt.inorder(), [4, 2, 5, 1, 6, 3, 7])
+
+    def test_morris_early_exit_restores_tree(self):
+        for traversal in (TreeTraversals.morris_inorder, TreeTraversals.morris_preorder):
+            for stop in range(1, 7):
+                it = traversal(self.bt.root)
+                for _ in range(stop):
+                    next(it)
+                it.close()
+                self.assertEqual(self.bt.preorder(), [1, 2, 4, 5, 3, 6, 7])
+                self.assertEqual(self.bt.inorder(), [4, 2, 5, 1, 6, 3, 7])
+
+    def test_degenerate_tree(self):
+        bt = BinaryTree()
+        bt.root = Node(0)
+        current = bt.root
+        for i in range(1, 20000):  # Left-leaning chain, far deeper than the recursion limit
+            current.left = Node(i)
+            current = current.left
+        expected = list(range(19999, -1, -1))
+        self.assertEqual(bt.inorder(), expected)
+        self.assertEqual(bt.postorder(), expected)
+        self.assertEqual(bt.preorder(), expected[::-1])
+        self.assertEqual(list(TreeTraversals.morris_inorder(bt.root)), expected)
+        self.assertEqual(list(TreeTraversals.iter_postorder(bt.root)), expected)
+        self.assertEqual(next(TreeTraversals.iter_preorder(bt.root)), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -92,5 +92,55 @@ class TestTrie(unittest.TestCase):
         self.assertTrue(self.trie.delete("aaaaa"))
         self.assertFalse(self.trie.search("aaaaa"))
 
+    def test_unicode_and_non_letter_characters(self):
+        words = ["naïve", "東京", "東大", "Zebra", "a-b", "C++"]
+        for word in words:
+            self.trie.insert(word)
+        for word in words:
+            self.assertTrue(self.trie.search(word))
+        self.assertFalse(self.trie.search("東"))
+        self.assertFalse(self.trie.search("zebra"))  # Case-sensitive, no index collisions
+        self.assertCountEqual(self.trie.words_with_prefix("東"), ["東京", "東大"])
+        self.assertEqual(self.trie.longest_prefix_match("C++17"), "C++")
+        self.assertTrue(self.trie.delete("東京"))
+        self.assertEqual(self.trie.words_with_prefix("東"), ["東大"])
+
+        restored = Trie()
+        restored.deserialize(self.trie.serialize())
+        self.assertEqual(restored.words_with_prefix(""), self.trie.words_with_prefix(""))
+
+    def test_words_in_lexicographic_order_and_pruning(self):
+        self.assertEqual(self.trie.words_with_prefix(""), sorted(self.words))
+        self.trie.delete("doom")
+        self.trie.delete("door")
+        node = self.trie.root.get("d").get("o")
+        self.assertEqual(node.chars, "g")  # The "o" branch was pruned
+
+    def test_cached_counts(self):
+        self.assertEqual(self.trie.total_words, 6)
+        self.trie.insert("cat")  # Duplicate: counters unchanged
+        self.assertEqual(self.trie.total_words, 6)
+        self.assertEqual(self.trie.count_words_with_prefix("car"), 2)
+        self.assertFalse(self.trie.delete("ca"))
+        self.assertTrue(self.trie.delete("car"))
+        self.assertEqual(self.trie.count_words_with_prefix("car"), 1)
+        self.assertEqual(self.trie.count_words_with_prefix("c"), 2)
+        self.assertEqual(self.trie.total_words, 5)
+
+        restored = Trie()
+        restored.deserialize(self.trie.serialize())
+        self.assertEqual(restored.total_words, 5)
+        self.assertEqual(restored.count_words_with_prefix("do"), 3)
+
+    def test_kth_word(self):
+        self.trie.insert("")
+        expected = sorted(self.words + [""])
+        for k, word in enumerate(expected):
+            self.assertEqual(self.trie.kth_word(k), word)
+        with self.assertRaises(IndexError):
+            self.trie.kth_word(len(expected))
+        with self.assertRaises(IndexError):
+            self.trie.kth_word(-1)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file